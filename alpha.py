@@ -1,15 +1,29 @@
 import streamlit as st
-from datetime import datetime, date
-from collections import defaultdict
-from typing import List, Dict, Any
-import math
+from datetime import date
+from typing import List, Dict, Any, Optional, Tuple
 import html
 import pandas as pd
 import altair as alt
 
+from amount_parser import format_short_kr
+from date_normalizer import days_until as _days_until
+from topk_store import TopKStore, fingerprint
+from alpha_matching import compute
+from roadmap_engine import RoadmapView, build_events
+from rerun_profiler import start_rerun_profile
+from pagination import shown_count, load_more
+
 # ================== 페이지/테마 & 글로벌 스타일 ==================
 st.set_page_config(page_title="Alpha Advisors – 맞춤 공고 추천", layout="wide")
 
+# 재실행 프로파일링 (?profile=1 또는 STREAMLIT_PROFILE=1일 때만 동작)
+profiler = start_rerun_profile("alpha")
+compute = profiler.timed("compute")(compute)
+profiler.mark("setup")
+
+# 부분 재실행 영역: 안쪽 위젯을 조작하면 해당 함수만 다시 실행 (st.fragment가 없는 버전은 전체 재실행)
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
 st.markdown("""
 <style>
 :root{
@@ -115,20 +129,7 @@ def KRW(n: int) -> str:
     return format(n, ",")
 
 def days_until(d: str) -> int:
-    try:
-        return math.ceil((datetime.strptime(d, "%Y-%m-%d").date() - date.today()).days)
-    except:
-        return 0
-
-def inter(a: List[str], b: List[str]) -> int:
-    sa = {str(x).strip() for x in (a or [])}
-    sb = {str(x).strip() for x in (b or [])}
-    return len(sa & sb)
-
-def label_from_score(score: int) -> str:
-    if score >= 70: return "가능"
-    if score >= 50: return "주의"
-    return "불가"
+    return _days_until(d) or 0
 
 def label_chip(label_text: str) -> str:
     cls = "ok" if label_text=="가능" else ("warn" if label_text=="주의" else "bad")
@@ -137,76 +138,6 @@ def label_chip(label_text: str) -> str:
 def status_badge(status: str) -> str:
     return f"<span class='badge {status}'>{'승인' if status=='approved' else ('반려' if status=='rejected' else '대기')}</span>"
 
-def norm(v: int, min_v: int, max_v: int) -> float:
-    c = max(min_v, min(max_v, v))
-    den = (max_v - min_v) or 1
-    return (c - min_v) / den
-
-def format_short_kr(n: int) -> str:
-    if n is None: return ""
-    if n >= 100_000_000:
-        e = n / 100_000_000
-        r = round(e * 10) / 10
-        s = str(int(r)) if float(r).is_integer() else f"{r:.1f}"
-        return s + "억원"
-    else:
-        c = n / 10_000_000
-        r = round(c * 10) / 10
-        s = str(int(r)) if float(r).is_integer() else f"{r:.1f}"
-        return s + "천만원"
-
-def parse_date(s: str):
-    try:
-        return datetime.strptime(s, "%Y-%m-%d").date()
-    except:
-        return None
-
-def month_key_from_date(dt: date) -> str:
-    return f"{dt.year}-{dt.month:02d}" if dt else ""
-
-def quarter_label(dt: date) -> str:
-    if not dt: return ""
-    q = (dt.month - 1)//3 + 1
-    return f"Q{q} {dt.year}"
-
-# ================== 매칭 ==================
-def compute(profile: Dict[str, Any], anns: List[Dict[str, Any]], w: Dict[str, int]):
-    results = []
-    for a in anns:
-        rationale = []
-        years_ok = (a.get("yearsMax") is None) or (profile["years"] <= a.get("yearsMax"))
-        rationale.append(f"업력 {profile['years']}년 ≤ {a.get('yearsMax','제한없음')}" if years_ok else f"업력 초과({profile['years']}>{a.get('yearsMax')})")
-
-        stage_ok = (a["stage"] == profile["stage"]) or (a["stage"] == "초기" and profile["stage"] == "예비")
-        rationale.append(f"단계 적합({profile['stage']}↔{a['stage']})" if stage_ok else f"단계 불일치({profile['stage']}↔{a['stage']})")
-
-        region_ok = (a["region"] == "전국") or (profile["region"] in a["region"])
-        rationale.append(f"지역 적합({profile['region']}⊆{a['region']})" if region_ok else f"지역 제한({a['region']})")
-
-        kw = inter(profile["keywords"], a.get("keywords", []))
-        rationale.append(f"키워드 교집합 {kw}" if kw > 0 else "키워드 교집합 없음")
-
-        budget_ok = (a.get("budgetBand") is None) or (a.get("budgetBand") == profile.get("preferredBudget"))
-        rationale.append(f"예산 선호({profile.get('preferredBudget')})" if budget_ok else f"예산 불일치({a.get('budgetBand')}≠{profile.get('preferredBudget')})")
-
-        use_overlap = inter(profile.get("preferredUses", []), a.get("allowedUses", []))
-        rationale.append(f"사용처 매칭 {use_overlap}" if use_overlap > 0 else "사용처 매칭 없음")
-
-        score = (
-            norm(kw, 0, max(3, len(profile["keywords"]))) * w["keywords"] +
-            (w["stage"] if stage_ok else 0) +
-            (w["region"] if region_ok else 0) +
-            (w["budget"] if budget_ok else 0) +
-            norm(use_overlap, 0, max(3, len(profile.get("preferredUses", [])))) * w["use"]
-        )
-        score = int(round(score))
-
-        hard_fail = (not years_ok) or ((not region_ok) and a["region"] != "전국") or (kw == 0 and use_overlap == 0)
-        lbl = "불가" if hard_fail else label_from_score(score)
-
-        results.append({"ann": a, "score": score, "label": lbl, "rationale": rationale})
-    return results
-
 # ================== 세션 상태 ==================
 if "clients" not in st.session_state:
     st.session_state.clients = default_clients()
@@ -220,7 +151,42 @@ if "roadmap_df" not in st.session_state:
 clients = st.session_state.clients
 active = st.session_state.active
 
+# ================== Top-K 물리화 ==================
+profiler.mark("topk")
+ANN_BY_ID = {a["id"]: a for a in ANNS}
+# 고객사별 추천 수 (제품 기준 Top-10) / 추천 목록은 이 안에서 '더 보기'로 5건씩 표시
+TOPK_SIZE = 10
+REVIEW_PAGE_SIZE = 5
+
+def alpha_scorer(profile: Dict[str, Any], w: Dict[str, int], ann_ids=None):
+    anns = ANNS if ann_ids is None else [ANN_BY_ID[i] for i in ann_ids if i in ANN_BY_ID]
+    return ((m["ann"]["id"], m["score"], m["label"], 0) for m in compute(profile, anns, w))
+
+if "topk" not in st.session_state:
+    st.session_state.topk = TopKStore(path=None, k=TOPK_SIZE)
+    st.session_state.topk.sync_announcements({a["id"]: fingerprint(a) for a in ANNS})
+topk = st.session_state.topk
+# 프로필이 바뀐 고객사만 다시 계산, 나머지는 저장된 Top-K 사용
+topk.materialize({cid: c["profile"] for cid, c in clients.items()}, W, alpha_scorer)
+
+@profiler.timed()
+def top_matches(cid: str, k: Optional[int] = None):
+    """
+    저장된 Top-K 공고를 사유와 함께 반환합니다 (k가 주어지면 앞의 k건만).
+    채점 결과는 (고객사, 가중치, 프로필) 단위로 세션에 보관해 같은 조합이면 다시 채점하지 않습니다.
+    """
+    profile = clients[cid]["profile"]
+    key = (cid, fingerprint(W), fingerprint(profile))
+    scored = st.session_state.setdefault("scored", {})
+    if key not in scored:
+        for old in [old for old in scored if old[0] == cid]:
+            del scored[old]
+        entries = topk.get(cid, profile, W, alpha_scorer)
+        scored[key] = compute(profile, [ANN_BY_ID[e["id"]] for e in entries], W)
+    return scored[key] if k is None else scored[key][:k]
+
 # ================== 사이드바 ==================
+profiler.mark("sidebar")
 with st.sidebar:
     st.markdown("### Alpha Advisors")
     st.session_state.search = st.text_input("고객사 검색", st.session_state.search, placeholder="회사명으로 검색")
@@ -230,7 +196,7 @@ with st.sidebar:
         return sorted(filtered, key=lambda cid: ((0 if clients[cid].get("pinned") else 1), clients[cid]["profile"]["name"]))
 
     for cid in client_sorted_ids():
-        mlist = sorted(compute(clients[cid]["profile"], ANNS, W), key=lambda x: x["score"], reverse=True)
+        mlist = top_matches(cid, k=1)
         top1 = mlist[0] if mlist else None
         due = f"D-{max(0, days_until(top1['ann']['dueDate']))}" if (top1 and top1["ann"].get("dueDate")) else ""
         lbl = top1["label"] if top1 else "-"
@@ -257,20 +223,22 @@ with st.sidebar:
                 st.session_state.clients = clients
 
 # ================== 메인 ==================
+profiler.mark("header")
 C = clients[active]
-matches = compute(C["profile"], ANNS, W)
-top = sorted(matches, key=lambda x: x["score"], reverse=True)[:10]
+top = top_matches(active)
 
 header_col1, header_col2 = st.columns([7,3])
 with header_col1:
-    st.markdown(f"## {C['profile']['name']} – 맞춤 공고 추천 (Top-10)")
+    st.markdown(f"## {C['profile']['name']} – 맞춤 공고 추천 (Top-{TOPK_SIZE})")
 with header_col2:
     p = C["profile"]
     st.caption(f"{p['businessType']} • {p['stage']} • 업력 {p['years']}년 • {p['region']} • 키워드 {len(p['keywords'])}")
 
 # ================== 추천 리스트 ==================
-st.markdown("### 추천 목록")
-for item in top:
+profiler.mark("recommendations")
+
+def render_review_item(item):
+    """추천 1건 (내용 + 승인/반려/코멘트)"""
     ann = item["ann"]
     score = item["score"]
     rlabel = item["label"]
@@ -320,219 +288,158 @@ for item in top:
 
         st.markdown(status_badge(current_status), unsafe_allow_html=True)
 
+@fragment
+def review_panel():
+    """승인/반려/코멘트를 바꾸면 추천 목록과 검수 코멘트 표만 다시 그립니다 (채점 결과는 세션 캐시)."""
+    # 고객사가 바뀌면 첫 페이지부터, 위젯/HTML은 보이는 건만 생성
+    candidates = top_matches(active)
+    shown = shown_count("review", len(candidates), REVIEW_PAGE_SIZE, reset_token=active)
+    top = candidates[:shown]
+    st.markdown("### 추천 목록")
+    for item in top:
+        render_review_item(item)
+    load_more("review", shown, len(candidates), REVIEW_PAGE_SIZE)
+
+    st.divider()
+    st.markdown("### 검수 코멘트")
+
+    rows_html = ["<table class='c-table'>"]
+    for item in top:
+        ann = item["ann"]
+        rev  = C.get("reviews", {}).get(ann["id"], {})
+        status = rev.get("status", "pending")
+        comment = html.escape(rev.get("comment", "—")) if rev.get("comment") else "—"
+        rows_html.append(
+            f"<tr>"
+            f"<td class='c-col-title'>{html.escape(ann['title'])}</td>"
+            f"<td class='c-col-status'>{status_badge(status)}</td>"
+            f"<td class='c-col-comment'>{comment}</td>"
+            f"</tr>"
+        )
+    rows_html.append("</table>")
+    st.markdown("".join(rows_html), unsafe_allow_html=True)
+
+review_panel()
+
 st.divider()
 
 # ================== 로드맵 자동생성 ==================
+profiler.mark("roadmap")
 st.markdown("### 12개월 로드맵(마감/설명회)")
 
-def build_roadmap_df(approved_anns: List[Dict[str, Any]]) -> pd.DataFrame:
-    rows = []
-    for a in approved_anns:
-        if a.get("infoSessionDate"):
-            d = parse_date(a["infoSessionDate"])
-            rows.append({
-                "date": pd.to_datetime(d) if d else None,
-                "type": "설명회",
-                "title": a["title"],
-                "agency": a.get("agency",""),
-                "amountKRW": a.get("amountKRW"),
-                "month": month_key_from_date(d) if d else "",
-                "id": a["id"],
-                "url": a.get("url","")
-            })
-        if a.get("dueDate"):
-            d = parse_date(a["dueDate"])
-            rows.append({
-                "date": pd.to_datetime(d) if d else None,
-                "type": "마감",
-                "title": a["title"],
-                "agency": a.get("agency",""),
-                "amountKRW": a.get("amountKRW"),
-                "month": month_key_from_date(d) if d else "",
-                "id": a["id"],
-                "url": a.get("url","")
-            })
-    df = pd.DataFrame(rows)
-    if not df.empty:
-        df = df.sort_values("date")
-    return df
-
+@profiler.timed()
+def roadmap_view(cid: str, ann_ids: Tuple[str, ...]) -> RoadmapView:
+    """
+    (고객사, 승인 공고 세트)별 로드맵. 같은 세트면 이벤트 표/월 묶음/HTML을 다시 만들지 않습니다.
+    """
+    views = st.session_state.setdefault("roadmap_views", {})
+    key = (cid, tuple(ann_ids))
+    if key not in views:
+        for old in [old for old in views if old[0] == cid]:
+            del views[old]
+        views[key] = RoadmapView(build_events([ANN_BY_ID[i] for i in ann_ids if i in ANN_BY_ID]))
+    return views[key]
+
+@profiler.timed()
 def generate_roadmap_from_approved():
-    approved_anns = [x["ann"] for x in top if C.get("reviews", {}).get(x["ann"]["id"], {}).get("status") == "approved"]
+    approved_ids = tuple(x["ann"]["id"] for x in top if C.get("reviews", {}).get(x["ann"]["id"], {}).get("status") == "approved")
+    rv = roadmap_view(active, approved_ids)
     # 월별 카드용 구조
-    month_map = defaultdict(list)
-    for a in approved_anns:
-        if a.get("dueDate"):
-            month_map[a["dueDate"][:7]].append({"id":a["id"]+"-due", "title":a["title"], "type":"마감", "date":a["dueDate"]})
-        if a.get("infoSessionDate"):
-            month_map[a["infoSessionDate"][:7]].append({"id":a["id"]+"-info", "title":a["title"], "type":"설명회", "date":a["infoSessionDate"]})
-    C["roadmap"] = dict(month_map)
+    C["roadmap"] = rv.month_items()
+    C["roadmap_ids"] = approved_ids
     st.session_state.clients = clients
 
     # 타임라인용 DF
-    st.session_state.roadmap_df = build_roadmap_df(approved_anns)
-
-btn_cols = st.columns([1.5, 8.5, 1.5])
-with btn_cols[0]:
-    if st.button("자동 생성"):
-        generate_roadmap_from_approved()
-with btn_cols[2]:
-    if not st.session_state.roadmap_df.empty:
-        csv = st.session_state.roadmap_df.to_csv(index=False).encode("utf-8-sig")
-        st.download_button("CSV 저장", csv, file_name=f"roadmap_{C['profile']['name']}.csv")
-
-roadmap = C.get("roadmap", {})
-
-# ===== 보기 방식 선택: 가로 타임라인(월별) / 점 플롯 =====
-view = st.radio("타임라인 보기", ["가로 타임라인(월별 정렬)", "점 플롯(보조)"], index=0, horizontal=True)
-
-# ===== 1) 가로 타임라인(월별 정렬) =====
-if view.startswith("가로") and not st.session_state.roadmap_df.empty:
-    df = st.session_state.roadmap_df.copy()
-
-    # 필터
-    with st.container():
-        st.markdown("<div class='h-wrap'>", unsafe_allow_html=True)
-        c1, c2, c3 = st.columns([2,2,6])
-        with c1:
-            types = st.multiselect("표시 구분", ["설명회","마감"], default=["설명회","마감"])
-        with c2:
-            show_d = st.checkbox("D-Day 표시", value=True)
-        with c3:
-            st.caption("← 좌우로 스크롤해 월별 공고를 한눈에 확인하세요.")
-
-        if types:
-            df = df[df["type"].isin(types)]
-
-        # 월 정렬
-        months = sorted(df["month"].dropna().unique(), key=lambda m: datetime.strptime(m, "%Y-%m"))
-        # 가로 스크롤 렌더링
-        html_blocks = ["<div class='h-scroll'>"]
-        today = date.today()
-
-        for m in months:
-            sub = df[df["month"] == m].sort_values("date")
-            count = len(sub)
-            month_title = f"{m} <span class='h-badge'>· {count}건</span>"
-            block = [f"<div class='h-month'><div class='h-title'>{month_title}</div>"]
-            for _, row in sub.iterrows():
-                d = row["date"].date() if pd.notna(row["date"]) else None
-                day = f"{d.day:02d}" if d else "--"
-                # 타입 칩 + D-Day
-                chip = "<span class='chip warn'>설명회</span>" if row["type"]=="설명회" else "<span class='chip bad'>마감</span>"
-                dday = ""
-                if show_d and d:
-                    dd = (d - today).days
-                    # D-표시는 미래 기준만 강조
-                    if dd >= 0:
-                        dday = f"<span class='h-due'>&nbsp;D-{dd}</span>"
-                # 링크 열기
-                href = html.escape(row.get("url") or "#")
-                block.append(
-                    f"<a class='h-item' href='{href}' target='_blank' rel='noopener'>"
-                    f"<span class='h-day'>{day}</span>"
-                    f"<span class='h-ttl'>{html.escape(str(row['title']))}</span>"
-                    f"<span class='h-type'>{chip}</span>"
-                    f"{dday}"
-                    f"</a>"
-                )
-            block.append("</div>")
-            html_blocks.append("".join(block))
-        html_blocks.append("</div>")
-        st.markdown("".join(html_blocks), unsafe_allow_html=True)
-        st.markdown("</div>", unsafe_allow_html=True)
-
-elif view.endswith("보조"):
-    # ===== 2) 점 플롯(보조) =====
-    if st.session_state.roadmap_df.empty and not roadmap:
-        st.info("승인 후 **자동 생성** 버튼을 눌러 로드맵을 만드세요.")
-    else:
-        st.markdown("#### 연간 타임라인(점 플롯)")
-        df = st.session_state.roadmap_df.copy()
-        if not df.empty:
-            today_df = pd.DataFrame({"today":[pd.to_datetime(date.today())]})
-            base = alt.Chart(df)
-
-            points = base.mark_circle(size=110).encode(
-                x=alt.X("date:T", axis=alt.Axis(format="%b %d", title=None, labelAngle=-15)),
-                y=alt.Y("type:N", sort=["설명회","마감"], title=None),
-                tooltip=[
-                    alt.Tooltip("type:N", title="구분"),
-                    alt.Tooltip("title:N", title="공고"),
-                    alt.Tooltip("agency:N", title="주관"),
-                    alt.Tooltip("date:T", title="일자", format="%Y-%m-%d"),
-                    alt.Tooltip("amountKRW:Q", title="금액", format=",.0f")
-                ],
-                color=alt.Color("type:N", legend=None)
-            )
-
-            today_rule = alt.Chart(today_df).mark_rule(strokeDash=[4,4]).encode(x="today:T")
-            chart = (points + today_rule).properties(height=160, width="container")
-            st.altair_chart(chart, use_container_width=True)
-            st.markdown("""
-            <div class='legend'>
-              <span class='dot dot-info'></span> 설명회
-              <span class='dot dot-due'></span> 마감
-            </div>
-            """, unsafe_allow_html=True)
+    st.session_state.roadmap_df = rv.events
+    st.session_state.roadmap_key = (active, approved_ids)
+
+@fragment
+def roadmap_panel():
+    """자동 생성 / 보기 방식 / 필터를 바꾸면 로드맵 영역만 다시 그립니다."""
+    btn_cols = st.columns([1.5, 8.5, 1.5])
+    with btn_cols[0]:
+        if st.button("자동 생성"):
+            generate_roadmap_from_approved()
+    with btn_cols[2]:
+        if not st.session_state.roadmap_df.empty:
+            csv = st.session_state.roadmap_df.to_csv(index=False).encode("utf-8-sig")
+            st.download_button("CSV 저장", csv, file_name=f"roadmap_{C['profile']['name']}.csv")
+
+    roadmap = C.get("roadmap", {})
+
+    # ===== 보기 방식 선택: 가로 타임라인(월별) / 점 플롯 =====
+    view = st.radio("타임라인 보기", ["가로 타임라인(월별 정렬)", "점 플롯(보조)"], index=0, horizontal=True)
+
+    # ===== 1) 가로 타임라인(월별 정렬) =====
+    if view.startswith("가로") and not st.session_state.roadmap_df.empty:
+        # 필터
+        with st.container():
+            st.markdown("<div class='h-wrap'>", unsafe_allow_html=True)
+            c1, c2, c3 = st.columns([2,2,6])
+            with c1:
+                types = st.multiselect("표시 구분", ["설명회","마감"], default=["설명회","마감"])
+            with c2:
+                show_d = st.checkbox("D-Day 표시", value=True)
+            with c3:
+                st.caption("← 좌우로 스크롤해 월별 공고를 한눈에 확인하세요.")
+
+            # 생성 당시 (고객사, 승인 세트)의 로드맵에서 필터별 HTML을 가져옴
+            rv = roadmap_view(*st.session_state.get("roadmap_key", (active, ())))
+            st.markdown(rv.timeline_html(types, show_d, date.today()), unsafe_allow_html=True)
+            st.markdown("</div>", unsafe_allow_html=True)
+
+    elif view.endswith("보조"):
+        # ===== 2) 점 플롯(보조) =====
+        if st.session_state.roadmap_df.empty and not roadmap:
+            st.info("승인 후 **자동 생성** 버튼을 눌러 로드맵을 만드세요.")
         else:
-            st.caption("표시할 타임라인 데이터가 없습니다. (승인 후 자동 생성 필요)")
-
-# ===== 분기/월 카드 레이아웃(기존 세로 보기) =====
-if roadmap:
-    def first_day_of_month_key(k:str):
-        try:
-            y,m = k.split("-")
-            return datetime(int(y), int(m), 1).date()
-        except:
-            return date.today()
-
-    months_sorted = sorted(roadmap.keys(), key=first_day_of_month_key)
-    quarter_groups: Dict[str, List[str]] = defaultdict(list)
-    for m in months_sorted:
-        dt = first_day_of_month_key(m)
-        q = (dt.month - 1)//3 + 1
-        quarter_groups[f"Q{q} {dt.year}"].append(m)
-
-    for q in sorted(quarter_groups.keys(), key=lambda s: (int(s.split(" ")[1]), int(s[1]))):
-        st.markdown(f"<div class='q-header'>{q}</div>", unsafe_allow_html=True)
-        st.markdown("<div class='month-grid'>", unsafe_allow_html=True)
-        for m in quarter_groups[q]:
-            items = sorted(roadmap[m], key=lambda x: x["date"])
-            month_html = [f"<div class='month-card'><div class='month-title'>{m}</div>"]
-            for it in items:
-                chip = "<span class='chip warn'>설명회</span>" if it['type']=="설명회" else "<span class='chip bad'>마감</span>"
-                month_html.append(
-                    f"<div class='item'>{chip}"
-                    f"<span class='title'>{html.escape(it['title'])}</span>"
-                    f"&nbsp;<span class='date'>{it['date']}</span></div>"
+            st.markdown("#### 연간 타임라인(점 플롯)")
+            df = st.session_state.roadmap_df.copy()
+            if not df.empty:
+                today_df = pd.DataFrame({"today":[pd.to_datetime(date.today())]})
+                base = alt.Chart(df)
+
+                points = base.mark_circle(size=110).encode(
+                    x=alt.X("date:T", axis=alt.Axis(format="%b %d", title=None, labelAngle=-15)),
+                    y=alt.Y("type:N", sort=["설명회","마감"], title=None),
+                    tooltip=[
+                        alt.Tooltip("type:N", title="구분"),
+                        alt.Tooltip("title:N", title="공고"),
+                        alt.Tooltip("agency:N", title="주관"),
+                        alt.Tooltip("date:T", title="일자", format="%Y-%m-%d"),
+                        alt.Tooltip("amountKRW:Q", title="금액", format=",.0f")
+                    ],
+                    color=alt.Color("type:N", legend=None)
                 )
-            month_html.append("</div>")
-            st.markdown("".join(month_html), unsafe_allow_html=True)
-        st.markdown("</div>", unsafe_allow_html=True)
 
-st.divider()
-
-# ================== 검수 코멘트 (테이블형) ==================
-st.markdown("### 검수 코멘트")
+                today_rule = alt.Chart(today_df).mark_rule(strokeDash=[4,4]).encode(x="today:T")
+                chart = (points + today_rule).properties(height=160, width="container")
+                st.altair_chart(chart, use_container_width=True)
+                st.markdown("""
+                <div class='legend'>
+                  <span class='dot dot-info'></span> 설명회
+                  <span class='dot dot-due'></span> 마감
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.caption("표시할 타임라인 데이터가 없습니다. (승인 후 자동 생성 필요)")
+
+    # ===== 분기/월 카드 레이아웃(기존 세로 보기) =====
+    if roadmap:
+        rv = roadmap_view(active, C.get("roadmap_ids", ()))
+        for q, months in rv.quarters().items():
+            st.markdown(f"<div class='q-header'>{q}</div>", unsafe_allow_html=True)
+            st.markdown("<div class='month-grid'>", unsafe_allow_html=True)
+            for m in months:
+                st.markdown(rv.card_html(m), unsafe_allow_html=True)
+            st.markdown("</div>", unsafe_allow_html=True)
+
+roadmap_panel()
 
-rows_html = ["<table class='c-table'>"]
-for item in top:
-    ann = item["ann"]
-    rev  = C.get("reviews", {}).get(ann["id"], {})
-    status = rev.get("status", "pending")
-    comment = html.escape(rev.get("comment", "—")) if rev.get("comment") else "—"
-    rows_html.append(
-        f"<tr>"
-        f"<td class='c-col-title'>{html.escape(ann['title'])}</td>"
-        f"<td class='c-col-status'>{status_badge(status)}</td>"
-        f"<td class='c-col-comment'>{comment}</td>"
-        f"</tr>"
-    )
-rows_html.append("</table>")
-st.markdown("".join(rows_html), unsafe_allow_html=True)
+st.divider()
 
 # ================== 자체 테스트 ==================
+profiler.mark("self_tests")
 def _self_tests():
     out = compute(default_clients()["A"]["profile"], ANNS, W)
     assert len(out) == len(ANNS), "Matches length"
@@ -545,3 +452,6 @@ try:
     _self_tests()
 except Exception as e:
     st.warning(f"Self-tests failed ⚠️ {e}")
+
+# 예외로 여기까지 오지 못한 재실행은 다음 재실행 시작 때 interrupted로 기록됨
+profiler.finish()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Alpha Advisors 규칙 기반 매칭
+alpha.py 화면과 벤치마크가 함께 쓰는 채점 함수 (streamlit 의존 없음)
+"""
+
+from typing import Any, Dict, List
+
+
+def inter(a: List[str], b: List[str]) -> int:
+    sa = {str(x).strip() for x in (a or [])}
+    sb = {str(x).strip() for x in (b or [])}
+    return len(sa & sb)
+
+def label_from_score(score: int) -> str:
+    if score >= 70: return "가능"
+    if score >= 50: return "주의"
+    return "불가"
+
+def norm(v: int, min_v: int, max_v: int) -> float:
+    c = max(min_v, min(max_v, v))
+    den = (max_v - min_v) or 1
+    return (c - min_v) / den
+
+def compute(profile: Dict[str, Any], anns: List[Dict[str, Any]], w: Dict[str, int]):
+    results = []
+    for a in anns:
+        rationale = []
+        years_ok = (a.get("yearsMax") is None) or (profile["years"] <= a.get("yearsMax"))
+        rationale.append(f"업력 {profile['years']}년 ≤ {a.get('yearsMax','제한없음')}" if years_ok else f"업력 초과({profile['years']}>{a.get('yearsMax')})")
+
+        stage_ok = (a["stage"] == profile["stage"]) or (a["stage"] == "초기" and profile["stage"] == "예비")
+        rationale.append(f"단계 적합({profile['stage']}↔{a['stage']})" if stage_ok else f"단계 불일치({profile['stage']}↔{a['stage']})")
+
+        region_ok = (a["region"] == "전국") or (profile["region"] in a["region"])
+        rationale.append(f"지역 적합({profile['region']}⊆{a['region']})" if region_ok else f"지역 제한({a['region']})")
+
+        kw = inter(profile["keywords"], a.get("keywords", []))
+        rationale.append(f"키워드 교집합 {kw}" if kw > 0 else "키워드 교집합 없음")
+
+        budget_ok = (a.get("budgetBand") is None) or (a.get("budgetBand") == profile.get("preferredBudget"))
+        rationale.append(f"예산 선호({profile.get('preferredBudget')})" if budget_ok else f"예산 불일치({a.get('budgetBand')}≠{profile.get('preferredBudget')})")
+
+        use_overlap = inter(profile.get("preferredUses", []), a.get("allowedUses", []))
+        rationale.append(f"사용처 매칭 {use_overlap}" if use_overlap > 0 else "사용처 매칭 없음")
+
+        score = (
+            norm(kw, 0, max(3, len(profile["keywords"]))) * w["keywords"] +
+            (w["stage"] if stage_ok else 0) +
+            (w["region"] if region_ok else 0) +
+            (w["budget"] if budget_ok else 0) +
+            norm(use_overlap, 0, max(3, len(profile.get("preferredUses", [])))) * w["use"]
+        )
+        score = int(round(score))
+
+        hard_fail = (not years_ok) or ((not region_ok) and a["region"] != "전국") or (kw == 0 and use_overlap == 0)
+        lbl = "불가" if hard_fail else label_from_score(score)
+
+        results.append({"ann": a, "score": score, "label": lbl, "rationale": rationale})
+    return results
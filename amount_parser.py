@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+지원금액 문자열 파서
+"최대 5억원", "3천만원", "1억 5천만원", "5천500만원", "3천만원 ~ 5억원", "50,000,000원" 같은 금액 표기를
+원 단위 정수(대표값)와 최소/최대 범위로 변환합니다.
+
+대표값 규칙: 문자열에 처음 나오는 금액. 단 '총 10억원'처럼 '총'이 붙은 사업 총액은 건너뜀
+('기업당 최대 1억원 (총 10억원)' → 1억원). 모든 금액이 총액이면 첫 총액을 사용.
+최소/최대는 총액을 포함해 문자열에 나온 모든 금액 기준.
+
+- parse_amount / parse_amount_range: 단일 문자열용 (LRU 메모이제이션)
+- parse_amounts: pandas Series 전체를 str.extractall 한 번으로 처리
+"""
+
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# (총액 표시) + 숫자(쉼표/소수점 허용) + 단위 + '원'
+# next: 공백만 두고 다음 숫자가 바로 이어지는지 ('1억 5천만원'의 '1억')
+AMOUNT_PATTERN = (r"(?P<total>총[^\d,()~]{0,8}?)?"
+                  r"(?P<num>\d[\d,]*(?:\.\d+)?)\s*(?P<unit>억|천만|백만|만|천|백)?\s*(?P<won>원)?"
+                  r"(?=(?P<next>\s*\d)?)")
+AMOUNT_RE = re.compile(AMOUNT_PATTERN)
+
+UNIT_MULTIPLIERS = {
+    "억": 100_000_000,
+    "천만": 10_000_000,
+    "백만": 1_000_000,
+    "만": 10_000,
+    "천": 1_000,
+    "백": 100,
+    "": 1,
+}
+# '5천500만'처럼 만 앞의 천/백은 만 단위의 일부 → 5천만 + 500만
+MAN = UNIT_MULTIPLIERS["만"]
+SUB_MAN = (UNIT_MULTIPLIERS["천"], UNIT_MULTIPLIERS["백"])
+
+# 단위 없는 숫자는 '원'이 붙었거나 5자리 이상일 때만 금액으로 인정 (연도/업력 등 제외)
+MIN_BARE_DIGITS = 5
+
+# 예산 구간 경계 (원)
+BUDGET_BANDS = [(100_000_000, "대형"), (40_000_000, "중간"), (0, "소액")]
+
+
+def _tokens(text: str):
+    """
+    금액 토큰 [값, 단위 배수, 총액 여부, 앞 토큰과 이어짐 여부] 목록을 반환합니다.
+
+    '이어짐'은 앞 토큰에 '원'이 없고 둘 사이에 공백만 있을 때입니다
+    ('1억 5천만원'은 이어지고 '1억원, 5천만원' / '1억 (5천만원)'은 별개 금액).
+    """
+    tokens = []
+    prev_open = False
+    for m in AMOUNT_RE.finditer(text):
+        digits = m.group("num").replace(",", "")
+        unit = m.group("unit") or ""
+        won = bool(m.group("won"))
+        kept = bool(unit) or won or len(digits.split(".")[0]) >= MIN_BARE_DIGITS
+        if kept:
+            mult = UNIT_MULTIPLIERS[unit]
+            tokens.append([float(digits) * mult, mult, bool(m.group("total")), prev_open])
+        prev_open = kept and not won and m.group("next") is not None
+
+    # 만 바로 앞의 천/백('5천' + '500만')은 천만/백만으로 올림
+    for i in range(len(tokens) - 1):
+        if tokens[i][1] in SUB_MAN and tokens[i + 1][3] and tokens[i + 1][1] == MAN:
+            tokens[i][0] *= MAN
+            tokens[i][1] *= MAN
+    return tokens
+
+
+def _combine(tokens):
+    """
+    '1억 5천만'처럼 큰 단위 뒤에 작은 단위가 이어지면 하나의 금액으로 합칩니다.
+
+    Returns:
+        [(금액, 총액 여부)] — 총액 여부는 금액의 첫 토큰 기준
+    """
+    amounts = []
+    prev_mult = None
+    for value, mult, total, follows in tokens:
+        if follows and mult < prev_mult and prev_mult > 1:
+            amounts[-1][0] += value
+        else:
+            amounts.append([value, total])
+        prev_mult = mult
+    return amounts
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(text: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    amounts = _combine(_tokens(text))
+    if not amounts:
+        return None, None, None
+    values = [value for value, _ in amounts]
+    representative = next((value for value, total in amounts if not total), values[0])
+    return int(representative), int(min(values)), int(max(values))
+
+
+def _parse(val) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    if val is None or (isinstance(val, float) and np.isnan(val)):
+        return None, None, None
+    if isinstance(val, (int, float, np.integer, np.floating)):
+        return (int(round(val)),) * 3
+    return _parse_cached(str(val))
+
+
+def parse_amount_range(val) -> Tuple[Optional[int], Optional[int]]:
+    """금액 문자열에서 (최소, 최대) 원 단위 금액을 반환합니다. 없으면 (None, None)."""
+    return _parse(val)[1:]
+
+
+def parse_amount(val) -> Optional[int]:
+    """
+    금액 문자열의 대표값(처음 나오는 기업당 금액, 총액 제외)을 원 단위 정수로 반환합니다.
+    '기업당 최대 1억원 (총 10억원)' → 100000000
+    """
+    return _parse(val)[0]
+
+
+def parse_amounts(series: pd.Series) -> pd.DataFrame:
+    """
+    Series 전체를 한 번에 파싱합니다.
+
+    Returns:
+        원래 인덱스를 유지하는 DataFrame (amount, amount_min, amount_max; Int64)
+        amount는 parse_amount와 같은 대표값 (처음 나오는 기업당 금액, 총액 제외)
+    """
+    n = len(series)
+    amount = np.full(n, np.nan)
+    amount_min = np.full(n, np.nan)
+    amount_max = np.full(n, np.nan)
+
+    # 이미 숫자인 값은 그대로 사용 (문자열 "2025" 등은 금액 문법으로 판단)
+    values = series.reset_index(drop=True)
+    if values.dtype == object:
+        is_text = values.map(lambda v: isinstance(v, str)).astype(bool)
+        numeric = pd.to_numeric(values.where(~is_text), errors="coerce")
+    elif pd.api.types.is_string_dtype(values.dtype):
+        # pandas StringDtype / pyarrow 문자열 컬럼
+        is_text = values.notna().astype(bool)
+        numeric = pd.Series(np.nan, index=values.index)
+    else:
+        is_text = pd.Series(False, index=values.index)
+        numeric = pd.to_numeric(values, errors="coerce")
+
+    has_number = numeric.notna().to_numpy()
+    amount[has_number] = numeric.to_numpy()[has_number]
+    amount_min[has_number] = numeric.to_numpy()[has_number]
+    amount_max[has_number] = numeric.to_numpy()[has_number]
+
+    text = values[is_text]
+    if not text.empty:
+        tokens = text.str.extractall(AMOUNT_PATTERN)
+        if not tokens.empty:
+            digits = tokens["num"].str.replace(",", "", regex=False)
+            unit = tokens["unit"].fillna("")
+            won = tokens["won"].notna()
+            bare_ok = won | (digits.str.split(".").str[0].str.len() >= MIN_BARE_DIGITS)
+            kept = (unit != "") | bare_ok
+            # 앞 토큰에 '원'이 없고 공백만 두고 이어지는 토큰 (예: '1억 5천만원'의 '5천만원')
+            is_open = kept & ~won & tokens["next"].notna()
+            raw_row = tokens.index.get_level_values(0)
+            follows = is_open.groupby(raw_row).shift(fill_value=False).astype(bool)
+
+            keep = kept.to_numpy()
+            digits, unit = digits[keep], unit[keep]
+            total = tokens["total"].notna()[keep]
+            follows = follows[keep]
+
+            if len(digits):
+                mult = unit.map(UNIT_MULTIPLIERS).astype("int64")
+                value = digits.astype(float) * mult
+                row = value.index.get_level_values(0)
+
+                # 만 바로 앞의 천/백은 천만/백만으로 올림 (예: 5천500만)
+                next_follows = follows.groupby(row).shift(-1, fill_value=False).astype(bool)
+                promote = mult.isin(SUB_MAN) & next_follows & (mult.groupby(row).shift(-1) == MAN)
+                value = value.where(~promote, value * MAN)
+                mult = mult.where(~promote, mult * MAN)
+
+                # 큰 단위 뒤에 작은 단위가 공백만 두고 이어지면 같은 금액 (예: 1억 5천만)
+                prev_mult = mult.groupby(row).shift()
+                continues = follows & (mult < prev_mult) & (prev_mult > 1)
+                amount_id = (~continues).astype(int).groupby(row).cumsum()
+
+                keys = [row, amount_id.to_numpy()]
+                combined = pd.DataFrame({"value": value.groupby(keys).sum(),
+                                         "total": total.groupby(keys).first()})
+                per_row = combined["value"].groupby(level=0).agg(["min", "max", "first"])
+                # 대표값: 총액이 아닌 첫 금액, 없으면 첫 금액
+                per_company = combined.loc[~combined["total"], "value"].groupby(level=0).first()
+                representative = per_company.reindex(per_row.index).fillna(per_row["first"])
+
+                positions = per_row.index.to_numpy()
+                amount[positions] = representative.to_numpy()
+                amount_min[positions] = per_row["min"].to_numpy()
+                amount_max[positions] = per_row["max"].to_numpy()
+
+    result = pd.DataFrame({
+        "amount": amount,
+        "amount_min": amount_min,
+        "amount_max": amount_max,
+    }, index=series.index).round().astype("Int64")
+    return result
+
+
+def budget_band(amount) -> str:
+    """금액을 예산 구간(대형/중간/소액)으로 분류합니다."""
+    if amount is None or pd.isna(amount):
+        return ""
+    for threshold, band in BUDGET_BANDS:
+        if float(amount) >= threshold:
+            return band
+    return ""
+
+
+def budget_bands(amounts: pd.Series) -> pd.Series:
+    """금액 Series를 예산 구간 Series로 한 번에 변환합니다."""
+    values = pd.to_numeric(amounts, errors="coerce").astype(float)
+    conditions = [values >= threshold for threshold, _ in BUDGET_BANDS]
+    bands = np.select(conditions, [band for _, band in BUDGET_BANDS], default="")
+    return pd.Series(bands, index=amounts.index)
+
+
+def format_short_kr(n: int) -> str:
+    """금액을 '1.2억원' / '8천만원' 형태로 짧게 표기합니다."""
+    if n is None: return ""
+    if n >= 100_000_000:
+        e = n / 100_000_000
+        r = round(e * 10) / 10
+        s = str(int(r)) if float(r).is_integer() else f"{r:.1f}"
+        return s + "억원"
+    else:
+        c = n / 10_000_000
+        r = round(c * 10) / 10
+        s = str(int(r)) if float(r).is_integer() else f"{r:.1f}"
+        return s + "천만원"
+
+
+# 자체 점검용 (문자열, 대표값, 최소, 최대)
+CHECK_CASES = [
+    ("최대 5억원", 500_000_000, 500_000_000, 500_000_000),
+    ("1억 5천만원", 150_000_000, 150_000_000, 150_000_000),
+    ("5천500만원", 55_000_000, 55_000_000, 55_000_000),
+    ("3백50만원", 3_500_000, 3_500_000, 3_500_000),
+    ("3천만원 ~ 5억원", 30_000_000, 30_000_000, 500_000_000),
+    ("50,000,000원", 50_000_000, 50_000_000, 50_000_000),
+    ("기업당 최대 1억원 (총 10억원)", 100_000_000, 100_000_000, 1_000_000_000),
+    ("창업기업 1억원, 예비창업자 5천만원", 100_000_000, 50_000_000, 100_000_000),
+    ("1억원 내외 (기업당 5천만원)", 100_000_000, 50_000_000, 100_000_000),
+    ("1억/5천만원", 100_000_000, 50_000_000, 100_000_000),
+    ("2025년 공고", None, None, None),
+]
+
+
+def _self_check():
+    """CHECK_CASES로 단일 파서와 Series 파서 결과를 점검합니다."""
+    texts = pd.Series([text for text, *_ in CHECK_CASES])
+    parsed = parse_amounts(texts)
+    for i, (text, *expected) in enumerate(CHECK_CASES):
+        expected = tuple(expected)
+        assert _parse(text) == expected, f"{text!r}: {_parse(text)} != {expected}"
+        row = tuple(None if pd.isna(v) else int(v) for v in parsed.iloc[i])
+        assert row == expected, f"{text!r} (Series): {row} != {expected}"
+    print(f"금액 파서 점검 통과: {len(CHECK_CASES)}건")
+
+
+if __name__ == "__main__":
+    _self_check()
@@ -5,6 +5,9 @@ import os
 from datetime import datetime
 import json
 
+from near_duplicates import dedup_frame
+from pagination import shown_count, load_more
+
 # 페이지 설정
 st.set_page_config(
     page_title="정부지원사업 맞춤 추천 플랫폼",
@@ -76,8 +79,10 @@ def load_latest_announcements():
         
         if all_data:
             combined_df = pd.concat(all_data, ignore_index=True)
-            print(f"전체 최신 공고 데이터 로드 완료: {len(combined_df)}행")
-            return combined_df
+            # 일간/30일 파일 간, K-Startup/BizInfo 간 유사 중복을 대표 행 하나로 병합
+            deduped_df = dedup_frame(combined_df)
+            print(f"전체 최신 공고 데이터 로드 완료: {len(combined_df)}행 (중복 병합 후 {len(deduped_df)}행)")
+            return deduped_df
         else:
             print("로드된 데이터가 없습니다.")
             return pd.DataFrame()
@@ -126,8 +131,44 @@ def get_company_recommendations(company_name, recommendation_df):
     filtered_df = recommendation_df[recommendation_df['기업명'] == company_name]
     return filtered_df
 
+@st.cache_data
+def latest_announcement_texts():
+    """최신 공고별 검색용 텍스트 (소문자). 공고 데이터가 바뀔 때만 다시 만듭니다."""
+    announcements_df = load_latest_announcements()
+    if announcements_df.empty:
+        return pd.Series(dtype=str)
+    return announcements_df.apply(
+        lambda row: ' '.join([str(row[col]) for col in row.index if pd.notna(row[col])]), axis=1
+    ).str.lower()
+
+def company_keywords(company_info):
+    """회사 정보에서 매칭 키워드 추출"""
+    keywords = []
+    for col in ['사업아이템 한 줄 소개', '업종', '전문분야']:
+        if col in company_info.columns:
+            value = company_info[col].iloc[0]
+            if pd.notna(value) and value != '':
+                keywords.extend(str(value).split())
+    return tuple(keywords)
+
+@st.cache_data
+def latest_topk_for_keywords(keywords, k=10):
+    """키워드 조합별 최신 공고 Top-K (공고 인덱스, 점수). 프로필이 바뀐 회사만 새로 계산됩니다."""
+    texts = latest_announcement_texts()
+    scores = pd.Series(0, index=texts.index)
+    for keyword in keywords:
+        scores += texts.str.contains(keyword.lower(), regex=False)
+    matched = scores[scores > 0].sort_values(ascending=False, kind='mergesort').head(k)
+    return list(zip(matched.index.tolist(), matched.tolist()))
+
+def materialize_latest_topk(alpha_companies):
+    """모든 회사의 최신 공고 Top-K를 한 번에 계산해 둡니다 (이후 회사 선택은 조회만)."""
+    for name in alpha_companies['사업아이템 한 줄 소개'].dropna().drop_duplicates():
+        company_info = alpha_companies[alpha_companies['사업아이템 한 줄 소개'] == name]
+        latest_topk_for_keywords(company_keywords(company_info))
+
 def get_latest_announcements_by_company(company_name, announcements_df):
-    """회사 정보 기반 최신 공고 필터링"""
+    """회사 정보 기반 최신 공고 필터링 (물리화된 Top-K 조회)"""
     if announcements_df.empty:
         return pd.DataFrame()
     
@@ -138,31 +179,10 @@ def get_latest_announcements_by_company(company_name, announcements_df):
     if company_info.empty:
         return announcements_df.head(10)  # 기본적으로 최신 10개
     
-    # 회사 정보에서 키워드 추출
-    keywords = []
-    for col in ['사업아이템 한 줄 소개', '업종', '전문분야']:
-        if col in company_info.columns:
-            value = company_info[col].iloc[0]
-            if pd.notna(value) and value != '':
-                keywords.extend(str(value).split())
-    
-    # 키워드 기반 필터링
-    filtered_announcements = []
-    for _, announcement in announcements_df.iterrows():
-        score = 0
-        announcement_text = ' '.join([str(announcement[col]) for col in announcement.index if pd.notna(announcement[col])])
-        
-        for keyword in keywords:
-            if keyword.lower() in announcement_text.lower():
-                score += 1
-        
-        if score > 0:
-            announcement['match_score'] = score
-            filtered_announcements.append(announcement)
-    
-    if filtered_announcements:
-        result_df = pd.DataFrame(filtered_announcements)
-        return result_df.sort_values('match_score', ascending=False).head(10)
+    top = latest_topk_for_keywords(company_keywords(company_info))
+    if top:
+        index, scores = zip(*top)
+        return announcements_df.loc[list(index)].assign(match_score=list(scores))
     else:
         return announcements_df.head(10)
 
@@ -261,6 +281,8 @@ def main():
     recommendation_data = load_recommendation_data()
     latest_announcements = load_latest_announcements()
     integrated_announcements = load_integrated_announcements()
+    if not alpha_companies.empty and not latest_announcements.empty:
+        materialize_latest_topk(alpha_companies)
     
     # 세션 상태 초기화
     if 'selected_company' not in st.session_state:
@@ -376,7 +398,9 @@ def main():
                 recommendations = get_company_recommendations(st.session_state.selected_company, recommendation_data)
                 
                 if not recommendations.empty:
-                    for _, rec in recommendations.iterrows():
+                    # 보이는 건만 잘라서 expander 생성, 나머지는 '더 보기'
+                    shown = shown_count("recommendations", len(recommendations), reset_token=st.session_state.selected_company)
+                    for _, rec in recommendations.iloc[:shown].iterrows():
                         with st.expander(f"📋 {rec.get('공고이름', 'N/A')}"):
                             st.write(f"**기업명:** {rec.get('기업명', 'N/A')}")
                             st.write(f"**공고이름:** {rec.get('공고이름', 'N/A')}")
@@ -387,6 +411,7 @@ def main():
                             st.write(f"**투자금액:** {rec.get('투자금액', 'N/A')}")
                             st.write(f"**투자금액사용처:** {rec.get('투자금액사용처', 'N/A')}")
                             st.write(f"**공고상태:** {rec.get('공고상태', 'N/A')}")
+                    load_more("recommendations", shown, len(recommendations))
                 else:
                     st.info("해당 회사에 대한 맞춤 추천이 없습니다.")
             
@@ -401,7 +426,8 @@ def main():
                     )
                     
                     if not custom_recommendations.empty:
-                        for _, rec in custom_recommendations.iterrows():
+                        shown = shown_count("custom_recommendations", len(custom_recommendations), reset_token=st.session_state.selected_company)
+                        for _, rec in custom_recommendations.iloc[:shown].iterrows():
                             with st.expander(f"📋 {rec.get('사업명', rec.get('pblancNm', rec.get('title', 'N/A')))}"):
                                 st.write(f"**출처:** {rec.get('source', 'N/A')}")
                                 st.write(f"**매칭 점수:** {rec.get('match_score', 'N/A')}")
@@ -422,6 +448,7 @@ def main():
                                     st.write(f"**공고내용:** {rec.get('공고내용', rec.get('description', rec.get('bsnsSumryCn', 'N/A')))}")
                                     st.write(f"**신청기간:** {rec.get('신청기간', rec.get('rceptPd', 'N/A'))}")
                                     st.write(f"**문의처:** {rec.get('문의처', rec.get('inquiry', 'N/A'))}")
+                        load_more("custom_recommendations", shown, len(custom_recommendations))
                     else:
                         st.info("해당 회사에 대한 맞춤 추천이 없습니다.")
                 else:
@@ -442,7 +469,8 @@ def main():
                     company_announcements = latest_announcements.head(10)
             
             if not company_announcements.empty:
-                for _, announcement in company_announcements.iterrows():
+                shown = shown_count("company_announcements", len(company_announcements), reset_token=st.session_state.selected_company)
+                for _, announcement in company_announcements.iloc[:shown].iterrows():
                     # 공고명 결정 (K-Startup vs BizInfo)
                     if announcement.get('source') == 'K-Startup':
                         title = announcement.get('사업공고명', 'N/A')
@@ -472,6 +500,7 @@ def main():
                         st.write(f"**접수시작일:** {start_date}")
                         st.write(f"**접수종료일:** {end_date}")
                         st.write(f"**문의처:** {contact}")
+                load_more("company_announcements", shown, len(company_announcements))
             else:
                 st.info("최신 공고가 없습니다.")
     
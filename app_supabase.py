@@ -1,10 +1,17 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
 from datetime import datetime, date
 from typing import Dict, List, Optional, Tuple
 import altair as alt
 
+from amount_parser import parse_amounts
+from date_normalizer import days_until, normalize_date_columns
+from deadline_index import drop_expired
+from rerun_profiler import start_rerun_profile
+from seen_store import SeenSet, announcement_keys
+
 # Supabase 설정 (안전한 import)
 try:
     from supabase import create_client, Client
@@ -32,6 +39,9 @@ def init_supabase():
 
 supabase = init_supabase()
 
+# 추천 테이블의 날짜 컬럼 (로드 시 datetime으로 변환)
+DATE_COLUMNS = ['모집일', '마감일']
+
 @st.cache_data(ttl=60)
 def load_companies() -> pd.DataFrame:
     """회사 데이터 로드 (alpha_companies 테이블 사용)"""
@@ -125,29 +135,60 @@ def load_recommendations2(company_id: int = None) -> pd.DataFrame:
                 # 회사명으로 recommendations2에서 검색 (정확한 매칭)
                 query = supabase.table('recommendations2').select('*').eq('기업명', company_name)
         result = query.execute()
-        return pd.DataFrame(result.data)
+        # 날짜 컬럼은 캐시되는 로드 시점에 한 번만 datetime으로 변환
+        return normalize_date_columns(pd.DataFrame(result.data), DATE_COLUMNS)
     except Exception as e:
         st.error(f"추천 데이터 로드 실패 (recommendations2): {e}")
         return pd.DataFrame()
 
 @st.cache_data(ttl=60)
-def load_recommendations3_active(company_id: int = None) -> pd.DataFrame:
-    """활성 추천 데이터 로드 (recommendations3_active 테이블)"""
-    try:
-        query = supabase.table('recommendations3_active').select('*')
-        if company_id:
-            # alpha_companies 테이블의 ID와 recommendations3_active의 기업번호 매칭
-            # 먼저 회사명으로 매칭 시도
-            company_result = supabase.table('alpha_companies').select('"사업아이템 한 줄 소개"').eq('"No."', company_id).execute()
-            if company_result.data:
-                company_name = company_result.data[0]['사업아이템 한 줄 소개']
-                # 회사명으로 recommendations3_active에서 검색 (정확한 매칭)
-                query = supabase.table('recommendations3_active').select('*').eq('기업명', company_name)
-        result = query.execute()
-        return pd.DataFrame(result.data)
-    except Exception as e:
-        st.error(f"활성 추천 데이터 로드 실패 (recommendations3_active): {e}")
-        return pd.DataFrame()
+def load_active_recommendations(company_id: int = None, today: date = None) -> pd.DataFrame:
+    """진행 중인 추천만 로드 (recommendations2를 마감일 인덱스로 필터링, 날짜가 바뀌면 다시 계산)"""
+    return drop_expired(load_recommendations2(company_id), '마감일', today)
+
+ROADMAP_DISPLAY_COLUMNS = ['추천순위', '추천점수', '공고이름', '추천이유', '모집일', '마감일', '투자금액', '공고상태']
+
+@st.cache_data(ttl=60)
+def load_monthly_roadmap(company_id: int = None) -> Tuple[pd.DataFrame, pd.DataFrame, List[int]]:
+    """
+    12개월 로드맵 집계 (회사별 캐시, groupby 한 번)
+
+    Returns:
+        (월별 요약 12행 Month/Count/TotalAmount,
+         공고월 순으로 정렬한 표시용 추천 표,
+         월별 시작 위치 13개 — m월은 표.iloc[bounds[m-1]:bounds[m]])
+    """
+    df = load_recommendations2(company_id)
+    if df.empty:
+        return pd.DataFrame(), df, []
+
+    # recommendations2에서는 투자금액이 텍스트이므로 한 번에 파싱 ("최대 1억원" → 100000000, "(총 10억원)" 같은 사업 총액은 제외)
+    if '투자금액' in df.columns:
+        amounts = parse_amounts(df['투자금액'])['amount'].fillna(0)
+    else:
+        amounts = pd.Series(0, index=df.index)
+    months = pd.to_numeric(df.get('공고월', pd.Series(index=df.index, dtype=float)), errors='coerce')
+    in_year = months.between(1, 12)
+
+    summary = (pd.DataFrame({'month': months[in_year], 'amount': amounts[in_year]})
+               .groupby('month')['amount'].agg(Count='size', TotalAmount='sum')
+               .reindex(range(1, 13), fill_value=0))
+    summary = pd.DataFrame({
+        'Month': [f"{m}월" for m in summary.index],
+        'Count': summary['Count'].astype(int).to_numpy(),
+        'TotalAmount': summary['TotalAmount'].astype('int64').to_numpy(),
+    })
+
+    # 월 순으로 한 번 정렬해 두고 월별 표는 위치 구간으로 잘라 씀 (월 안에서는 원래 순서 유지)
+    sorted_months = months[in_year].sort_values(kind='stable')
+    bounds = [int(b) for b in sorted_months.searchsorted(range(1, 14))]
+    columns = [col for col in ROADMAP_DISPLAY_COLUMNS if col in df.columns]
+    display_df = df.loc[sorted_months.index, columns]
+    # 데이터 타입 정리 (문자열 변환도 한 번만)
+    for col in display_df.columns:
+        if display_df[col].dtype == 'object':
+            display_df[col] = display_df[col].astype(str)
+    return summary, display_df.reset_index(drop=True), bounds
 
 def save_company(company_data: Dict) -> bool:
     """회사 저장"""
@@ -167,53 +208,99 @@ def delete_company(company_id: int) -> bool:
         st.error(f"회사 삭제 실패: {e}")
         return False
 
-def load_notifications(company_id: int) -> List[str]:
-    """알림 상태 로드"""
+# 확인한 공고는 notification_seen 테이블에 새 키만 추가합니다 (목록 전체를 다시 쓰지 않음)
+# 테이블 생성 SQL은 AUTO_SYSTEM_README.md의 "notification_seen 테이블" 참고.
+# 테이블이 아직 없으면 이전 방식대로 notification_states.last_seen_announcement_ids(공고이름 목록)에 저장합니다.
+NOTIFICATION_SEEN_TABLE = 'notification_seen'
+LEGACY_NOTIFICATION_TABLE = 'notification_states'
+SEEN_PAGE_SIZE = 1000  # PostgREST 기본 최대 행 수
+# 테이블 없음 오류 (PostgreSQL undefined_table / PostgREST 스키마 캐시에 없음)
+MISSING_TABLE_CODES = ('42P01', 'PGRST205')
+
+@st.cache_resource(ttl=600)
+def _seen_table_available() -> bool:
+    """notification_seen 테이블이 있는지 확인합니다 (테이블 없음 외의 오류는 캐시하지 않고 전파)."""
     try:
-        # alpha_companies의 No.와 notification_states의 company_id 매칭
-        result = supabase.table('notification_states').select('last_seen_announcement_ids').eq('company_id', company_id).execute()
-        if result.data:
-            return result.data[0]['last_seen_announcement_ids'] or []
-        return []
+        supabase.table(NOTIFICATION_SEEN_TABLE).select('company_id').limit(1).execute()
+        return True
+    except Exception as e:
+        if any(code in str(e) for code in MISSING_TABLE_CODES):
+            return False
+        raise
+
+def _legacy_seen_names(company_id: int) -> List[str]:
+    """notification_states에 저장된 확인 공고이름 목록"""
+    result = (supabase.table(LEGACY_NOTIFICATION_TABLE).select('last_seen_announcement_ids')
+              .eq('company_id', company_id).execute())
+    if result.data:
+        return result.data[0]['last_seen_announcement_ids'] or []
+    return []
+
+@st.cache_resource(ttl=600)
+def _seen_set(company_id: int) -> SeenSet:
+    """회사별 확인 집합 (프로세스에 1개, 확인 처리 시 제자리에서 갱신). 조회 실패는 캐시하지 않음."""
+    keys = []
+    start = 0
+    while _seen_table_available():
+        rows = (supabase.table(NOTIFICATION_SEEN_TABLE).select('announcement_key')
+                .eq('company_id', company_id).range(start, start + SEEN_PAGE_SIZE - 1).execute().data or [])
+        keys.extend(row['announcement_key'] for row in rows)
+        if len(rows) < SEEN_PAGE_SIZE:
+            break
+        start += SEEN_PAGE_SIZE
+    
+    keys.extend(announcement_keys(_legacy_seen_names(company_id)).tolist())
+    return SeenSet(keys)
+
+def load_notifications(company_id: int) -> SeenSet:
+    """알림 상태 로드 (확인한 공고 키 집합)"""
+    try:
+        return _seen_set(company_id)
     except Exception as e:
         st.error(f"알림 상태 로드 실패: {e}")
-        return []
+        return SeenSet()
+
+def _save_legacy_notifications(company_id: int, names: List[str]):
+    """notification_states의 공고이름 목록에 새 이름을 더해 저장 (notification_seen이 없을 때)"""
+    merged = list(dict.fromkeys(_legacy_seen_names(company_id) + names))
+    data = {
+        'company_id': company_id,
+        'last_seen_announcement_ids': merged,
+        'last_updated': datetime.now().isoformat()
+    }
+    existing = supabase.table(LEGACY_NOTIFICATION_TABLE).select('id').eq('company_id', company_id).execute()
+    if existing.data:
+        supabase.table(LEGACY_NOTIFICATION_TABLE).update(data).eq('company_id', company_id).execute()
+    else:
+        supabase.table(LEGACY_NOTIFICATION_TABLE).insert(data).execute()
 
-def save_notifications(company_id: int, announcement_ids: List[str]) -> bool:
-    """알림 상태 저장"""
+def save_notifications(company_id: int, names: pd.Series) -> bool:
+    """알림 상태 저장 (아직 기록되지 않은 공고만 추가)"""
+    seen = load_notifications(company_id)
+    keys = announcement_keys(names)
+    fresh = ~seen.seen_mask(keys)
+    delta = np.unique(keys[fresh])
+    if not len(delta):
+        return True
     try:
-        # 기존 레코드 확인
-        existing = supabase.table('notification_states').select('id').eq('company_id', company_id).execute()
-        
-        data = {
-            'company_id': company_id,
-            'last_seen_announcement_ids': announcement_ids,
-            'last_updated': datetime.now().isoformat()
-        }
-        
-        if existing.data:
-            # 업데이트
-            supabase.table('notification_states').update(data).eq('company_id', company_id).execute()
+        if _seen_table_available():
+            now = datetime.now().isoformat()
+            rows = [{'company_id': company_id, 'announcement_key': int(key), 'seen_at': now} for key in delta]
+            # 동시에 두 번 눌러도 중복 행은 무시
+            supabase.table(NOTIFICATION_SEEN_TABLE).upsert(
+                rows, on_conflict='company_id,announcement_key', ignore_duplicates=True
+            ).execute()
         else:
-            # 삽입
-            supabase.table('notification_states').insert(data).execute()
-        
+            _save_legacy_notifications(company_id, [str(name) for name in pd.Series(names)[fresh]])
+        seen.add(delta)
         return True
     except Exception as e:
         st.error(f"알림 상태 저장 실패: {e}")
         return False
 
 def calculate_dday(due_date: str) -> Optional[int]:
-    """D-Day 계산"""
-    if pd.isna(due_date) or due_date == '':
-        return None
-    
-    try:
-        due = datetime.strptime(due_date, '%Y-%m-%d').date()
-        today = date.today()
-        return (due - today).days
-    except:
-        return None
+    """D-Day 계산 (파싱 결과는 날짜 문자열별로 메모이제이션)"""
+    return days_until(due_date)
 
 def format_recommendation_reason(reason: str, score: float) -> str:
     """추천 사유 포맷팅"""
@@ -379,8 +466,8 @@ def render_recommendations_tab():
             st.info("해당 회사의 추천 결과가 없습니다.")
     
     with tab2:
-        # recommendations3_active 테이블 사용 (활성 공고만)
-        active_recommendations_df = load_recommendations3_active(company['id'])
+        # 마감일 인덱스로 진행 중인 추천만
+        active_recommendations_df = load_active_recommendations(company['id'], date.today())
         if not active_recommendations_df.empty:
             st.success(f"🟢 {len(active_recommendations_df)}개의 활성 공고가 있습니다!")
             
@@ -424,33 +511,23 @@ def render_alerts_tab():
     st.subheader(f"🔔 {company['name']} 신규 공고 알림")
     
     # 알림 상태 로드
-    last_seen_ids = load_notifications(company['id'])
+    seen = load_notifications(company['id'])
     
-    # 활성 추천 데이터 로드 (recommendations2 테이블 사용)
+    # 추천 데이터 로드 (recommendations2 테이블 사용)
     recommendations2_df = load_recommendations2(company['id'])
     
     if not recommendations2_df.empty:
-        # 활성 공고만 필터링 (마감일 기준)
-        today = date.today()
-        active_recommendations = recommendations2_df[
-            (recommendations2_df['마감일'] >= today.strftime('%Y-%m-%d')) |
-            (recommendations2_df['마감일'].isna())
-        ]
+        # 활성 공고만 (마감일 인덱스)
+        active_recommendations = load_active_recommendations(company['id'], date.today())
         
         if not active_recommendations.empty:
-            # 신규 공고 필터링 (공고이름 기준으로 비교)
-            # recommendations2에서는 공고 ID가 없으므로 공고이름으로 비교
-            last_seen_names = []
-            if last_seen_ids:
-                # 기존 알림 상태에서 공고 이름들을 가져와야 함
-                # 이 부분은 간단히 모든 공고를 신규로 표시하도록 수정
-                pass
-            
-            # 일단 모든 활성 공고를 신규로 표시 (실제 구현에서는 더 정교한 로직 필요)
-            new_announcements = active_recommendations
+            # 신규 공고 필터링 (recommendations2에는 공고 ID가 없으므로 공고이름 해시로 비교)
+            active_keys = announcement_keys(active_recommendations['공고이름'])
+            is_new = ~seen.seen_mask(active_keys)
+            new_announcements = active_recommendations[is_new]
             
             if not new_announcements.empty:
-                st.success(f"🆕 {len(new_announcements)}개의 활성 공고가 있습니다!")
+                st.success(f"🆕 {len(new_announcements)}개의 신규 공고가 있습니다! (활성 {len(active_recommendations)}개)")
                 
                 # recommendations2 테이블의 컬럼을 직접 사용
                 display_columns = ['추천순위', '추천점수', '공고이름', '추천이유', '모집일', '마감일', '투자금액', '공고상태']
@@ -478,10 +555,8 @@ def render_alerts_tab():
                 
                 # 모두 확인 처리 버튼
                 if st.button("모두 확인 처리", type="primary"):
-                    # 현재 활성 추천들의 공고이름을 스냅샷에 저장
-                    current_names = active_recommendations['공고이름'].tolist()
-                    
-                    if save_notifications(company['id'], current_names):
+                    # 새로 보인 공고만 추가
+                    if save_notifications(company['id'], new_announcements['공고이름']):
                         st.success("모든 공고를 확인 처리했습니다!")
                         st.rerun()
             else:
@@ -504,40 +579,10 @@ def render_roadmap_tab():
     recommendations2_df = load_recommendations2(company['id'])
     
     if not recommendations2_df.empty:
-        # 월별 데이터 준비
-        monthly_data = []
-        monthly_matches = {}  # DataFrame을 별도로 저장
-        
-        for month in range(1, 13):
-            month_matches = recommendations2_df[
-                recommendations2_df['공고월'] == month
-            ]
-            
-            # recommendations2에서는 투자금액이 텍스트이므로 숫자 추출 시도
-            total_amount = 0
-            if '투자금액' in month_matches.columns:
-                for amount_text in month_matches['투자금액']:
-                    if pd.notna(amount_text) and isinstance(amount_text, str):
-                        # "최대 1억원" 형태에서 숫자 추출
-                        import re
-                        numbers = re.findall(r'[\d,]+', amount_text.replace('억', '00000000').replace('천만', '0000000').replace('만', '0000'))
-                        if numbers:
-                            try:
-                                total_amount += int(numbers[0].replace(',', ''))
-                            except:
-                                pass
-            
-            monthly_data.append({
-                'Month': f"{month}월",
-                'Count': len(month_matches),
-                'TotalAmount': total_amount
-            })
-            
-            # DataFrame을 별도 딕셔너리에 저장
-            monthly_matches[month] = month_matches
+        # 월별 집계/표는 회사별로 캐시된 결과를 사용
+        chart_data, display_df, bounds = load_monthly_roadmap(company['id'])
         
         # 월별 금액 합계 차트
-        chart_data = pd.DataFrame(monthly_data)
         if not chart_data.empty:
             chart = alt.Chart(chart_data).mark_bar().encode(
                 x='Month:O',
@@ -551,24 +596,13 @@ def render_roadmap_tab():
             st.altair_chart(chart)
         
         # 월별 상세 정보
-        for month_data in monthly_data:
-            month_num = int(month_data['Month'].replace('월', ''))
-            month_matches_df = monthly_matches.get(month_num, pd.DataFrame())
+        for month_num, month_data in enumerate(chart_data.itertuples(index=False), start=1):
+            month_matches_df = display_df.iloc[bounds[month_num - 1]:bounds[month_num]]
             
-            with st.expander(f"{month_data['Month']} ({month_data['Count']}개 공고, {month_data['TotalAmount']:,}원)"):
+            with st.expander(f"{month_data.Month} ({month_data.Count}개 공고, {month_data.TotalAmount:,}원)"):
                 if not month_matches_df.empty:
-                    # recommendations2 테이블의 컬럼을 직접 사용
-                    display_columns = ['추천순위', '추천점수', '공고이름', '추천이유', '모집일', '마감일', '투자금액', '공고상태']
-                    available_columns = [col for col in display_columns if col in month_matches_df.columns]
-                    
-                    # 데이터 타입 정리
-                    display_df = month_matches_df[available_columns].copy()
-                    for col in display_df.columns:
-                        if display_df[col].dtype == 'object':
-                            display_df[col] = display_df[col].astype(str)
-                    
                     st.dataframe(
-                        display_df,
+                        month_matches_df,
                         width='stretch',
                         column_config={
                             "추천이유": st.column_config.TextColumn("추천 이유", width="large"),
@@ -607,37 +641,16 @@ def render_recommendations2_tab():
     tab1, tab2 = st.tabs(["전체 추천", "활성 공고만"])
     
     with tab1:
-        # 전체 추천 (recommendations2 + recommendations3_active, 중복 제거)
-        recommendations2_df = load_recommendations2(company['id'])
-        active_recommendations_df = load_recommendations3_active(company['id'])
+        # 전체 추천 (recommendations2), 진행 중인 공고는 소스를 '활성'으로 표시
+        combined_df = load_recommendations2(company['id'])
         
-        # 두 데이터프레임을 합치되 중복 제거
-        combined_df = pd.DataFrame()
-        
-        if not recommendations2_df.empty:
-            # recommendations2 데이터에 소스 표시
-            recommendations2_df = recommendations2_df.copy()
-            recommendations2_df['데이터소스'] = '전체'
-            combined_df = pd.concat([combined_df, recommendations2_df], ignore_index=True)
-        
-        if not active_recommendations_df.empty:
-            # recommendations3_active 데이터에 소스 표시
-            active_recommendations_df = active_recommendations_df.copy()
-            active_recommendations_df['데이터소스'] = '활성'
-            
-            # 중복 제거: 공고이름 기준으로 중복 확인
-            if not combined_df.empty:
-                # 기존 데이터에 없는 활성 공고만 추가
-                existing_announcements = set(combined_df['공고이름'].tolist())
-                new_active = active_recommendations_df[
-                    ~active_recommendations_df['공고이름'].isin(existing_announcements)
-                ]
-                combined_df = pd.concat([combined_df, new_active], ignore_index=True)
-            else:
-                combined_df = active_recommendations_df
+        if not combined_df.empty:
+            active_index = load_active_recommendations(company['id'], date.today()).index
+            is_active = pd.Series(combined_df.index.isin(active_index), index=combined_df.index)
+            combined_df = combined_df.assign(데이터소스=is_active.map({True: '활성', False: '전체'}))
         
         if not combined_df.empty:
-            st.info(f"📊 총 {len(combined_df)}개의 추천 공고 (전체 + 활성, 중복 제거)")
+            st.info(f"📊 총 {len(combined_df)}개의 추천 공고 (활성 {int((combined_df['데이터소스'] == '활성').sum())}개)")
             
             # 컬럼명을 한글로 매핑
             display_columns = ['추천순위', '추천점수', '공고이름', '추천이유', '모집일', '마감일', '투자금액', '공고상태', '데이터소스']
@@ -671,8 +684,8 @@ def render_recommendations2_tab():
             st.info("해당 회사의 추천 결과가 없습니다.")
     
     with tab2:
-        # 활성 공고만 (recommendations3_active 테이블 사용)
-        active_recommendations_df = load_recommendations3_active(company['id'])
+        # 활성 공고만 (마감일 인덱스)
+        active_recommendations_df = load_active_recommendations(company['id'], date.today())
         if not active_recommendations_df.empty:
             st.success(f"🟢 {len(active_recommendations_df)}개의 활성 공고가 있습니다!")
             
@@ -889,4 +902,9 @@ def main():
         st.info("👈 사이드바에서 회사를 선택해주세요.")
 
 if __name__ == "__main__":
-    main()
+    # 재실행 프로파일링 (?profile=1 또는 STREAMLIT_PROFILE=1일 때만 동작): render_* / load_* 함수별 시간
+    profiler = start_rerun_profile("app_supabase")
+    profiler.instrument(globals())
+    # st.rerun() / st.stop()으로 중간에 끝나도 기록되도록 본문을 감쌈
+    with profiler:
+        main()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+단일 프로세스 비동기 스케줄러
+수집 / 추천 / 내보내기 작업을 cron 형식 트리거로 등록하고
+작업별 동시 실행 제한과 중복 실행 방지를 적용해 한 프로세스에서 실행합니다.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = Path('scheduler_state.json')
+
+
+class CronTrigger:
+    """
+    5필드 cron 표현식 트리거 (분 시 일 월 요일)
+
+    지원 문법: *, */n, a-b, a-b/n, a,b,c  (요일은 0=일요일 ~ 6=토요일, 7도 일요일)
+    """
+
+    FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 표현식은 5개 필드가 필요합니다: {expression}")
+
+        self.expression = expression
+        parsed = [self._parse_field(f, lo, hi) for f, (lo, hi) in zip(fields, self.FIELD_RANGES)]
+        self.minutes, self.hours, self.days, self.months, self.weekdays = parsed
+        if 7 in self.weekdays:
+            self.weekdays = (self.weekdays - {7}) | {0}
+
+        # cron 규칙: 일/요일이 모두 지정되면 둘 중 하나만 맞아도 실행
+        self.day_restricted = fields[2] != '*'
+        self.weekday_restricted = fields[4] != '*'
+
+    @staticmethod
+    def _parse_field(field: str, lo: int, hi: int) -> Set[int]:
+        values = set()
+        for part in field.split(','):
+            step = 1
+            if '/' in part:
+                part, step_text = part.split('/', 1)
+                step = int(step_text)
+            if part == '*':
+                start, end = lo, hi
+            elif '-' in part:
+                start, end = (int(v) for v in part.split('-', 1))
+            else:
+                start = int(part)
+                end = hi if step > 1 else start
+            if start < lo or end > hi or start > end:
+                raise ValueError(f"cron 필드 범위 오류: {field}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        day_ok = dt.day in self.days
+        weekday_ok = (dt.weekday() + 1) % 7 in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def matches(self, dt: datetime) -> bool:
+        return (dt.minute in self.minutes and dt.hour in self.hours
+                and dt.month in self.months and self._day_matches(dt))
+
+    def next_after(self, dt: datetime) -> datetime:
+        """dt 이후 첫 실행 시각을 반환합니다."""
+        candidate = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year = candidate.year + (candidate.month == 12)
+                month = candidate.month % 12 + 1
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+
+        raise ValueError(f"실행 시각을 찾을 수 없습니다: {self.expression}")
+
+
+class ScheduledJob:
+    """스케줄러에 등록된 작업"""
+
+    def __init__(self, name: str, func: Callable, trigger: CronTrigger, category: str = 'collection',
+                 max_instances: int = 1, run_on_start: bool = False):
+        self.name = name
+        self.func = func
+        self.trigger = trigger
+        self.category = category
+        self.max_instances = max_instances
+        self.run_on_start = run_on_start
+        self.running = 0
+        self.next_run: Optional[datetime] = None
+
+
+class AsyncScheduler:
+    """asyncio 기반 단일 프로세스 스케줄러"""
+
+    def __init__(self, state_file: Path = STATE_FILE, category_limits: Dict[str, int] = None):
+        self.state_file = Path(state_file)
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self.state = self._load_state()
+
+        # 작업 종류별 동시 실행 제한 (예: 추천 작업은 OpenAI 호출이 많으므로 1개)
+        self.category_limits = {'collection': 2, 'recommendation': 1, 'export': 1}
+        if category_limits:
+            self.category_limits.update(category_limits)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _load_state(self) -> Dict[str, Dict]:
+        if not self.state_file.exists():
+            return {}
+        try:
+            return json.loads(self.state_file.read_text(encoding='utf-8'))
+        except Exception as e:
+            logger.warning(f"스케줄러 상태 파일 읽기 실패: {e}")
+            return {}
+
+    def _save_state(self):
+        tmp_file = self.state_file.with_suffix('.tmp')
+        tmp_file.write_text(json.dumps(self.state, ensure_ascii=False, indent=2), encoding='utf-8')
+        tmp_file.replace(self.state_file)
+
+    def add_job(self, name: str, func: Callable, cron: str, category: str = 'collection',
+                max_instances: int = 1, run_on_start: bool = False) -> ScheduledJob:
+        """작업을 등록합니다. func는 일반 함수나 코루틴 함수 모두 가능합니다."""
+        job = ScheduledJob(name, func, CronTrigger(cron), category, max_instances, run_on_start)
+        self.jobs[name] = job
+        logger.info(f"작업 등록: {name} ({cron}, {category})")
+        return job
+
+    def _semaphore(self, category: str) -> asyncio.Semaphore:
+        if category not in self._semaphores:
+            self._semaphores[category] = asyncio.Semaphore(self.category_limits.get(category, 1))
+        return self._semaphores[category]
+
+    async def _run_job(self, job: ScheduledJob):
+        async with self._semaphore(job.category):
+            started = time.perf_counter()
+            started_at = datetime.now()
+            logger.info(f"▶ 작업 시작: {job.name}")
+            status = 'success'
+            error = None
+
+            try:
+                if asyncio.iscoroutinefunction(job.func):
+                    await job.func()
+                else:
+                    # 블로킹 작업은 스레드에서 실행해 다른 작업을 막지 않음
+                    await asyncio.to_thread(job.func)
+            except Exception as e:
+                status = 'failed'
+                error = str(e)
+                logger.error(f"✗ 작업 실패: {job.name}: {e}")
+            finally:
+                job.running -= 1
+
+            elapsed = time.perf_counter() - started
+            self.state[job.name] = {
+                'last_run': started_at.isoformat(timespec='seconds'),
+                'status': status,
+                'duration_sec': round(elapsed, 2),
+                'error': error,
+            }
+            self._save_state()
+            logger.info(f"■ 작업 종료: {job.name} ({status}, {elapsed:.1f}초)")
+
+    def trigger(self, job: ScheduledJob) -> bool:
+        """작업을 즉시 실행합니다. 중복 실행 한도에 걸리면 건너뜁니다."""
+        if job.running >= job.max_instances:
+            logger.warning(f"이전 실행이 끝나지 않아 건너뜁니다: {job.name}")
+            return False
+
+        job.running += 1
+        task = asyncio.create_task(self._run_job(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    def _missed_run(self, job: ScheduledJob, now: datetime) -> bool:
+        """마지막 실행 이후 놓친 실행 시각이 있는지 확인합니다."""
+        last_run = self.state.get(job.name, {}).get('last_run')
+        if not last_run:
+            return False
+        return job.trigger.next_after(datetime.fromisoformat(last_run)) <= now
+
+    async def run(self, stop_event: asyncio.Event = None):
+        """스케줄러 루프를 실행합니다."""
+        stop_event = stop_event or asyncio.Event()
+        now = datetime.now()
+
+        for job in self.jobs.values():
+            job.next_run = job.trigger.next_after(now)
+            if job.run_on_start or self._missed_run(job, now):
+                self.trigger(job)
+            logger.info(f"다음 실행: {job.name} → {job.next_run}")
+
+        if not self.jobs:
+            logger.warning("등록된 작업이 없습니다.")
+            return
+
+        while not stop_event.is_set():
+            # 다음 실행 시각까지 정확히 대기 (1분 폴링 없음)
+            wake_at = min(job.next_run for job in self.jobs.values())
+            delay = max(0.0, (wake_at - datetime.now()).total_seconds())
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+            now = datetime.now()
+            for job in self.jobs.values():
+                if job.next_run <= now:
+                    self.trigger(job)
+                    job.next_run = job.trigger.next_after(now)
+
+        if self._tasks:
+            logger.info("실행 중인 작업이 끝나기를 기다립니다...")
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def start(self):
+        """스케줄러를 시작합니다 (Ctrl+C로 종료)."""
+        try:
+            asyncio.run(self.run())
+        except KeyboardInterrupt:
+            logger.info("스케줄러를 종료합니다.")
+
+    def status(self) -> List[Dict]:
+        """등록된 작업과 마지막 실행 상태를 반환합니다."""
+        return [
+            {
+                'name': job.name,
+                'cron': job.trigger.expression,
+                'category': job.category,
+                'running': job.running,
+                'next_run': job.next_run.isoformat(timespec='minutes') if job.next_run else None,
+                **self.state.get(job.name, {}),
+            }
+            for job in self.jobs.values()
+        ]
+
+
+def run_integrated_daily_job():
+    """통합 자동화 시스템의 매일 작업 (수집 → 추천 → 내보내기)"""
+    from integrated_auto_system import IntegratedAutoSystem
+    IntegratedAutoSystem().daily_job()
+
+
+def build_default_scheduler() -> AsyncScheduler:
+    """기존 개별 스케줄 루프의 작업을 모두 등록한 스케줄러를 만듭니다."""
+    import daily_auto_collector as kstartup_jobs
+    import daily_auto_collector_biz as bizinfo_jobs
+
+    scheduler = AsyncScheduler()
+
+    # K-스타트업 / 기업마당 수집 (같은 API를 동시에 두드리지 않도록 출처·주기별로 시각을 어긋나게 배치)
+    scheduler.add_job('kstartup_daily', kstartup_jobs.daily_collection, '0 9 * * *')
+    scheduler.add_job('kstartup_weekly', kstartup_jobs.weekly_collection, '5 9 * * 1')
+    scheduler.add_job('kstartup_monthly', kstartup_jobs.monthly_collection, '10 9 1 * *')
+    scheduler.add_job('bizinfo_daily', bizinfo_jobs.daily_collection, '15 9 * * *')
+    scheduler.add_job('bizinfo_weekly', bizinfo_jobs.weekly_collection, '20 9 * * 1')
+    scheduler.add_job('bizinfo_monthly', bizinfo_jobs.monthly_collection, '25 9 1 * *')
+
+    # 신규 공고 수집 + 맞춤 추천 + 파일 내보내기 (개별 수집이 끝난 뒤 실행)
+    scheduler.add_job('integrated_daily', run_integrated_daily_job, '30 9 * * *', category='recommendation')
+
+    return scheduler
+
+
+def main():
+    """메인 실행 함수"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('auto_scheduler.log', encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+    )
+    print("=== 통합 스케줄러 ===")
+    scheduler = build_default_scheduler()
+    for job in scheduler.status():
+        print(f"- {job['name']}: {job['cron']} ({job['category']}), 마지막 실행: {job.get('last_run', '-')}")
+    print("종료하려면 Ctrl+C를 누르세요.")
+    scheduler.start()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
 import os
-from datetime import datetime, date
+from datetime import date
 from typing import Dict, List, Optional, Tuple
 import altair as alt
 from supabase import create_client, Client
@@ -14,6 +14,9 @@ import logging
 
 # 통합 자동화 시스템 import
 from integrated_auto_system import IntegratedAutoSystem
+from pipeline_metrics import load_run_history
+from dashboard_rollup import collect_dashboard_counts, fetch_recent, load_rollup
+from date_normalizer import days_until
 import sys
 sys.path.append('/Users/minkim/git_test/kpmg-2025/data2/supabase1')
 from config import SUPABASE_URL, SUPABASE_KEY
@@ -99,17 +102,34 @@ def load_recommendations(company_id: int = None) -> pd.DataFrame:
         st.error(f"추천 데이터 로드 실패: {e}")
         return pd.DataFrame()
 
-def calculate_dday(due_date: str) -> Optional[int]:
-    """D-Day 계산"""
-    if pd.isna(due_date) or due_date == '':
-        return None
-    
+@st.cache_data(ttl=60)
+def load_dashboard_counts() -> Tuple[Dict[str, int], Optional[str]]:
+    """대시보드 지표와 집계 시각 (로컬 롤업 우선, 없으면 count 전용 쿼리)"""
+    rollup = load_rollup()
+    if rollup:
+        return rollup['counts'], rollup.get('as_of')
+    try:
+        return collect_dashboard_counts(supabase), None
+    except Exception as e:
+        st.error(f"대시보드 집계 실패: {e}")
+        return {}, None
+
+@st.cache_data(ttl=60)
+def load_recent_announcements(limit: int = 10) -> pd.DataFrame:
+    """최근 수집된 공고 (created_at 내림차순 limit 쿼리)"""
+    columns = ['title', 'agency', 'start_date', 'end_date', 'amount_text', 'source', 'created_at']
     try:
-        due = datetime.strptime(due_date, '%Y-%m-%d').date()
-        today = date.today()
-        return (due - today).days
-    except:
-        return None
+        df = pd.DataFrame(fetch_recent(supabase, 'announcements', columns, limit))
+        if not df.empty:
+            df['created_at'] = pd.to_datetime(df['created_at'], errors='coerce')
+        return df
+    except Exception as e:
+        st.error(f"최근 공고 로드 실패: {e}")
+        return pd.DataFrame()
+
+def calculate_dday(due_date: str) -> Optional[int]:
+    """D-Day 계산 (파싱 결과는 날짜 문자열별로 메모이제이션)"""
+    return days_until(due_date)
 
 def format_recommendation_reason(reason: str, score: float) -> str:
     """추천 사유 포맷팅"""
@@ -219,36 +239,30 @@ def render_dashboard_tab():
     """대시보드 탭 렌더링"""
     st.subheader("📊 시스템 대시보드")
     
-    # 통계 정보
+    # 통계 정보 (테이블 전체를 받지 않고 건수만 조회)
+    counts, as_of = load_dashboard_counts()
+    if as_of:
+        st.caption(f"집계 기준: {as_of.replace('T', ' ')}")
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        companies_df = load_companies()
-        st.metric("등록된 기업", len(companies_df))
+        st.metric("등록된 기업", counts.get('alpha_companies', 0))
     
     with col2:
-        announcements_df = load_announcements()
-        st.metric("수집된 공고", len(announcements_df))
+        st.metric("수집된 공고", counts.get('announcements', 0))
     
     with col3:
-        recommendations_df = load_recommendations()
-        st.metric("생성된 추천", len(recommendations_df))
+        st.metric("생성된 추천", counts.get('recommendations', 0))
     
     with col4:
-        # 최근 수집된 공고 수
-        recent_announcements = announcements_df[
-            pd.to_datetime(announcements_df['created_at']).dt.date == date.today()
-        ] if not announcements_df.empty else pd.DataFrame()
-        st.metric("오늘 수집", len(recent_announcements))
+        st.metric("오늘 수집", counts.get('announcements_today', 0))
     
     st.divider()
     
     # 최근 공고 목록
     st.subheader("📋 최근 수집된 공고")
-    if not announcements_df.empty:
-        # created_at 컬럼을 datetime으로 변환
-        announcements_df['created_at'] = pd.to_datetime(announcements_df['created_at'], errors='coerce')
-        recent_announcements = announcements_df.nlargest(10, 'created_at')
+    recent_announcements = load_recent_announcements(10)
+    if not recent_announcements.empty:
         display_columns = ['title', 'agency', 'start_date', 'end_date', 'amount_text', 'source', 'created_at']
         available_columns = [col for col in display_columns if col in recent_announcements.columns]
         
@@ -510,6 +524,50 @@ def render_automation_tab():
         thread.start()
         
         st.success("스케줄러가 시작되었습니다!")
+    
+    # 실행 이력 (pipeline_metrics.jsonl)
+    st.divider()
+    render_run_history()
+
+def render_run_history():
+    """자동화 실행 이력과 구간별 소요 시간 렌더링"""
+    st.subheader("📈 실행 이력")
+    
+    history = load_run_history()
+    if not history:
+        st.info("아직 기록된 실행 이력이 없습니다.")
+        return
+    
+    # 실행별 요약 (구간 누적 시간 + 카운터)
+    rows = []
+    for record in history:
+        row = {
+            '실행': record['run_id'],
+            '상태': record.get('status', ''),
+            '소요(초)': record['wall_sec'],
+        }
+        for name, stat in record.get('timers', {}).items():
+            if name.startswith('stage.'):
+                row[name[len('stage.'):]] = round(stat['total_sec'], 2)
+        row.update(record.get('counters', {}))
+        rows.append(row)
+    
+    st.dataframe(pd.DataFrame(rows), width='stretch', hide_index=True)
+    
+    # 최근 실행의 구간별 누적 시간
+    latest = history[0]
+    timers_df = pd.DataFrame([
+        {'구간': name, '누적(초)': stat['total_sec'], '호출': stat['calls']}
+        for name, stat in latest.get('timers', {}).items()
+    ])
+    if not timers_df.empty:
+        st.caption(f"최근 실행 {latest['run_id']} 구간별 소요 시간")
+        chart = alt.Chart(timers_df).mark_bar().encode(
+            x=alt.X('누적(초):Q'),
+            y=alt.Y('구간:N', sort='-x'),
+            tooltip=['구간', '누적(초)', '호출']
+        )
+        st.altair_chart(chart, use_container_width=True)
 
 def main():
     """메인 함수"""
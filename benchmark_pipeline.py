@@ -0,0 +1,625 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+오프라인 파이프라인 벤치마크
+수집 → 매칭 → 추천 파이프라인을 외부 네트워크 없이 측정합니다.
+
+- 로컬 스텁 HTTP 서버: K-스타트업(XML), 기업마당(JSON), OpenAI 호환 LLM(/v1/chat/completions)
+- Supabase 테이블 클라이언트 대역 (insert / count / 최근 행 조회, 메모리 보관)
+- 측정 항목
+  · fetch: 페이지/초, 파싱 항목/초
+  · persist: Supabase / 파일 저장 행/초
+  · scoring: 채점 구현별 (기업 × 공고) 쌍/초 — alpha_matching.compute, ab_streamlit matcher, rule_scorer
+  · daily_job: 규모별 전체 소요 시간 (처음 실행 / 같은 데이터로 다시 실행)
+- 결과는 benchmark_results.json에 실행마다 누적하고, 직전 실행보다 느려진 항목을 표시
+
+openai 패키지가 없으면 LLM 호출과 추천 저장 구간은 건너뛴 것으로 기록합니다.
+
+사용 예:
+    python benchmark_pipeline.py
+    python benchmark_pipeline.py --scales 200x20 1000x300 --pages 50 --fail-on-regression
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape, quoteattr
+
+import pandas as pd
+
+from alpha_matching import compute
+from amount_parser import budget_bands
+from pipeline_metrics import PipelineMetrics
+from synthetic_data import (FIELDS, REGIONS, STAGES, USES, generate_announcements, generate_companies,
+                            generate_programs)
+
+REPO_DIR = Path(__file__).resolve().parent
+sys.path.append(str(REPO_DIR / 'kpmg-2025' / 'ab_streamlit'))
+from compact_table import CompactAnnouncements  # noqa: E402
+from matcher import score_matches  # noqa: E402
+
+RESULTS_FILE = REPO_DIR / 'benchmark_results.json'
+DEFAULT_SCALES = ['100x10', '500x100', '1000x300']
+
+# alpha.py 기본 가중치와 같음
+ALPHA_WEIGHTS = {"keywords": 40, "stage": 15, "region": 10, "budget": 15, "use": 20}
+STAGE_YEARS_MAX = {'예비': 0, '초기': 3, '성장': 7}
+
+# 직전 실행 대비 이 비율 이상 나빠지면 회귀로 표시
+REGRESSION_TOLERANCE = 0.2
+
+
+# ------------------------------------------------------------------ 스텁 서버
+def kstartup_xml(items: List[Dict[str, str]]) -> bytes:
+    """K-스타트업 응답 형태 (<item><col name="...">...</col></item>)"""
+    rows = ''.join('<item>' + ''.join(f'<col name={quoteattr(k)}>{escape(str(v))}</col>' for k, v in item.items())
+                   + '</item>' for item in items)
+    return f'<?xml version="1.0" encoding="UTF-8"?><results><data>{rows}</data></results>'.encode('utf-8')
+
+
+def fake_completion(request: Dict[str, Any]) -> Dict[str, Any]:
+    """프롬프트의 공고 목록 앞쪽 5개를 추천하는 chat.completion 응답"""
+    prompt = request.get('messages', [{}])[-1].get('content', '')
+    titles = re.findall(r'^\d+\. (.+)$', prompt, flags=re.MULTILINE)[:5]
+    content = json.dumps([{'추천점수': 90 - i * 5, '공고이름': title, '추천이유': '벤치마크 응답',
+                           '공고상태': '현재 지원 가능'} for i, title in enumerate(titles)], ensure_ascii=False)
+    return {
+        'id': 'chatcmpl-benchmark',
+        'object': 'chat.completion',
+        'created': int(time.time()),
+        'model': request.get('model', 'benchmark'),
+        'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}, 'finish_reason': 'stop'}],
+        'usage': {'prompt_tokens': len(prompt) // 2, 'completion_tokens': len(content) // 2,
+                  'total_tokens': (len(prompt) + len(content)) // 2},
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive (실제 세션과 같게 연결 재사용)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, content_type: str, body: bytes):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')  # 응답 캐시를 거치지 않고 매번 실제 요청을 측정
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        if url.path == '/kstartup':
+            page, size = int(params.get('pageNo', 1)), int(params.get('numOfRows', 10))
+            body = self.server.render('kstartup', page, size, kstartup_xml)
+            self._send(200, 'application/xml; charset=utf-8', body)
+        elif url.path == '/bizinfo':
+            page, size = int(params.get('pageIndex', 1)), int(params.get('pageUnit', 10))
+            body = self.server.render('bizinfo', page, size, lambda items: json.dumps(
+                {'jsonArray': {'item': items}}, ensure_ascii=False).encode('utf-8'))
+            self._send(200, 'application/json; charset=utf-8', body)
+        else:
+            self._send(404, 'text/plain', b'not found')
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        request = json.loads(self.rfile.read(length) or b'{}')
+        if self.path.rstrip('/').endswith('/chat/completions'):
+            if self.server.llm_latency_sec:
+                time.sleep(self.server.llm_latency_sec)
+            self._send(200, 'application/json', json.dumps(fake_completion(request), ensure_ascii=False).encode('utf-8'))
+        else:
+            self._send(404, 'text/plain', b'not found')
+
+
+class StubServer(ThreadingHTTPServer):
+    """K-스타트업 / 기업마당 / LLM 스텁 (127.0.0.1 임의 포트)"""
+
+    daemon_threads = True
+
+    def __init__(self, llm_latency_sec: float = 0.0):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.llm_latency_sec = llm_latency_sec
+        self.items: Dict[str, List[Dict[str, Any]]] = {'kstartup': [], 'bizinfo': []}
+        self._bodies: Dict[tuple, bytes] = {}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, name='stub-http', daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def load(self, kstartup: List[Dict[str, Any]], bizinfo: List[Dict[str, Any]]):
+        """응답할 공고를 교체합니다."""
+        with self._lock:
+            self.items = {'kstartup': kstartup, 'bizinfo': bizinfo}
+            self._bodies.clear()
+
+    def render(self, source: str, page: int, size: int, encode) -> bytes:
+        """페이지 본문 (직렬화 비용이 측정에 섞이지 않도록 페이지별로 한 번만 만듦). 끝을 넘으면 처음부터 반복."""
+        key = (source, page, size)
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is None:
+                items = self.items[source]
+                start = ((page - 1) * size) % len(items) if items else 0
+                body = self._bodies[key] = encode(items[start:start + size])
+        return body
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+# ------------------------------------------------------------------ Supabase 대역
+class FakeResult:
+    def __init__(self, data: List[Dict[str, Any]], count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    """supabase-py 쿼리 빌더 중 파이프라인이 쓰는 부분만 흉내냅니다."""
+
+    def __init__(self, client: 'FakeSupabase', table: str):
+        self.client = client
+        self.table_name = table
+        self._rows: Optional[List[Dict[str, Any]]] = None
+        self._filters = []
+        self._order = None
+        self._limit = None
+        self._count = None
+        self._head = False
+
+    def insert(self, rows):
+        self._rows = rows if isinstance(rows, list) else [rows]
+        return self
+
+    def select(self, columns: str = '*', count: Optional[str] = None, head: bool = False):
+        self._count, self._head = count, head
+        return self
+
+    def eq(self, column: str, value):
+        self._filters.append(lambda r: r.get(column) == value)
+        return self
+
+    def gte(self, column: str, value):
+        self._filters.append(lambda r: str(r.get(column) or '') >= str(value))
+        return self
+
+    def order(self, column: str, desc: bool = False):
+        self._order = (column, desc)
+        return self
+
+    def limit(self, n: int):
+        self._limit = n
+        return self
+
+    def execute(self) -> FakeResult:
+        if self._rows is not None:
+            # 실제 클라이언트처럼 요청 본문 직렬화 비용을 포함
+            json.dumps(self._rows, ensure_ascii=False, default=str)
+            with self.client.lock:
+                self.client.tables.setdefault(self.table_name, []).extend(self._rows)
+            return FakeResult(self._rows)
+
+        with self.client.lock:
+            rows = [r for r in self.client.tables.get(self.table_name, []) if all(f(r) for f in self._filters)]
+        count = len(rows) if self._count else None
+        if self._order:
+            column, desc = self._order
+            rows.sort(key=lambda r: str(r.get(column) or ''), reverse=desc)
+        if self._limit is not None:
+            rows = rows[:self._limit]
+        return FakeResult([] if self._head else rows, count)
+
+
+class FakeSupabase:
+    """테이블별 행을 메모리에 보관하는 Supabase 클라이언트 대역 (스레드 안전)"""
+
+    def __init__(self):
+        self.tables: Dict[str, List[Dict[str, Any]]] = {}
+        self.lock = threading.Lock()
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+
+# ------------------------------------------------------------------ 합성 데이터
+def recent_start(days: int = 30) -> date:
+    """대부분의 공고가 진행 중이 되도록 접수 시작일 범위를 최근으로 잡습니다."""
+    return date.today() - timedelta(days=days)
+
+
+def source_announcements(count: int, seed: int) -> Dict[str, List[Dict[str, Any]]]:
+    """출처가 섞인 공고 count개를 출처별로 나눕니다 (출처 간 유사 중복 포함)."""
+    split = {'kstartup': [], 'bizinfo': []}
+    for record in generate_announcements(count, 'mixed', seed=seed, start=recent_start(), span_days=30):
+        split[record.pop('source')].append(record)
+    return split
+
+
+def company_frame(count: int, seed: int) -> pd.DataFrame:
+    return pd.DataFrame(list(generate_companies(count, seed=seed)))
+
+
+def alpha_announcements(count: int, seed: int) -> List[Dict[str, Any]]:
+    """alpha.py / ab_streamlit 매칭 입력 형태의 공고"""
+    programs = list(generate_programs(count, seed=seed, start=recent_start(), span_days=30))
+    bands = budget_bands(pd.Series([p['amount'] for p in programs]))
+    return [{
+        'id': f"SYN-{p['seq']}",
+        'rowKey': f"SYN-{p['seq']}",
+        'title': p['title'],
+        'agency': p['agency'],
+        'region': p['region'],
+        'stage': p['stage'],
+        'yearsMax': STAGE_YEARS_MAX[p['stage']],
+        'dueDate': p['end'].isoformat(),
+        'amountKRW': p['amount'],
+        'budgetBand': band,
+        'keywords': [p['field'], p['category']],
+        'allowedUses': p['uses'],
+    } for p, band in zip(programs, bands)]
+
+
+def alpha_profiles(count: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    regions = [r for r, _ in REGIONS if r != '전국']
+    return [{
+        'name': f"기업{i}",
+        'region': rng.choice(regions),
+        'years': rng.randint(0, 10),
+        'stage': rng.choice(STAGES)[0],
+        'keywords': rng.sample(FIELDS, rng.randint(1, 4)),
+        'preferredUses': rng.sample(USES, rng.randint(1, 3)),
+        'preferredBudget': rng.choice(['소액', '중간', '대형']),
+    } for i in range(count)]
+
+
+# ------------------------------------------------------------------ 측정
+def timer_total(metrics: PipelineMetrics, prefix: str) -> float:
+    return sum(stat['total_sec'] for name, stat in metrics.timers.items() if name.startswith(prefix))
+
+
+def per_sec(count: float, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds > 0 else 0.0
+
+
+def build_system(ias, stub: StubServer, companies: pd.DataFrame, workdir: Path):
+    """스텁 주소 / Supabase 대역 / 합성 고객사로 IntegratedAutoSystem을 만듭니다."""
+    system = ias.IntegratedAutoSystem()
+    system.KSTARTUP_API_URL = f"{stub.url}/kstartup"
+    system.BIZINFO_API_URL = f"{stub.url}/bizinfo"
+    system.LLM_CALL_INTERVAL_SEC = 0
+    system.supabase = FakeSupabase()
+    system.alpha_companies = companies
+    system.data_dir = workdir
+    system.kstartup_data_dir = workdir / 'collected_data'
+    system.bizinfo_data_dir = workdir / 'collected_data_biz'
+    return system
+
+
+def bench_fetch(ias, stub: StubServer, pages: int, seed: int, workdir: Path) -> Dict[str, Any]:
+    """출처별로 pages번 요청해 페이지/초와 파싱 항목/초를 측정합니다."""
+    stub.load(**source_announcements(2000, seed))
+    system = build_system(ias, stub, company_frame(1, seed), workdir)
+    results = {}
+    calls = {
+        # K-스타트업 수집은 1페이지(최대 1000건) 고정이므로 같은 페이지를 반복 요청
+        'kstartup': lambda page: system.fetch_kstartup_announcements(),
+        'bizinfo': lambda page: system.fetch_bizinfo_announcements(page_index=page, page_unit=100),
+    }
+    for source, call in calls.items():
+        system.metrics = PipelineMetrics(f'bench_fetch_{source}')
+        start = time.perf_counter()
+        for page in range(1, pages + 1):
+            call(page)
+        wall = time.perf_counter() - start
+        items = system.metrics.counters.get('items_parsed', 0)
+        results[source] = {
+            'pages': pages,
+            'items': items,
+            'wall_sec': round(wall, 3),
+            'pages_per_sec': per_sec(pages, wall),
+            'items_per_sec_parsed': per_sec(items, timer_total(system.metrics, 'parse.')),
+            'http_avg_ms': round(timer_total(system.metrics, 'http.') / pages * 1000, 2),
+        }
+    return results
+
+
+def bench_persist(ias, stub: StubServer, count: int, seed: int, workdir: Path) -> Dict[str, Any]:
+    """공고 저장 경로(Supabase 대역 / CSV+Excel 파일)의 행/초를 측정합니다."""
+    announcements = source_announcements(count, seed)
+    system = build_system(ias, stub, company_frame(1, seed), workdir)
+    results = {}
+    for source, rows in announcements.items():
+        start = time.perf_counter()
+        system.save_announcements_to_supabase(rows, source)
+        supabase_sec = time.perf_counter() - start
+
+        start = time.perf_counter()
+        system.save_announcements_to_file(rows, f"bench_{source}", workdir)
+        file_sec = time.perf_counter() - start
+
+        results[source] = {
+            'rows': len(rows),
+            'supabase_rows_per_sec': per_sec(len(rows), supabase_sec),
+            'file_rows_per_sec': per_sec(len(rows), file_sec),
+        }
+    return results
+
+
+def bench_scoring(ias, stub: StubServer, announcements: int, companies: int, seed: int,
+                  workdir: Path) -> Dict[str, Any]:
+    """채점 구현별 (기업 × 공고) 쌍/초를 측정합니다."""
+    results = {}
+    anns = alpha_announcements(announcements, seed)
+    profiles = alpha_profiles(companies, seed)
+    pairs = len(anns) * len(profiles)
+
+    # alpha.py: 공고별 파이썬 루프 (사유 문자열 포함)
+    start = time.perf_counter()
+    for profile in profiles:
+        compute(profile, anns, ALPHA_WEIGHTS)
+    results['alpha_compute'] = {'pairs': pairs, 'pairs_per_sec': per_sec(pairs, time.perf_counter() - start)}
+
+    # ab_streamlit: CompactAnnouncements 벡터 연산
+    table = CompactAnnouncements.from_frame(pd.DataFrame(anns))
+    start = time.perf_counter()
+    for profile in profiles:
+        score_matches(profile, table, ALPHA_WEIGHTS)
+    results['ab_streamlit_score_matches'] = {'pairs': pairs,
+                                             'pairs_per_sec': per_sec(pairs, time.perf_counter() - start)}
+
+    # integrated_auto_system: 키워드 규칙 채점 (Top-K 사전 선별)
+    system = build_system(ias, stub, company_frame(companies, seed), workdir)
+    for records in source_announcements(announcements, seed).values():
+        for record in records:
+            system.live_announcements[ias.announcement_id(record)] = {
+                'deadline': ias.announcement_deadline(record), 'announcement': record}
+    infos = [system.get_company_info(i) for i in range(companies)]
+    pairs = len(system.live_announcements) * len(infos)
+    start = time.perf_counter()
+    for info in infos:
+        for _ in system.rule_scorer(info, ias.RULE_WEIGHTS):
+            pass
+    results['rule_scorer'] = {'pairs': pairs, 'pairs_per_sec': per_sec(pairs, time.perf_counter() - start)}
+    return results
+
+
+def summarize_job(record: Dict[str, Any]) -> Dict[str, Any]:
+    """daily_job 메트릭 기록에서 비교에 쓸 값만 추립니다."""
+    stages = {name.split('.', 1)[1]: round(stat['total_sec'], 3)
+              for name, stat in record['timers'].items() if name.startswith('stage.')}
+    return {
+        'status': record.get('status'),
+        'wall_sec': record['wall_sec'],
+        'stages_sec': stages,
+        'counters': record['counters'],
+    }
+
+
+def bench_daily_job(ias, stub: StubServer, announcements: int, companies: int, mode: str, seed: int,
+                    workdir: Path) -> Dict[str, Any]:
+    """
+    daily_job을 같은 데이터로 두 번 실행합니다.
+    cold: 빈 상태에서 시작 (Top-K 전체 계산), warm: 같은 공고를 다시 받은 다음 날 (증분 경로)
+    """
+    workdir.mkdir(parents=True, exist_ok=True)
+    os.chdir(workdir)  # Top-K / 진행 중 공고 / 메트릭 파일을 규모별로 분리
+    stub.load(**source_announcements(announcements, seed))
+    ias.RECOMMEND_MODE = mode
+    system = build_system(ias, stub, company_frame(companies, seed), workdir)
+
+    cold = summarize_job(system.daily_job())
+    warm = summarize_job(system.daily_job())
+    return {'announcements': announcements, 'companies': companies, 'mode': mode, 'cold': cold, 'warm': warm}
+
+
+# ------------------------------------------------------------------ 결과 파일
+def load_results(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {'runs': []}
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except Exception as e:
+        print(f"⚠️ 기존 결과 파일을 읽지 못했습니다 ({e}). 새로 시작합니다.")
+        return {'runs': []}
+
+
+def save_results(path: Path, data: Dict[str, Any]):
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+    tmp_path.replace(path)
+
+
+def flatten(value: Any, prefix: str = '') -> Dict[str, float]:
+    """중첩 결과를 'a.b.c' 키의 숫자 값으로 펼칩니다."""
+    if isinstance(value, dict):
+        flat = {}
+        for key, child in value.items():
+            flat.update(flatten(child, f"{prefix}.{key}" if prefix else str(key)))
+        return flat
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return {prefix: float(value)}
+    return {}
+
+
+def find_regressions(previous: Dict[str, Any], current: Dict[str, Any],
+                     tolerance: float = REGRESSION_TOLERANCE) -> List[Dict[str, Any]]:
+    """
+    직전 실행 대비 나빠진 항목.
+    *_per_sec는 낮아지면, *_sec / *_ms는 높아지면 나빠진 것으로 봅니다 (건수 항목은 비교 안 함).
+    """
+    before, after = flatten(previous['results']), flatten(current['results'])
+    regressions = []
+    for key, value in after.items():
+        old = before.get(key)
+        if not old:
+            continue
+        if key.endswith('_per_sec'):
+            change = (old - value) / old
+        elif key.endswith(('_sec', '_ms')):
+            # 1ms 미만 구간은 잡음이 커서 제외
+            if max(old, value) < (1.0 if key.endswith('_ms') else 0.001):
+                continue
+            change = (value - old) / old
+        else:
+            continue
+        if change > tolerance:
+            regressions.append({'metric': key, 'previous': old, 'current': value, 'worse_pct': round(change * 100, 1)})
+    return sorted(regressions, key=lambda r: r['worse_pct'], reverse=True)
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR, capture_output=True,
+                              text=True, timeout=10).stdout.strip()
+    except Exception:
+        return ''
+
+
+def parse_scale(text: str):
+    announcements, _, companies = text.lower().partition('x')
+    return int(announcements), int(companies or 10)
+
+
+# ------------------------------------------------------------------ 실행
+def run(args) -> Dict[str, Any]:
+    workdir = Path(tempfile.mkdtemp(prefix='bench_pipeline_'))
+    original_cwd = os.getcwd()
+    os.chdir(workdir)
+
+    # 로그 파일 / HTTP 캐시 / 상태 파일이 임시 디렉터리에 생기도록 작업 디렉터리를 옮긴 뒤 임포트
+    os.environ.setdefault('OPENAI_API_KEY', 'offline-benchmark')
+    import integrated_auto_system as ias
+    if not args.verbose:
+        logging.getLogger().setLevel(logging.ERROR)
+
+    results: Dict[str, Any] = {}
+    skipped: Dict[str, str] = {}
+    if not ias.OPENAI_AVAILABLE:
+        skipped['llm'] = 'openai 패키지 없음 — LLM 호출 / 추천 저장 구간 제외'
+
+    try:
+        with StubServer(llm_latency_sec=args.llm_latency_ms / 1000) as stub:
+            os.environ['OPENAI_BASE_URL'] = f"{stub.url}/v1"
+
+            print(f"[1/4] 수집/파싱 ({args.pages}페이지 × 2개 출처)")
+            results['fetch'] = bench_fetch(ias, stub, args.pages, args.seed, workdir)
+
+            print(f"[2/4] 저장 ({args.persist_rows}건)")
+            results['persist'] = bench_persist(ias, stub, args.persist_rows, args.seed, workdir)
+
+            largest = max((parse_scale(s) for s in args.scales), key=lambda s: s[0] * s[1])
+            print(f"[3/4] 채점 ({largest[0]}공고 × {largest[1]}기업)")
+            results['scoring'] = bench_scoring(ias, stub, *largest, args.seed, workdir)
+
+            results['daily_job'] = {}
+            for scale in args.scales:
+                announcements, companies = parse_scale(scale)
+                for mode in args.modes:
+                    print(f"[4/4] daily_job {scale} ({mode})")
+                    results['daily_job'][f"{scale}.{mode}"] = bench_daily_job(
+                        ias, stub, announcements, companies, mode, args.seed, workdir / f"{scale}_{mode}")
+    finally:
+        os.chdir(original_cwd)
+        if args.keep_workdir:
+            print(f"작업 디렉터리: {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        'run_id': datetime.now().strftime('%Y%m%d_%H%M%S'),
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'git_rev': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {'scales': args.scales, 'modes': args.modes, 'pages': args.pages,
+                   'persist_rows': args.persist_rows, 'seed': args.seed, 'llm_latency_ms': args.llm_latency_ms},
+        'skipped': skipped,
+        'results': results,
+    }
+
+
+def print_report(run_record: Dict[str, Any], regressions: Optional[List[Dict[str, Any]]]):
+    results = run_record['results']
+    print("\n=== 벤치마크 결과 ===")
+    for source, r in results['fetch'].items():
+        print(f"fetch.{source:<10} {r['pages_per_sec']:>10.1f} 페이지/초 {r['items_per_sec_parsed']:>12.1f} 항목/초(파싱)")
+    for source, r in results['persist'].items():
+        print(f"persist.{source:<8} {r['supabase_rows_per_sec']:>10.1f} 행/초(Supabase) {r['file_rows_per_sec']:>10.1f} 행/초(파일)")
+    for name, r in results['scoring'].items():
+        print(f"scoring.{name:<28} {r['pairs_per_sec']:>14.1f} 쌍/초")
+    for key, r in results['daily_job'].items():
+        print(f"daily_job.{key:<22} cold {r['cold']['wall_sec']:>8.2f}초  warm {r['warm']['wall_sec']:>8.2f}초"
+              f"  ({r['cold']['status']})")
+    for name, reason in run_record['skipped'].items():
+        print(f"건너뜀: {name} — {reason}")
+
+    if regressions is None:
+        print("\n직전 실행 기록이 없어 비교하지 않았습니다.")
+    elif not regressions:
+        print(f"\n직전 실행 대비 {REGRESSION_TOLERANCE:.0%} 이상 나빠진 항목 없음")
+    else:
+        print(f"\n⚠️ 직전 실행 대비 나빠진 항목 {len(regressions)}개")
+        for r in regressions:
+            print(f"  {r['metric']:<60} {r['previous']:>12.3f} → {r['current']:>12.3f} (+{r['worse_pct']}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='수집 → 매칭 → 추천 파이프라인 오프라인 벤치마크')
+    parser.add_argument('--scales', nargs='+', default=DEFAULT_SCALES,
+                        help='daily_job 규모 "<공고 수>x<기업 수>" (K-스타트업 1000건 / 기업마당 100건까지 수집됨)')
+    parser.add_argument('--modes', nargs='+', default=['incremental', 'full'], choices=['incremental', 'full'])
+    parser.add_argument('--pages', type=int, default=30, help='출처별 수집 요청 수')
+    parser.add_argument('--persist-rows', type=int, default=2000)
+    parser.add_argument('--llm-latency-ms', type=float, default=0.0, help='스텁 LLM 응답 지연')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', type=Path, default=RESULTS_FILE)
+    parser.add_argument('--keep-runs', type=int, default=50, help='결과 파일에 남길 최근 실행 수')
+    parser.add_argument('--fail-on-regression', action='store_true', help='나빠진 항목이 있으면 종료 코드 1')
+    parser.add_argument('--keep-workdir', action='store_true')
+    parser.add_argument('--verbose', action='store_true', help='파이프라인 INFO 로그 출력')
+    args = parser.parse_args()
+
+    out = args.out.resolve()
+    run_record = run(args)
+
+    history = load_results(out)
+    previous = history['runs'][-1] if history['runs'] else None
+    regressions = find_regressions(previous, run_record) if previous else None
+    run_record['regressions'] = regressions or []
+    history['runs'] = (history['runs'] + [run_record])[-args.keep_runs:]
+    save_results(out, history)
+
+    print_report(run_record, regressions)
+    print(f"\n결과 저장: {out}")
+    if args.fail_on_regression and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
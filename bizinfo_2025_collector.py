@@ -5,7 +5,6 @@
 기업마당 API를 사용하여 2025년 9월 6일 기준으로 데이터 수집
 """
 
-import requests
 import pandas as pd
 import json
 import xml.etree.ElementTree as ET
@@ -14,10 +13,11 @@ import time
 import os
 import logging
 from typing import List, Dict, Optional
-import schedule
+from auto_scheduler import AsyncScheduler
 import threading
 from pathlib import Path
 import urllib3
+from http_cache import CachedSession, bizinfo_ok
 
 # SSL 경고 무시
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -42,8 +42,8 @@ class BizInfo2025Collector:
         self.data_dir = Path('collected_data_biz')
         self.data_dir.mkdir(exist_ok=True)
         
-        # 세션 생성
-        self.session = requests.Session()
+        # 세션 생성 (응답 캐시 사용)
+        self.session = CachedSession(validate=bizinfo_ok)
         self.session.verify = False
         
         # 헤더 설정
@@ -470,14 +470,11 @@ def main():
             print("매일 오전 9시에 새로운 공고를 자동으로 수집합니다.")
             print("종료하려면 Ctrl+C를 누르세요.")
             
-            schedule.every().day.at("09:00").do(collector.collect_daily_new_announcements)
-            
-            try:
-                while True:
-                    schedule.run_pending()
-                    time.sleep(60)
-            except KeyboardInterrupt:
-                print("\n자동 수집 모드를 종료합니다.")
+            # 스케줄 설정 (auto_scheduler의 비동기 스케줄러, 다음 실행 시각까지 대기)
+            scheduler = AsyncScheduler(state_file='bizinfo_2025_collector_state.json')
+            scheduler.add_job('daily', collector.collect_daily_new_announcements, '0 9 * * *')
+            scheduler.start()
+            print("\n자동 수집 모드를 종료합니다.")
                 
         elif choice == '5':
             print("프로그램을 종료합니다.")
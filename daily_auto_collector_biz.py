@@ -5,11 +5,10 @@
 2025년 9월 6일 기준으로 매일 실행
 """
 
-import schedule
-import time
 import logging
 from datetime import datetime
 from bizinfo_2025_collector import BizInfo2025Collector
+from auto_scheduler import AsyncScheduler
 
 # 로깅 설정
 logging.basicConfig(
@@ -22,6 +21,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+STATE_FILE = 'daily_auto_collector_biz_state.json'
+
 def daily_collection():
     """매일 실행되는 수집 함수"""
     try:
@@ -91,22 +92,15 @@ def main():
     print("🕘 매월 1일 오전 9시: 1년간 데이터 수집")
     print("종료하려면 Ctrl+C를 누르세요.")
     
-    # 스케줄 설정
-    schedule.every().day.at("09:00").do(daily_collection)
-    schedule.every().monday.at("09:00").do(weekly_collection)
-    # 매월 1일은 수동으로 실행하거나 cron으로 설정
-    # schedule.every().month.do(monthly_collection)
+    # 스케줄 설정 (즉시 한 번 실행: 테스트용)
+    scheduler = AsyncScheduler(state_file=STATE_FILE)
+    scheduler.add_job('daily', daily_collection, '0 9 * * *', run_on_start=True)
+    scheduler.add_job('weekly', weekly_collection, '0 9 * * 1')
+    scheduler.add_job('monthly', monthly_collection, '0 9 1 * *')
     
-    # 즉시 한 번 실행 (테스트용)
     print("\n=== 즉시 테스트 실행 ===")
-    daily_collection()
-    
-    try:
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # 1분마다 스케줄 확인
-    except KeyboardInterrupt:
-        print("\n자동 수집 시스템을 종료합니다.")
+    scheduler.start()
+    print("\n자동 수집 시스템을 종료합니다.")
 
 if __name__ == "__main__":
     main()
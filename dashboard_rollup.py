@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대시보드 집계 (서버 측 count 쿼리 + 로컬 롤업 파일)
+전체 테이블을 내려받지 않고 건수/최근 공고만 조회합니다.
+
+- 롤업은 수집 파이프라인이 끝날 때 새로 만들고, 다음 예정 실행 시각까지 유효
+- 그 사이 Supabase에 쓴 행 수는 record_writes로 롤업에 바로 더함 (전체 재집계 없음)
+"""
+
+import json
+import logging
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from auto_scheduler import CronTrigger
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_FILE = Path('dashboard_rollup.json')
+
+# 롤업을 새로 만드는 매일 작업의 실행 시각 (auto_scheduler의 integrated_daily와 같게 유지)
+ROLLUP_SCHEDULE = '30 9 * * *'
+
+_write_lock = threading.Lock()
+
+# 대시보드에 표시하는 테이블
+DASHBOARD_TABLES = ['alpha_companies', 'announcements', 'recommendations']
+
+
+def count_rows(client, table: str, count_method: str = 'exact', since: Optional[str] = None) -> int:
+    """
+    count 헤더만 요청해 테이블 건수를 반환합니다 (행 데이터는 받지 않음).
+
+    Args:
+        client: Supabase 클라이언트
+        table: 테이블명
+        count_method: 'exact' / 'planned' / 'estimated'
+        since: created_at 하한 (ISO 문자열)
+    """
+    query = client.table(table).select('*', count=count_method, head=True)
+    if since:
+        query = query.gte('created_at', since)
+    result = query.execute()
+    return result.count or 0
+
+
+def fetch_recent(client, table: str, columns: List[str], limit: int = 10) -> List[Dict[str, Any]]:
+    """created_at 내림차순으로 최근 행만 조회합니다."""
+    result = (client.table(table)
+              .select(','.join(columns))
+              .order('created_at', desc=True)
+              .limit(limit)
+              .execute())
+    return result.data or []
+
+
+def collect_dashboard_counts(client) -> Dict[str, Any]:
+    """대시보드 지표를 count 쿼리로 집계합니다."""
+    counts = {}
+    for table in DASHBOARD_TABLES:
+        # 큰 테이블은 추정치로도 충분 (PostgREST가 작은 테이블은 정확한 값을 반환)
+        counts[table] = count_rows(client, table, count_method='estimated')
+
+    today_start = datetime.combine(date.today(), datetime.min.time()).isoformat()
+    counts['announcements_today'] = count_rows(client, 'announcements', since=today_start)
+    return counts
+
+
+def _read_rollup(path: Path) -> Optional[Dict[str, Any]]:
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except Exception as e:
+        logger.warning(f"대시보드 롤업 읽기 실패: {e}")
+        return None
+
+
+def _write_rollup(rollup: Dict[str, Any], path: Path):
+    tmp_path = Path(path).with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(rollup, ensure_ascii=False), encoding='utf-8')
+    tmp_path.replace(path)
+
+
+def _roll_over(rollup: Dict[str, Any], today: str):
+    """날짜가 바뀌었으면 '오늘 수집' 건수를 0부터 다시 셉니다."""
+    if rollup.get('date') != today:
+        rollup['date'] = today
+        rollup['counts']['announcements_today'] = 0
+
+
+def refresh_rollup(client, path: Path = ROLLUP_FILE, schedule: str = ROLLUP_SCHEDULE) -> Dict[str, Any]:
+    """
+    집계 결과를 로컬 롤업 파일에 저장합니다 (수집 파이프라인 종료 시 호출).
+    롤업은 schedule의 다음 실행 시각까지 유효합니다.
+    """
+    counts = collect_dashboard_counts(client)
+    now = datetime.now()
+    rollup = {
+        'date': now.date().isoformat(),
+        'as_of': now.isoformat(timespec='seconds'),
+        'valid_until': CronTrigger(schedule).next_after(now).isoformat(timespec='seconds'),
+        'counts': counts,
+    }
+    with _write_lock:
+        _write_rollup(rollup, path)
+    logger.info(f"대시보드 롤업 갱신: {rollup['counts']} (유효: {rollup['valid_until']}까지)")
+    return rollup
+
+
+def record_writes(table: str, rows: int, path: Path = ROLLUP_FILE) -> None:
+    """
+    Supabase에 rows행을 쓴 뒤 롤업 건수를 바로 올립니다 (롤업이 없으면 아무것도 하지 않음).
+    announcements에 쓴 행은 '오늘 수집'에도 더합니다.
+    """
+    if rows <= 0:
+        return
+    with _write_lock:
+        rollup = _read_rollup(path)
+        if not rollup or table not in rollup.get('counts', {}):
+            return
+        now = datetime.now()
+        _roll_over(rollup, now.date().isoformat())
+        rollup['counts'][table] += rows
+        if table == 'announcements':
+            rollup['counts']['announcements_today'] += rows
+        rollup['as_of'] = now.isoformat(timespec='seconds')
+        _write_rollup(rollup, path)
+
+
+def load_rollup(path: Path = ROLLUP_FILE) -> Optional[Dict[str, Any]]:
+    """
+    다음 예정 실행 시각(valid_until) 전이면 롤업을 반환합니다: {'counts', 'as_of', ...}
+    자정을 넘겼으면 '오늘 수집'은 0으로 보고, 만료되었거나 없으면 None.
+    """
+    rollup = _read_rollup(path)
+    if not rollup or not rollup.get('valid_until'):
+        return None
+    now = datetime.now()
+    if now >= datetime.fromisoformat(rollup['valid_until']):
+        return None
+    _roll_over(rollup, now.date().isoformat())
+    return rollup
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+날짜 정규화
+"2025-03-05", "2025.3.5", "2025/03/05", "20250305", "2025년 3월 5일",
+"2025-03-01 ~ 2025-03-31", "20250301 ~ 20250331" 같은 표기를 datetime64 컬럼으로 한 번에 변환합니다.
+
+- normalize_dates: Series 전체를 벡터 연산으로 변환
+  (범위 표기는 '~' 뒤의 끝 날짜 = 마감일, '~ 예산 소진시'처럼 끝이 날짜가 아니면 NaT)
+- normalize_date_columns: 로드 시점에 DataFrame의 날짜 컬럼을 한 번만 변환
+- dday_series: 변환된 컬럼에서 D-day를 벡터 연산으로 계산
+- parse_date / days_until: 단일 값용 (LRU 메모이제이션)
+"""
+
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+# 범위 구분자 ('A ~ B'). 마감일은 마지막 구분자 뒤의 끝 부분에서만 찾음
+RANGE_SEPARATOR = r"[~∼～]"
+# 끝 부분 안의 마지막 yyyy-mm-dd (구분자: - . / 년월일)
+YMD_PATTERN = r"^.*(?P<y>20\d{2})\s*[-./년]\s*(?P<m>\d{1,2})\s*[-./월]\s*(?P<d>\d{1,2})"
+COMPACT_PATTERN = r"^(?P<y>20\d{2})(?P<m>\d{2})(?P<d>\d{2})$"
+
+
+def _from_parts(parts: pd.DataFrame) -> pd.Series:
+    """y/m/d 문자열 컬럼을 datetime64로 변환합니다 (잘못된 날짜는 NaT)."""
+    return pd.to_datetime(
+        {"year": pd.to_numeric(parts["y"], errors="coerce"),
+         "month": pd.to_numeric(parts["m"], errors="coerce"),
+         "day": pd.to_numeric(parts["d"], errors="coerce")},
+        errors="coerce",
+    )
+
+
+@lru_cache(maxsize=4096)
+def _fallback_parse(text: str) -> pd.Timestamp:
+    try:
+        return pd.to_datetime(text)
+    except (ValueError, TypeError, OverflowError):
+        return pd.NaT
+
+
+def normalize_dates(series: pd.Series) -> pd.Series:
+    """
+    날짜 Series를 datetime64[ns] Series로 변환합니다 (원래 인덱스 유지).
+
+    고유 문자열만 파싱한 뒤 다시 펼치므로 같은 날짜가 반복되는 컬럼에서 특히 빠릅니다.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.dt.tz_localize(None) if getattr(series.dt, "tz", None) else series
+
+    text = series.where(series.notna(), None).astype("string").str.strip()
+    uniques = pd.Series(text.dropna().unique(), dtype="string")
+    parsed = pd.Series(pd.NaT, index=uniques.index, dtype="datetime64[ns]")
+
+    if not uniques.empty:
+        # 범위 표기는 끝 부분만 파싱 (범위가 아니면 전체 문자열)
+        ends = uniques.str.split(RANGE_SEPARATOR, regex=True).str[-1].str.strip()
+        parts = ends.str.extract(COMPACT_PATTERN)
+        matched = parts["y"].notna()
+        ymd = ends[~matched].str.extract(YMD_PATTERN)
+        parts.loc[ymd.index] = ymd
+        matched = parts["y"].notna()
+        if matched.any():
+            parsed.loc[matched] = _from_parts(parts[matched])
+
+        # 정형 패턴에 걸리지 않은 소수의 값만 개별 파싱
+        rest = ~matched
+        if rest.any():
+            parsed.loc[rest] = [_fallback_parse(v) if v else pd.NaT for v in ends[rest]]
+
+    codes = pd.Index(uniques).get_indexer(text)
+    values = np.append(parsed.to_numpy(), np.datetime64("NaT", "ns"))[codes]  # -1(결측) → NaT
+    return pd.Series(values, index=series.index, dtype="datetime64[ns]")
+
+
+def normalize_date_columns(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    """존재하는 날짜 컬럼을 datetime64로 변환한 복사본을 반환합니다."""
+    df = df.copy()
+    for col in columns:
+        if col in df.columns:
+            df[col] = normalize_dates(df[col])
+    return df
+
+
+def to_iso_strings(dates: pd.Series) -> pd.Series:
+    """datetime64 Series를 'YYYY-MM-DD' 문자열로 변환합니다 (NaT는 빈 문자열)."""
+    return dates.dt.strftime("%Y-%m-%d").fillna("").astype(object)
+
+
+def dday_series(dates: pd.Series, today: Optional[date] = None) -> pd.Series:
+    """마감일까지 남은 일수 (지난 날짜는 음수, 날짜 없음은 <NA>)"""
+    today = pd.Timestamp(today or date.today())
+    return (dates - today).dt.days.astype("Int64")
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(text: str) -> Optional[date]:
+    value = normalize_dates(pd.Series([text])).iloc[0]
+    return None if pd.isna(value) else value.date()
+
+
+def parse_date(val) -> Optional[date]:
+    """단일 값을 date로 변환합니다. 실패하면 None."""
+    if val is None or (isinstance(val, float) and np.isnan(val)) or val is pd.NaT:
+        return None
+    if isinstance(val, datetime):
+        return val.date()
+    if isinstance(val, date):
+        return val
+    return _parse_cached(str(val).strip())
+
+
+def days_until(val, today: Optional[date] = None) -> Optional[int]:
+    """단일 날짜까지 남은 일수. 날짜가 없거나 잘못되면 None."""
+    d = parse_date(val)
+    if d is None:
+        return None
+    return (d - (today or date.today())).days
+
+
+# 자체 점검용 (문자열, 기대 날짜)
+CHECK_CASES = [
+    ("2025-03-05", date(2025, 3, 5)),
+    ("2025.3.5", date(2025, 3, 5)),
+    ("20250305", date(2025, 3, 5)),
+    ("2025년 3월 5일", date(2025, 3, 5)),
+    ("2025-03-01 ~ 2025-03-31", date(2025, 3, 31)),
+    ("20250301 ~ 20250331", date(2025, 3, 31)),
+    ("2025-03-01 ~ 예산 소진시", None),
+    ("상시 모집", None),
+]
+
+
+def _self_check():
+    """CHECK_CASES로 Series 변환과 단일 값 변환 결과를 점검합니다."""
+    parsed = normalize_dates(pd.Series([text for text, _ in CHECK_CASES]))
+    for i, (text, expected) in enumerate(CHECK_CASES):
+        value = None if pd.isna(parsed.iloc[i]) else parsed.iloc[i].date()
+        assert value == expected, f"{text!r} (Series): {value} != {expected}"
+        assert parse_date(text) == expected, f"{text!r}: {parse_date(text)} != {expected}"
+    print(f"날짜 정규화 점검 통과: {len(CHECK_CASES)}건")
+
+
+if __name__ == "__main__":
+    _self_check()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+마감일 인덱스
+행 위치를 마감일 순으로 정렬해 두고, 오늘 날짜 기준 이분 탐색으로 진행 중인 공고만 골라냅니다.
+날짜가 바뀌면 rollover로 지난 공고를 잘라내므로 작업 집합은 진행 중인 공고 수에 비례합니다.
+
+- 마감일 >= 오늘 이면 진행 중 (D-day 0 포함)
+- 마감일이 없는 공고는 상시 모집으로 보고 항상 포함
+- drop_expired: DataFrame에서 마감된 행을 한 번에 제외 (로더용)
+"""
+
+from datetime import date
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from date_normalizer import normalize_dates
+
+
+def _today64(today: Optional[date]) -> np.datetime64:
+    return np.datetime64(pd.Timestamp(today or date.today()).normalize().to_datetime64(), 'ns')
+
+
+class DeadlineIndex:
+    """마감일 정렬 인덱스 (행 위치 기준)"""
+
+    def __init__(self, deadlines: pd.Series):
+        values = normalize_dates(pd.Series(deadlines)).to_numpy()
+        dated = ~np.isnat(values)
+        order = np.argsort(values[dated], kind='stable')
+        self._positions = np.flatnonzero(dated)[order]
+        self._sorted = values[dated][order]
+        self._open = np.flatnonzero(~dated)
+        self._start = 0
+        self.as_of: Optional[date] = None
+
+    def rollover(self, today: Optional[date] = None) -> int:
+        """오늘 이전에 마감된 공고를 잘라냅니다 (날짜는 앞으로만 진행). 새로 잘린 수를 반환."""
+        cut = int(np.searchsorted(self._sorted, _today64(today), side='left'))
+        dropped = max(0, cut - self._start)
+        self._start = max(self._start, cut)
+        self.as_of = today or date.today()
+        return dropped
+
+    def _ensure_rolled(self, today: Optional[date]):
+        if self.as_of != (today or date.today()):
+            self.rollover(today)
+
+    def active_positions(self, today: Optional[date] = None, by_deadline: bool = False) -> np.ndarray:
+        """
+        진행 중인 행 위치.
+
+        Args:
+            by_deadline: True면 마감 임박 순 (상시 모집은 맨 뒤), False면 원래 행 순서
+        """
+        self._ensure_rolled(today)
+        positions = np.concatenate([self._positions[self._start:], self._open])
+        return positions if by_deadline else np.sort(positions)
+
+    def expired_positions(self, today: Optional[date] = None) -> np.ndarray:
+        """마감된 행 위치 (원래 행 순서)."""
+        self._ensure_rolled(today)
+        return np.sort(self._positions[:self._start])
+
+    def closing_within(self, days: int, today: Optional[date] = None) -> np.ndarray:
+        """days일 안에 마감되는 진행 중 행 위치 (마감 임박 순)."""
+        self._ensure_rolled(today)
+        end = int(np.searchsorted(self._sorted, _today64(today) + np.timedelta64(days, 'D'), side='right'))
+        return self._positions[self._start:max(self._start, end)]
+
+    def __len__(self) -> int:
+        return len(self._positions) - self._start + len(self._open)
+
+
+def drop_expired(df: pd.DataFrame, column: str, today: Optional[date] = None) -> pd.DataFrame:
+    """마감일 컬럼 기준으로 진행 중인 행만 남깁니다 (컬럼이 없으면 그대로)."""
+    if df.empty or column not in df.columns:
+        return df
+    return df.iloc[DeadlineIndex(df[column]).active_positions(today)]
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+이메일 다이제스트 발송
+신규 매칭 공고를 수신자별로 묶어 한 통의 요약 메일로 만들고,
+로그인까지 마친 SMTP 세션을 풀에 보관해 여러 메일에 재사용합니다.
+
+- group_by_recipient: 매칭 행 → {수신자: [행...]} (수신자 필드는 'a@x, b@y'도 허용)
+- render_digest: 미리 컴파일한 HTML 템플릿으로 (제목, 본문) 생성
+- SMTPPool: 세션 최대 pool_size개 (STARTTLS/로그인은 세션당 1회, 오래 쉰 세션은 NOOP로 확인)
+- DigestMailer.send_many: 풀 크기만큼 동시에 발송, 일시 오류(연결 끊김/4xx)는 지수 백오프로 재시도
+- 첨부파일은 메모리에 올리지 않고 base64로 나눠 읽으며 SMTP DATA로 바로 흘려보냄
+
+email_config 키: smtp_server, smtp_port, from_email, password, to_email
+  (선택) use_tls(기본 True), pool_size(기본 3), max_retries(기본 3), timeout(초, 기본 30)
+로컬 확인: python -m aiosmtpd -n -l localhost:1025 (또는 python -m smtpd -n -c DebuggingServer localhost:1025)
+  + {'smtp_server': 'localhost', 'smtp_port': 1025, 'use_tls': False, 'password': None, ...}
+"""
+
+import base64
+import html
+import logging
+import os
+import queue
+import smtplib
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from email.header import Header
+from email.utils import formatdate, make_msgid
+from string import Template
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 첨부 읽기 단위: 3의 배수여야 조각별 base64를 이어 붙여도 패딩이 중간에 생기지 않음 (57바이트 = 76자 1줄)
+ATTACHMENT_CHUNK = 57 * 1024
+IDLE_CHECK_SEC = 60
+# SMTP DATA 줄바꿈 (긴 헤더를 접을 때도 bare LF가 들어가지 않도록 CRLF 사용)
+CRLF = '\r\n'
+
+DIGEST_TEMPLATE = Template("""\
+<h3>$heading</h3>
+<p>$intro</p>
+<table style="border-collapse:collapse;font-size:14px;">
+  <thead style="background:#f8fafc;text-align:left;">
+    <tr><th style="padding:6px;">기업</th><th style="padding:6px;">공고</th><th style="padding:6px;">점수</th>
+        <th style="padding:6px;">마감일</th><th style="padding:6px;">투자금액</th></tr>
+  </thead>
+  <tbody>$rows</tbody>
+</table>
+<p style="color:#64748b;font-size:12px;">발송 시각: $sent_at</p>
+""")
+ROW_TEMPLATE = Template(
+    '<tr><td style="padding:6px;">$company</td><td style="padding:6px;">$title</td>'
+    '<td style="padding:6px;">$score</td><td style="padding:6px;">$due</td><td style="padding:6px;">$amount</td></tr>'
+)
+# 매칭 행의 필드 (앞에 있는 필드 우선)
+ROW_FIELDS = {
+    'company': ['기업명', 'company'],
+    'title': ['공고이름', 'title'],
+    'score': ['추천점수', 'score'],
+    'due': ['마감일', 'due'],
+    'amount': ['투자금액', 'amount'],
+}
+
+# 다시 시도해 볼 만한 오류 (5xx 응답은 재시도하지 않음)
+TRANSIENT_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError, TimeoutError)
+
+
+def _split_recipients(value: Any) -> List[str]:
+    if isinstance(value, (list, tuple)):
+        return [str(v).strip() for v in value if str(v).strip()]
+    return [part.strip() for part in str(value or '').split(',') if part.strip()]
+
+
+def _normalize_address(address: str) -> str:
+    """도메인만 소문자로 (로컬 파트는 대소문자를 구분할 수 있으므로 그대로 둠)"""
+    local, at, domain = address.rpartition('@')
+    return f"{local}@{domain.lower()}" if at else address
+
+
+def group_by_recipient(matches: Iterable[Dict[str, Any]], recipient_field: str = 'recipient') -> Dict[str, List[Dict[str, Any]]]:
+    """매칭 행을 수신자별로 묶습니다 (수신자가 여러 명이면 각자에게 포함, 입력 순서 유지)."""
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for match in matches:
+        for recipient in _split_recipients(match.get(recipient_field)):
+            groups.setdefault(_normalize_address(recipient), []).append(match)
+    return groups
+
+
+def _field(row: Dict[str, Any], name: str) -> str:
+    for key in ROW_FIELDS[name]:
+        value = row.get(key)
+        if value is not None and str(value).strip() and str(value) != 'nan':
+            return html.escape(str(value))
+    return '-'
+
+
+def render_digest(items: Sequence[Dict[str, Any]], heading: str = '신규 맞춤 공고 알림') -> Tuple[str, str]:
+    """수신자 1명의 다이제스트 (제목, HTML 본문)"""
+    rows = ''.join(ROW_TEMPLATE.substitute({name: _field(item, name) for name in ROW_FIELDS}) for item in items)
+    companies = {_field(item, 'company') for item in items}
+    subject = f"[알림] {heading} {len(items)}건"
+    body = DIGEST_TEMPLATE.substitute(
+        heading=html.escape(heading),
+        intro=f"{len(companies)}개 기업에 대한 신규 매칭 공고 {len(items)}건입니다.",
+        rows=rows,
+        sent_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+    )
+    return subject, body
+
+
+def _b64_lines(data: bytes) -> bytes:
+    return base64.encodebytes(data).replace(b'\n', b'\r\n')
+
+
+def iter_message(sender: str, recipients: Sequence[str], subject: str, html_body: str,
+                 attachments: Sequence[str] = ()) -> Iterator[bytes]:
+    """
+    MIME 메시지를 조각(bytes)으로 생성합니다. 모든 파트를 base64로 보내므로
+    줄 머리의 '.'가 생기지 않아 SMTP DATA에 그대로 흘려보낼 수 있음.
+    """
+    boundary = f"=={uuid.uuid4().hex}"
+    headers = [
+        f"From: {sender}",
+        f"To: {', '.join(recipients)}",
+        f"Subject: {Header(subject, 'utf-8', header_name='Subject').encode(linesep=CRLF)}",
+        f"Date: {formatdate(localtime=True)}",
+        f"Message-ID: {make_msgid()}",
+        "MIME-Version: 1.0",
+        f'Content-Type: multipart/mixed; boundary="{boundary}"',
+    ]
+    yield ('\r\n'.join(headers) + '\r\n\r\n').encode('ascii')
+
+    yield (f"--{boundary}\r\nContent-Type: text/html; charset=\"utf-8\"\r\n"
+           "Content-Transfer-Encoding: base64\r\n\r\n").encode('ascii')
+    yield _b64_lines(html_body.encode('utf-8'))
+
+    for path in attachments:
+        if not path or not os.path.exists(path):
+            continue
+        filename = Header(os.path.basename(path), 'utf-8').encode(linesep=CRLF)
+        yield (f"--{boundary}\r\nContent-Type: application/octet-stream\r\n"
+               "Content-Transfer-Encoding: base64\r\n"
+               f'Content-Disposition: attachment; filename="{filename}"\r\n\r\n').encode('ascii')
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(ATTACHMENT_CHUNK), b''):
+                yield _b64_lines(chunk)
+
+    yield f"--{boundary}--\r\n".encode('ascii')
+
+
+class SMTPPool:
+    """로그인된 SMTP 세션 풀 (스레드 안전)"""
+
+    def __init__(self, config: Dict[str, Any], size: Optional[int] = None):
+        self.config = config
+        self.size = size or int(config.get('pool_size', 3))
+        self._idle: "queue.LifoQueue[Tuple[smtplib.SMTP, float]]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self.connects = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.config['smtp_server'], int(self.config['smtp_port']),
+                              timeout=self.config.get('timeout', 30))
+        if self.config.get('use_tls', True):
+            server.starttls()
+        if self.config.get('password'):
+            server.login(self.config['from_email'], self.config['password'])
+        self.connects += 1
+        return server
+
+    @staticmethod
+    def _close(server: smtplib.SMTP):
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    def _checkout(self) -> smtplib.SMTP:
+        while True:
+            try:
+                server, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+            if time.monotonic() - last_used < IDLE_CHECK_SEC:
+                return server
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except smtplib.SMTPException:
+                pass
+            self._close(server)
+
+    @contextmanager
+    def session(self):
+        """세션 하나를 빌려 줍니다. 블록에서 오류가 나면 그 세션은 버림."""
+        with self._slots:
+            server = self._checkout()
+            try:
+                yield server
+            except Exception:
+                self._close(server)
+                raise
+            self._idle.put((server, time.monotonic()))
+
+    def close(self):
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close(server)
+
+
+class DigestMailer:
+    """SMTPPool 위에서 메일을 보내는 발송기 (재시도 포함)"""
+
+    def __init__(self, config: Dict[str, Any], pool: Optional[SMTPPool] = None):
+        self.config = config
+        self.pool = pool or SMTPPool(config)
+        self.max_retries = int(config.get('max_retries', 3))
+
+    def _transmit(self, server: smtplib.SMTP, recipients: Sequence[str], chunks: Iterator[bytes]):
+        code, resp = server.mail(self.config['from_email'])
+        if code != 250:
+            raise smtplib.SMTPSenderRefused(code, resp, self.config['from_email'])
+        refused = {}
+        for recipient in recipients:
+            code, resp = server.rcpt(recipient)
+            if code not in (250, 251):
+                refused[recipient] = (code, resp)
+        if len(refused) == len(recipients):
+            server.rset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+        server.putcmd('data')
+        code, resp = server.getreply()
+        if code != 354:
+            raise smtplib.SMTPDataError(code, resp)
+        for chunk in chunks:
+            server.send(chunk)
+        server.send(b'\r\n.\r\n')
+        code, resp = server.getreply()
+        if code != 250:
+            raise smtplib.SMTPDataError(code, resp)
+        if refused:
+            logger.warning(f"일부 수신자 거부: {refused}")
+
+    def send(self, recipients: Sequence[str], subject: str, html_body: str,
+             attachments: Sequence[str] = ()) -> bool:
+        """메일 1통 발송. 일시 오류는 max_retries번까지 새 세션으로 다시 시도."""
+        recipients = _split_recipients(recipients)
+        if not recipients:
+            logger.warning("수신자가 없습니다.")
+            return False
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self.pool.session() as server:
+                    chunks = iter_message(self.config['from_email'], recipients, subject, html_body, attachments)
+                    self._transmit(server, recipients, chunks)
+                return True
+            except Exception as e:
+                transient = isinstance(e, TRANSIENT_ERRORS) or (
+                    isinstance(e, smtplib.SMTPResponseException) and 400 <= e.smtp_code < 500)
+                if not transient or attempt == self.max_retries:
+                    logger.error(f"이메일 발송 실패 ({', '.join(recipients)}): {e}")
+                    return False
+                wait = 2 ** attempt
+                logger.warning(f"이메일 발송 재시도 {attempt + 1}/{self.max_retries} ({wait}초 후): {e}")
+                time.sleep(wait)
+        return False
+
+    def send_many(self, messages: Sequence[Dict[str, Any]]) -> Dict[str, bool]:
+        """
+        여러 메일을 풀 크기만큼 동시에 발송합니다.
+
+        Args:
+            messages: [{'to': 수신자, 'subject', 'body', 'attachments'(선택)}]
+        Returns:
+            {수신자: 성공 여부}
+        """
+        def deliver(message):
+            return self.send(message['to'], message['subject'], message['body'], message.get('attachments', ()))
+
+        with ThreadPoolExecutor(max_workers=self.pool.size) as executor:
+            results = list(executor.map(deliver, messages))
+        return {', '.join(_split_recipients(m['to'])): ok for m, ok in zip(messages, results)}
+
+    def send_digests(self, matches: Iterable[Dict[str, Any]], recipient_field: str = 'recipient',
+                     heading: str = '신규 맞춤 공고 알림') -> Dict[str, bool]:
+        """매칭 행을 수신자별 다이제스트로 묶어 발송합니다."""
+        messages = []
+        for recipient, items in group_by_recipient(matches, recipient_field).items():
+            subject, body = render_digest(items, heading)
+            messages.append({'to': recipient, 'subject': subject, 'body': body})
+        if not messages:
+            return {}
+        results = self.send_many(messages)
+        logger.info(f"다이제스트 발송: {sum(results.values())}/{len(results)}명 성공 (SMTP 연결 {self.pool.connects}회)")
+        return results
+
+    def close(self):
+        self.pool.close()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공공데이터 API / 웹페이지 응답 디스크 캐시
+정규화된 URL + 파라미터(서비스키 제외)를 키로 응답을 저장하고
+ETag / Last-Modified / Cache-Control 을 따르는 조건부 요청을 보냅니다.
+
+- 200이어도 오류 본문(인증키 오류, 호출 한도 초과 등)은 수집기별 validate 훅으로 걸러 저장하지 않음
+- 캐시 폴더는 용량(HTTP_CACHE_MAX_MB) / 보관 기간(HTTP_CACHE_MAX_AGE_DAYS) 한도를 넘으면 오래된 항목부터 삭제
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Callable, Dict, Optional, Any
+from urllib.parse import urlsplit, urlunsplit, parse_qsl
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# 캐시 키에서 제외할 인증 파라미터 (대소문자 무시)
+SECRET_PARAMS = {'servicekey', 'crtfckey', 'api_key', 'apikey'}
+
+# Cache-Control / 검증자가 없을 때 사용할 엔드포인트별 TTL (초)
+DEFAULT_ENDPOINT_TTLS = {
+    'https://apis.data.go.kr/B552735/kisedKstartupService01': 6 * 3600,
+    'https://www.bizinfo.go.kr/uss/rss/bizinfoApi.do': 6 * 3600,
+    'https://www.k-startup.go.kr/web/contents': 3600,
+}
+DEFAULT_TTL = 3600
+
+CACHE_DIR = Path(os.getenv('HTTP_CACHE_DIR', 'http_cache'))
+
+# 캐시 폴더 한도 (초과 시 오래된 항목부터 삭제) / 저장 몇 번마다 한도를 확인할지
+MAX_CACHE_BYTES = int(float(os.getenv('HTTP_CACHE_MAX_MB', '256')) * 1024 * 1024)
+MAX_CACHE_AGE = int(float(os.getenv('HTTP_CACHE_MAX_AGE_DAYS', '7')) * 86400)
+PRUNE_EVERY = 50
+
+_MAX_AGE_RE = re.compile(r'max-age\s*=\s*(\d+)', re.IGNORECASE)
+
+
+def normalize_request(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    URL과 파라미터를 캐시 키 문자열로 정규화합니다.
+
+    스킴/호스트는 소문자로, 쿼리 파라미터는 정렬하며 서비스키 등 인증 값은 제외합니다.
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query.extend((str(k), '' if v is None else str(v)) for k, v in params.items())
+    query = sorted((k, v) for k, v in query if k.lower() not in SECRET_PARAMS)
+
+    base = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', '', ''))
+    return base + '?' + '&'.join(f"{k}={v}" for k, v in query)
+
+
+def data_go_kr_ok(response: requests.Response) -> bool:
+    """
+    공공데이터포털(K-스타트업) XML 응답 검증.
+    인증키 오류 / 호출 한도 초과는 200 상태로 OpenAPI_ServiceResponse 본문이 오므로 캐시하지 않습니다.
+    """
+    try:
+        root = ET.fromstring(response.content)
+    except ET.ParseError:
+        return False
+    if root.tag == 'OpenAPI_ServiceResponse' or root.find('.//errMsg') is not None:
+        return False
+    result_code = root.findtext('.//resultCode')
+    return result_code is None or result_code.strip() in ('0', '00')
+
+
+def bizinfo_ok(response: requests.Response) -> bool:
+    """기업마당 JSON 응답 검증 (공고 목록 구조가 아니면 오류 본문으로 보고 캐시하지 않음)"""
+    try:
+        data = response.json()
+    except ValueError:
+        return False
+    return isinstance(data, list) or (isinstance(data, dict) and ('jsonArray' in data or 'item' in data))
+
+
+def html_page_ok(response: requests.Response) -> bool:
+    """웹페이지 응답 검증 (빈 본문이나 HTML이 아닌 본문은 캐시하지 않음)"""
+    return b'<html' in response.content[:4096].lower()
+
+
+class HttpCache:
+    """조건부 요청을 지원하는 디스크 HTTP 캐시"""
+
+    def __init__(self, cache_dir: Path = None, endpoint_ttls: Dict[str, int] = None,
+                 default_ttl: int = DEFAULT_TTL, offline: bool = None,
+                 max_bytes: int = MAX_CACHE_BYTES, max_age: int = MAX_CACHE_AGE):
+        self.cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.endpoint_ttls = dict(DEFAULT_ENDPOINT_TTLS)
+        if endpoint_ttls:
+            self.endpoint_ttls.update(endpoint_ttls)
+        self.default_ttl = default_ttl
+
+        # 오프라인 재생 모드: 네트워크 없이 캐시된 응답만 사용
+        if offline is None:
+            offline = os.getenv('HTTP_CACHE_OFFLINE', '').lower() in ('1', 'true', 'yes')
+        self.offline = offline
+
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._stores = 0
+
+        # 수집 스레드 여러 개가 같은 캐시를 공유하므로 카운터는 잠금 후 갱신
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'rejected': 0}
+
+        if not self.offline:
+            self.prune()
+
+    def count(self, name: str, n: int = 1) -> None:
+        """stats[name]을 n만큼 증가시킵니다 (스레드 안전)."""
+        with self._lock:
+            self.stats[name] = self.stats.get(name, 0) + n
+
+    def _paths(self, key: str):
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.json", self.cache_dir / f"{digest}.body"
+
+    def ttl_for(self, url: str) -> int:
+        """URL에 해당하는 엔드포인트 TTL을 반환합니다 (가장 긴 접두사 우선)."""
+        matches = [prefix for prefix in self.endpoint_ttls if url.startswith(prefix)]
+        if not matches:
+            return self.default_ttl
+        return self.endpoint_ttls[max(matches, key=len)]
+
+    def lookup(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """캐시된 항목(메타데이터 + 본문)을 반환합니다. 없으면 None."""
+        meta_path, body_path = self._paths(normalize_request(url, params))
+        if not meta_path.exists() or not body_path.exists():
+            return None
+
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+            meta['body'] = body_path.read_bytes()
+            return meta
+        except Exception as e:
+            logger.warning(f"캐시 항목 읽기 실패: {e}")
+            return None
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """캐시 항목이 아직 유효한지 확인합니다."""
+        return time.time() < entry.get('expires_at', 0)
+
+    def store(self, url: str, params: Optional[Dict[str, Any]], status_code: int,
+              headers: Dict[str, str], body: bytes) -> None:
+        """응답을 캐시에 저장합니다. no-store 응답은 저장하지 않습니다."""
+        headers = CaseInsensitiveDict(headers or {})
+        cache_control = headers.get('Cache-Control', '')
+        if 'no-store' in cache_control.lower():
+            return
+
+        key = normalize_request(url, params)
+        meta_path, body_path = self._paths(key)
+
+        body_path.write_bytes(body)
+        meta = {
+            'key': key,
+            'status_code': status_code,
+            'headers': dict(headers),
+            'stored_at': time.time(),
+            'expires_at': time.time() + self._freshness(url, cache_control),
+        }
+        meta_path.write_text(json.dumps(meta, ensure_ascii=False), encoding='utf-8')
+
+        with self._lock:
+            self._stores += 1
+            due = self._stores % PRUNE_EVERY == 0
+        if due and not self.offline:
+            self.prune()
+
+    def refresh(self, url: str, params: Optional[Dict[str, Any]], entry: Dict[str, Any],
+                headers: Dict[str, str]) -> None:
+        """304 응답을 받은 항목의 만료 시각을 갱신합니다."""
+        merged = CaseInsensitiveDict(entry.get('headers', {}))
+        merged.update(headers or {})
+        self.store(url, params, entry['status_code'], merged, entry['body'])
+
+    def _freshness(self, url: str, cache_control: str) -> int:
+        if 'no-cache' in cache_control.lower():
+            return 0
+        match = _MAX_AGE_RE.search(cache_control)
+        if match:
+            return int(match.group(1))
+        return self.ttl_for(url)
+
+    def conditional_headers(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        """캐시 항목의 검증자로 조건부 요청 헤더를 만듭니다."""
+        stored = CaseInsensitiveDict(entry.get('headers', {}))
+        headers = {}
+        if stored.get('ETag'):
+            headers['If-None-Match'] = stored['ETag']
+        if stored.get('Last-Modified'):
+            headers['If-Modified-Since'] = stored['Last-Modified']
+        return headers
+
+    def prune(self) -> int:
+        """
+        보관 기간이 지난 항목을 지우고, 폴더 용량이 max_bytes를 넘으면 오래 저장된 항목부터 삭제합니다.
+        오프라인 재생 모드에서는 호출하지 않습니다 (재생용 응답 보존).
+
+        Returns:
+            삭제한 항목 수
+        """
+        entries = []
+        for meta_path in self.cache_dir.glob('*.json'):
+            body_path = meta_path.with_suffix('.body')
+            try:
+                stored_at = meta_path.stat().st_mtime
+                size = meta_path.stat().st_size + (body_path.stat().st_size if body_path.exists() else 0)
+            except FileNotFoundError:
+                continue
+            entries.append((stored_at, size, meta_path, body_path))
+        entries.sort(key=lambda entry: entry[0])
+
+        cutoff = time.time() - self.max_age
+        total = sum(size for _, size, _, _ in entries)
+        removed = 0
+        for stored_at, size, meta_path, body_path in entries:
+            if stored_at >= cutoff and total <= self.max_bytes:
+                break
+            meta_path.unlink(missing_ok=True)
+            body_path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info(f"HTTP 캐시 정리: {removed}개 항목 삭제 (남은 용량 {total / 1024 / 1024:.1f}MB)")
+        return removed
+
+    def clear(self) -> int:
+        """모든 캐시 항목을 삭제하고 삭제한 항목 수를 반환합니다."""
+        count = 0
+        for path in self.cache_dir.glob('*.json'):
+            path.unlink(missing_ok=True)
+            path.with_suffix('.body').unlink(missing_ok=True)
+            count += 1
+        return count
+
+
+def build_response(url: str, entry: Dict[str, Any]) -> requests.Response:
+    """캐시 항목으로 requests.Response 객체를 만듭니다."""
+    response = requests.Response()
+    response.status_code = entry['status_code']
+    response.headers = CaseInsensitiveDict(entry.get('headers', {}))
+    response._content = entry['body']
+    response.url = url
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers) or 'utf-8'
+    response.from_cache = True
+    return response
+
+
+class CachedSession(requests.Session):
+    """
+    GET 요청을 HttpCache로 처리하는 requests.Session
+
+    validate(response) -> bool: 200 응답을 캐시에 저장해도 되는지 판단하는 수집기별 훅
+    (get(..., validate=...)로 요청마다 바꿀 수 있음, None이면 200 응답을 모두 저장)
+    """
+
+    def __init__(self, cache: HttpCache = None,
+                 validate: Optional[Callable[[requests.Response], bool]] = None):
+        super().__init__()
+        self.cache = cache or HttpCache()
+        self.validate = validate
+
+    def get(self, url, params=None, validate=None, **kwargs):
+        cache = self.cache
+        validate = validate or self.validate
+        entry = cache.lookup(url, params)
+
+        if entry is not None and (cache.offline or cache.is_fresh(entry)):
+            cache.count('hits')
+            return build_response(url, entry)
+
+        if cache.offline:
+            # 오프라인 재생 모드에서 캐시에 없는 요청
+            cache.count('misses')
+            logger.warning(f"오프라인 모드: 캐시에 없는 요청 {normalize_request(url, params)}")
+            return build_response(url, {'status_code': 504, 'headers': {}, 'body': b''})
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry is not None:
+            headers.update(cache.conditional_headers(entry))
+
+        response = super().get(url, params=params, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            cache.count('revalidated')
+            cache.refresh(url, params, entry, response.headers)
+            return build_response(url, entry)
+
+        cache.count('misses')
+        if response.status_code == 200:
+            if validate is None or validate(response):
+                cache.store(url, params, response.status_code, response.headers, response.content)
+            else:
+                cache.count('rejected')
+                logger.warning(f"오류 응답으로 판단해 캐시하지 않음: {normalize_request(url, params)}")
+        response.from_cache = False
+        return response
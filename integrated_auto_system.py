@@ -5,7 +5,6 @@
 매일 K-스타트업과 기업마당에서 데이터를 수집하고 Supabase에 저장하며 맞춤 추천을 생성
 """
 
-import requests
 import pandas as pd
 import json
 import xml.etree.ElementTree as ET
@@ -14,17 +13,38 @@ import time
 import os
 import logging
 from typing import List, Dict, Optional, Any
-import schedule
 import threading
 from pathlib import Path
 import urllib3
+from http_cache import CachedSession, bizinfo_ok, data_go_kr_ok
+from auto_scheduler import AsyncScheduler
+from pipeline_metrics import PipelineMetrics
+from dashboard_rollup import record_writes, refresh_rollup
+from table_loader import load_table
+from date_normalizer import parse_date
+from topk_store import TopKStore, fingerprint
+from deadline_index import DeadlineIndex
+from near_duplicates import dedup_records
+from recommendation_export import export_recommendations
+import re
 import subprocess
-import openai
+from concurrent.futures import ThreadPoolExecutor
 import warnings
-from supabase import create_client, Client
 import sys
-sys.path.append('/Users/minkim/git_test/kpmg-2025/data2/supabase1')
-from config import SUPABASE_URL, SUPABASE_KEY
+
+try:
+    import openai
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
+try:
+    from supabase import create_client, Client
+    sys.path.append('/Users/minkim/git_test/kpmg-2025/data2/supabase1')
+    from config import SUPABASE_URL, SUPABASE_KEY
+    SUPABASE_AVAILABLE = True
+except ImportError:
+    SUPABASE_AVAILABLE = False
 
 warnings.filterwarnings('ignore')
 
@@ -42,9 +62,61 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 추천 모드: full(기본) = 매번 전체 기업 LLM 호출, incremental = 신규 공고만 채점해 Top-K가 바뀐 기업만 LLM 호출
+RECOMMEND_MODE = os.getenv('RECOMMEND_MODE', 'full')
+
+# 규칙 기반 사전 채점 Top-K (create_recommendation_prompt가 최대 30개까지 표시)
+RULE_TOPK = 30
+RULE_WEIGHTS = {'scorer': 'keyword_overlap', 'version': 1}
+LIVE_ANNOUNCEMENTS_FILE = Path('live_announcements.json')
+
+# 추천 결과 내보내기 형식 (xlsx, csv, parquet) / XLSX에 회사별 시트 추가 여부
+EXPORT_FORMATS = os.getenv('EXPORT_FORMATS', 'xlsx,csv').split(',')
+EXPORT_PER_COMPANY_SHEETS = os.getenv('EXPORT_PER_COMPANY_SHEETS', '1') == '1'
+
+# 공고 출처별 필드
+ANNOUNCEMENT_ID_FIELDS = ['pbanc_sn', 'pblancId', '공고번호']
+ANNOUNCEMENT_TEXT_FIELDS = ['사업공고명', '공고내용', '지원대상', 'pblancNm', 'description', 'trgetNm', 'hashTags']
+ANNOUNCEMENT_DEADLINE_FIELDS = ['접수종료일', 'reqstBeginEndDe', '마감일']
+PROFILE_TEXT_FIELDS = ['main_business', 'main_industry', 'business_description', 'specialization']
+
+
+def announcement_id(announcement: Dict) -> str:
+    """공고 식별자 (출처의 일련번호, 없으면 제목+기관 해시)"""
+    for field in ANNOUNCEMENT_ID_FIELDS:
+        if announcement.get(field):
+            return str(announcement[field])
+    title = announcement.get('사업공고명') or announcement.get('pblancNm') or ''
+    agency = announcement.get('공고기관명') or announcement.get('excInsttNm') or ''
+    return fingerprint([title, agency])
+
+
+def announcement_deadline(announcement: Dict) -> Optional[str]:
+    """마감일 ISO 문자열 (기간 표기는 끝 날짜, 없으면 None)"""
+    for field in ANNOUNCEMENT_DEADLINE_FIELDS:
+        deadline = parse_date(announcement.get(field))
+        if deadline:
+            return deadline.isoformat()
+    return None
+
+
+def _tokens(text: str) -> set:
+    return {t for t in re.split(r'[^\w]+', text.lower()) if len(t) >= 2}
+
+
+def profile_tokens(company_info: Dict[str, Any]) -> set:
+    """기업 프로필의 업종/아이템/특화분야 키워드"""
+    return _tokens(' '.join(str(company_info.get(f) or '') for f in PROFILE_TEXT_FIELDS))
+
+
 class IntegratedAutoSystem:
     """통합 자동화 시스템"""
     
+    # 외부 API 주소와 LLM 호출 간격 (오프라인 벤치마크에서는 로컬 스텁 주소 / 0초로 교체)
+    KSTARTUP_API_URL = 'https://apis.data.go.kr/B552735/kisedKstartupService01/getAnnouncementInformation01'
+    BIZINFO_API_URL = 'https://www.bizinfo.go.kr/uss/rss/bizinfoApi.do'
+    LLM_CALL_INTERVAL_SEC = 2
+    
     def __init__(self):
         # API 키 설정
         self.kstartup_service_key = 'lSEnfDS8d9B+TyiAlh+jhZN9EGyIGk7GuYHSzZJtziZvrvFeyLF7jQi7z7G/usfjAO//9T5ihYhUeFJywCalhQ=='
@@ -58,12 +130,15 @@ class IntegratedAutoSystem:
             logger.warning("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
         
         # Supabase 클라이언트 초기화
-        try:
-            self.supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-            logger.info("Supabase 연결 성공")
-        except Exception as e:
-            logger.error(f"Supabase 연결 실패: {e}")
-            self.supabase = None
+        self.supabase = None
+        if not SUPABASE_AVAILABLE:
+            logger.warning("Supabase 패키지 또는 config를 찾을 수 없습니다.")
+        else:
+            try:
+                self.supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+                logger.info("Supabase 연결 성공")
+            except Exception as e:
+                logger.error(f"Supabase 연결 실패: {e}")
         
         # 경로 설정
         self.data_dir = Path('/Users/minkim/git_test/kpmg-2025/data2')
@@ -71,8 +146,8 @@ class IntegratedAutoSystem:
         self.bizinfo_data_dir = self.data_dir / 'collected_data_biz'
         self.alpha_companies_path = self.data_dir / 'alpha_companies.csv'
         
-        # 세션 생성
-        self.session = requests.Session()
+        # 세션 생성 (응답 캐시 사용)
+        self.session = CachedSession()
         self.session.verify = False
         
         # 헤더 설정
@@ -84,17 +159,25 @@ class IntegratedAutoSystem:
             'Connection': 'keep-alive',
         })
         
+        # 실행 계측 (daily_job마다 새로 생성)
+        self.metrics = PipelineMetrics()
+        
         # 고객사 정보 로드
         try:
-            self.alpha_companies = pd.read_csv(self.alpha_companies_path)
+            self.alpha_companies = load_table(self.alpha_companies_path)
             logger.info(f"고객사 정보 로드 완료: {len(self.alpha_companies)}개 기업")
         except Exception as e:
             logger.error(f"고객사 정보 로드 실패: {e}")
             self.alpha_companies = pd.DataFrame()
+        
+        # 증분 추천 상태 (기업별 규칙 Top-K, 진행 중 공고 목록)
+        self.topk = TopKStore(k=RULE_TOPK)
+        self.live_announcements = self._load_live_announcements()
+        self._ann_text: Dict[str, str] = {}
     
     def fetch_kstartup_announcements(self, start_date: str = "", end_date: str = "") -> List[Dict]:
         """K-스타트업 API에서 공고 데이터를 가져옵니다."""
-        api_url = 'https://apis.data.go.kr/B552735/kisedKstartupService01/getAnnouncementInformation01'
+        api_url = self.KSTARTUP_API_URL
         
         params = {
             'serviceKey': self.kstartup_service_key,
@@ -111,10 +194,13 @@ class IntegratedAutoSystem:
         try:
             logger.info(f"K-스타트업 API 호출 중: {start_date} ~ {end_date}")
             
-            response = self.session.get(api_url, params=params, timeout=30)
+            with self.metrics.timer('http.kstartup'):
+                response = self.session.get(api_url, params=params, timeout=30, validate=data_go_kr_ok)
+            self.metrics.incr('pages_fetched')
             
             if response.status_code == 200:
-                root = ET.fromstring(response.text)
+                with self.metrics.timer('parse.kstartup_xml'):
+                    root = ET.fromstring(response.text)
                 
                 # 오류 확인
                 if root.tag == 'OpenAPI_ServiceResponse':
@@ -125,13 +211,15 @@ class IntegratedAutoSystem:
                 
                 # 결과 추출
                 items = []
-                for item in root.findall('.//item'):
-                    item_data = {}
-                    for col in item.findall('col'):
-                        name = col.get('name')
-                        value = col.text if col.text else ''
-                        item_data[name] = value
-                    items.append(item_data)
+                with self.metrics.timer('parse.kstartup_xml'):
+                    for item in root.findall('.//item'):
+                        item_data = {}
+                        for col in item.findall('col'):
+                            name = col.get('name')
+                            value = col.text if col.text else ''
+                            item_data[name] = value
+                        items.append(item_data)
+                self.metrics.incr('items_parsed', len(items))
                 
                 logger.info(f"K-스타트업에서 {len(items)}개 공고 수집")
                 return items
@@ -145,7 +233,7 @@ class IntegratedAutoSystem:
     
     def fetch_bizinfo_announcements(self, page_index: int = 1, page_unit: int = 100) -> List[Dict]:
         """기업마당 API에서 공고 데이터를 가져옵니다."""
-        api_url = 'https://www.bizinfo.go.kr/uss/rss/bizinfoApi.do'
+        api_url = self.BIZINFO_API_URL
         
         params = {
             'crtfcKey': self.bizinfo_service_key,
@@ -157,10 +245,13 @@ class IntegratedAutoSystem:
         try:
             logger.info(f"기업마당 API 호출 중: 페이지 {page_index}")
             
-            response = self.session.get(api_url, params=params, timeout=30)
+            with self.metrics.timer('http.bizinfo'):
+                response = self.session.get(api_url, params=params, timeout=30, validate=bizinfo_ok)
+            self.metrics.incr('pages_fetched')
             
             if response.status_code == 200:
-                data = response.json()
+                with self.metrics.timer('parse.bizinfo_json'):
+                    data = response.json()
                 
                 # 다양한 응답 구조 처리
                 items = []
@@ -172,6 +263,7 @@ class IntegratedAutoSystem:
                     items = data
                 
                 if items:
+                    self.metrics.incr('items_parsed', len(items))
                     logger.info(f"기업마당에서 {len(items)}개 공고 수집")
                     return items
                 else:
@@ -185,8 +277,8 @@ class IntegratedAutoSystem:
             logger.error(f"기업마당 API 요청 오류: {str(e)}")
             return []
     
-    def collect_daily_announcements(self) -> Dict[str, List[Dict]]:
-        """매일 새로운 공고를 수집합니다."""
+    def fetch_daily_announcements(self) -> Dict[str, List[Dict]]:
+        """K-스타트업과 기업마당의 신규 공고를 동시에 가져오고 출처 간 유사 중복을 병합합니다 (파일 저장 없음)."""
         today = datetime.now()
         yesterday = today - timedelta(days=1)
         
@@ -195,27 +287,42 @@ class IntegratedAutoSystem:
         
         logger.info(f"매일 신규 공고 수집 시작: {start_date} ~ {end_date}")
         
-        # K-스타트업 신규 공고 수집
-        kstartup_announcements = self.fetch_kstartup_announcements(start_date, end_date)
-        
-        # 기업마당 신규 공고 수집
-        bizinfo_announcements = self.fetch_bizinfo_announcements()
-        
-        # 수집 결과 저장
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        if kstartup_announcements:
-            self.save_announcements_to_file(kstartup_announcements, f"kstartup_daily_new_{timestamp}", self.kstartup_data_dir)
-        
-        if bizinfo_announcements:
-            self.save_announcements_to_file(bizinfo_announcements, f"bizinfo_daily_new_{timestamp}", self.bizinfo_data_dir)
+        # 두 출처는 서로 독립적이므로 동시에 호출
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix='fetch') as pool:
+            kstartup_future = pool.submit(self.fetch_kstartup_announcements, start_date, end_date)
+            bizinfo_future = pool.submit(self.fetch_bizinfo_announcements)
+            kstartup_announcements = kstartup_future.result()
+            bizinfo_announcements = bizinfo_future.result()
+        
+        # 두 출처에 함께 올라온 같은 사업은 대표 레코드 하나로 병합 (대표는 먼저 나온 출처에 남김)
+        combined = kstartup_announcements + bizinfo_announcements
+        sources = ['kstartup'] * len(kstartup_announcements) + ['bizinfo'] * len(bizinfo_announcements)
+        with self.metrics.timer('dedup.near_duplicates'):
+            canonical = dedup_records(combined, sources=sources)
+        self.metrics.incr('duplicates_merged', len(combined) - len(canonical))
+        kstartup_announcements = [a for a in canonical if a['merged_sources'][0] == 'kstartup']
+        bizinfo_announcements = [a for a in canonical if a['merged_sources'][0] == 'bizinfo']
         
         return {
             'kstartup': kstartup_announcements,
             'bizinfo': bizinfo_announcements,
-            'timestamp': timestamp
+            'timestamp': datetime.now().strftime("%Y%m%d_%H%M%S")
         }
     
+    def collect_daily_announcements(self) -> Dict[str, List[Dict]]:
+        """매일 새로운 공고를 수집합니다."""
+        collection_result = self.fetch_daily_announcements()
+        timestamp = collection_result['timestamp']
+        
+        # 수집 결과 저장
+        if collection_result['kstartup']:
+            self.save_announcements_to_file(collection_result['kstartup'], f"kstartup_daily_new_{timestamp}", self.kstartup_data_dir)
+        
+        if collection_result['bizinfo']:
+            self.save_announcements_to_file(collection_result['bizinfo'], f"bizinfo_daily_new_{timestamp}", self.bizinfo_data_dir)
+        
+        return collection_result
+    
     def save_announcements_to_file(self, announcements: List[Dict], filename_prefix: str, data_dir: Path):
         """수집된 공고를 파일로 저장합니다."""
         if not announcements:
@@ -300,7 +407,10 @@ class IntegratedAutoSystem:
                     })
             
             # Supabase에 저장
-            result = self.supabase.table('announcements').insert(supabase_data).execute()
+            with self.metrics.timer('supabase.insert.announcements'):
+                result = self.supabase.table('announcements').insert(supabase_data).execute()
+            self.metrics.incr('rows_inserted', len(supabase_data))
+            record_writes('announcements', len(supabase_data))
             logger.info(f"Supabase에 {len(supabase_data)}개 공고 저장 완료")
             return True
             
@@ -402,19 +512,26 @@ class IntegratedAutoSystem:
         if not self.openai_api_key:
             logger.warning("OpenAI API 키가 설정되지 않았습니다.")
             return None
+        if not OPENAI_AVAILABLE:
+            logger.warning("openai 패키지가 설치되지 않았습니다.")
+            return None
         
         try:
             client = openai.OpenAI(api_key=self.openai_api_key)
             
-            response = client.chat.completions.create(
-                model=self.openai_model,
-                messages=[
-                    {"role": "system", "content": "당신은 정부 지원사업 추천 전문가입니다. 기업의 특성과 요구사항을 분석하여 가장 적합한 지원사업을 추천해주세요. 추천 개수에 제한이 없으므로 가능한 한 많은 공고를 추천해주세요. 신규 공고만 추천해주세요. 반드시 JSON 형식으로 응답해주세요."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=4000,
-                temperature=0.7
-            )
+            with self.metrics.timer('openai.chat'):
+                response = client.chat.completions.create(
+                    model=self.openai_model,
+                    messages=[
+                        {"role": "system", "content": "당신은 정부 지원사업 추천 전문가입니다. 기업의 특성과 요구사항을 분석하여 가장 적합한 지원사업을 추천해주세요. 추천 개수에 제한이 없으므로 가능한 한 많은 공고를 추천해주세요. 신규 공고만 추천해주세요. 반드시 JSON 형식으로 응답해주세요."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=4000,
+                    temperature=0.7
+                )
+            self.metrics.incr('openai_calls')
+            if getattr(response, 'usage', None):
+                self.metrics.incr('tokens_used', response.usage.total_tokens)
             
             return response.choices[0].message.content
         except Exception as e:
@@ -499,13 +616,104 @@ class IntegratedAutoSystem:
                 
                 # API 호출 간격 조절
                 if i < len(self.alpha_companies) - 1:
-                    time.sleep(2)  # 2초 대기
+                    time.sleep(self.LLM_CALL_INTERVAL_SEC)
                     
             except Exception as e:
                 logger.error(f"✗ {i+1}번 기업 신규 공고 추천 중 오류: {e}")
         
         return all_recommendations
     
+    # ------------------------------------------------------------------ 증분 추천
+    def _load_live_announcements(self) -> Dict[str, Dict[str, Any]]:
+        """{공고 id: {'deadline': ISO 또는 None, 'announcement': 원본}}"""
+        if not LIVE_ANNOUNCEMENTS_FILE.exists():
+            return {}
+        try:
+            return json.loads(LIVE_ANNOUNCEMENTS_FILE.read_text(encoding='utf-8'))
+        except Exception as e:
+            logger.warning(f"진행 중 공고 목록 읽기 실패: {e}")
+            return {}
+    
+    def _save_live_announcements(self):
+        tmp_path = LIVE_ANNOUNCEMENTS_FILE.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(self.live_announcements, ensure_ascii=False, default=str), encoding='utf-8')
+        tmp_path.replace(LIVE_ANNOUNCEMENTS_FILE)
+    
+    def _announcement_text(self, ann_id: str) -> str:
+        text = self._ann_text.get(ann_id)
+        if text is None:
+            announcement = self.live_announcements[ann_id]['announcement']
+            text = ' '.join(str(announcement.get(f) or '') for f in ANNOUNCEMENT_TEXT_FIELDS).lower()
+            self._ann_text[ann_id] = text
+        return text
+    
+    def rule_scorer(self, profile: Dict[str, Any], weights: Dict[str, Any], ann_ids: Optional[List[str]] = None):
+        """기업 키워드가 공고 제목/내용/대상에 나타나는 수로 채점합니다 (마감 임박 공고 우선)."""
+        keywords = profile_tokens(profile)
+        if not keywords:
+            return
+        for ann_id in (ann_ids if ann_ids is not None else list(self.live_announcements)):
+            text = self._announcement_text(ann_id)
+            hits = sorted(k for k in keywords if k in text)
+            if hits:
+                deadline = self.live_announcements[ann_id]['deadline'] or '9999-12-31'
+                yield ann_id, len(hits), ', '.join(hits[:5]), deadline
+    
+    def generate_incremental_recommendations(self, new_announcements: List[Dict]) -> Dict[str, Any]:
+        """
+        신규 공고만 규칙 기반으로 채점해 기업별 Top-K에 병합하고,
+        Top-K에 새 공고가 들어온 기업만 LLM으로 추천을 생성합니다.
+        """
+        # 마감된 공고 제거 (마감일 인덱스)
+        live_ids = list(self.live_announcements)
+        live_index = DeadlineIndex(pd.Series([self.live_announcements[i]['deadline'] for i in live_ids], dtype=object))
+        expired = [live_ids[p] for p in live_index.expired_positions()]
+        for ann_id in expired:
+            del self.live_announcements[ann_id]
+            self._ann_text.pop(ann_id, None)
+        
+        # 오늘 수집분 중 진행 중인 공고만 반영
+        deadlines = [announcement_deadline(a) for a in new_announcements]
+        delta = {}
+        for p in DeadlineIndex(pd.Series(deadlines, dtype=object)).active_positions():
+            announcement, deadline = new_announcements[p], deadlines[p]
+            ann_id = announcement_id(announcement)
+            delta[ann_id] = fingerprint(announcement)
+            self.live_announcements[ann_id] = {'deadline': deadline, 'announcement': announcement}
+            self._ann_text.pop(ann_id, None)
+        self._save_live_announcements()
+        
+        companies, positions = {}, {}
+        for i in range(len(self.alpha_companies)):
+            company_info = self.get_company_info(i)
+            key = f"company_{i+1}"
+            companies[key] = company_info
+            positions[key] = i
+        
+        gained = self.topk.merge_delta(companies, RULE_WEIGHTS, self.rule_scorer, delta, expired)
+        self.metrics.incr('delta_announcements', len(delta))
+        self.metrics.incr('companies_flagged', len(gained))
+        logger.info(f"신규 공고 {len(delta)}건 중 Top-K 변동 기업 {len(gained)}/{len(companies)}개 → LLM 추천 대상")
+        
+        all_recommendations = {}
+        for n, (key, ann_ids) in enumerate(gained.items()):
+            try:
+                candidates = [self.live_announcements[a]['announcement'] for a in ann_ids if a in self.live_announcements]
+                recommendations = self.generate_recommendations_for_company(positions[key], candidates)
+                if recommendations:
+                    all_recommendations[key] = recommendations
+                    logger.info(f"✓ {key} 신규 공고 추천 완료 (Top-K 신규 {len(ann_ids)}건)")
+                else:
+                    logger.warning(f"✗ {key} 신규 공고 추천 실패")
+                
+                # API 호출 간격 조절
+                if n < len(gained) - 1:
+                    time.sleep(self.LLM_CALL_INTERVAL_SEC)
+            except Exception as e:
+                logger.error(f"✗ {key} 신규 공고 추천 중 오류: {e}")
+        
+        return all_recommendations
+    
     def save_recommendations_to_supabase(self, recommendations: Dict[str, Any], timestamp: str) -> bool:
         """추천 결과를 Supabase에 저장합니다."""
         if not self.supabase or not recommendations:
@@ -539,7 +747,10 @@ class IntegratedAutoSystem:
                     })
             
             # Supabase에 저장
-            result = self.supabase.table('recommendations').insert(supabase_data).execute()
+            with self.metrics.timer('supabase.insert.recommendations'):
+                result = self.supabase.table('recommendations').insert(supabase_data).execute()
+            self.metrics.incr('rows_inserted', len(supabase_data))
+            record_writes('recommendations', len(supabase_data))
             logger.info(f"Supabase에 {len(supabase_data)}개 추천 저장 완료")
             return True
             
@@ -548,140 +759,118 @@ class IntegratedAutoSystem:
             return False
     
     def save_recommendations_to_file(self, recommendations: Dict[str, Any], timestamp: str):
-        """추천 결과를 파일로 저장합니다."""
+        """추천 결과를 파일로 저장합니다 (평평한 표 한 번 생성 → EXPORT_FORMATS 형식으로 저장)."""
         if not recommendations:
             logger.warning("저장할 추천 결과가 없습니다.")
             return
         
-        # Excel 파일 저장
-        excel_file = self.data_dir / f"신규공고_맞춤추천_{timestamp}.xlsx"
-        with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
-            for company_key, data in recommendations.items():
-                company_info = data['company_info']
-                recs = data['recommendations']
-                
-                # 추천 정보를 가로로 배치
-                rec_data = {
-                    '구분': ['추천점수', '공고이름', '추천이유', '모집일', '마감일', '남은기간/마감여부', '투자금액', '투자금액사용처', '공고상태', '공고연도', '공고월']
-                }
-                
-                # 각 추천별로 열 추가
-                for i, rec in enumerate(recs):
-                    rec_data[f'추천 {i+1}'] = [
-                        rec.get('추천점수', ''),
-                        rec.get('공고이름', ''),
-                        rec.get('추천이유', ''),
-                        rec.get('모집일', ''),
-                        rec.get('마감일', ''),
-                        rec.get('남은기간', ''),
-                        rec.get('투자금액', ''),
-                        rec.get('투자금액사용처', ''),
-                        rec.get('공고상태', ''),
-                        rec.get('공고연도', ''),
-                        rec.get('공고월', '')
-                    ]
-                
-                # 추천 정보 DataFrame
-                rec_df = pd.DataFrame(rec_data)
-                
-                # 시트 이름
-                sheet_name = f"No.{company_info['no']} company"
-                
-                # 추천 정보 저장
-                rec_df.to_excel(writer, sheet_name=sheet_name, index=False)
-        
-        logger.info(f"Excel 파일 저장 완료: {excel_file}")
-        
-        # CSV 파일 저장
-        csv_file = self.data_dir / f"신규공고_맞춤추천_{timestamp}.csv"
-        all_data = []
-        for company_key, data in recommendations.items():
-            company_info = data['company_info']
-            recs = data['recommendations']
-            
-            for i, rec in enumerate(recs):
-                row = {
-                    '기업번호': company_info['no'],
-                    '기업명': company_info['business_description'],
-                    '추천순위': i + 1,
-                    '추천점수': rec.get('추천점수', ''),
-                    '공고이름': rec.get('공고이름', ''),
-                    '추천이유': rec.get('추천이유', ''),
-                    '모집일': rec.get('모집일', ''),
-                    '마감일': rec.get('마감일', ''),
-                    '남은기간/마감여부': rec.get('남은기간', ''),
-                    '투자금액': rec.get('투자금액', ''),
-                    '투자금액사용처': rec.get('투자금액사용처', ''),
-                    '공고상태': rec.get('공고상태', ''),
-                    '공고연도': rec.get('공고연도', ''),
-                    '공고월': rec.get('공고월', ''),
-                    '생성일시': data['generated_at']
-                }
-                all_data.append(row)
-        
-        df = pd.DataFrame(all_data)
-        df.to_csv(csv_file, index=False, encoding='utf-8-sig')
-        logger.info(f"CSV 파일 저장 완료: {csv_file}")
+        return export_recommendations(recommendations, self.data_dir, f"신규공고_맞춤추천_{timestamp}",
+                                      EXPORT_FORMATS, per_company_sheets=EXPORT_PER_COMPANY_SHEETS)
+    
+    def _run_stage(self, name: str, func, *args):
+        """단계를 실행하고 소요 시간을 stage.<name> 타이머에 기록합니다."""
+        with self.metrics.timer(f'stage.{name}'):
+            return func(*args)
     
     def daily_job(self):
-        """매일 실행되는 작업"""
+        """
+        매일 실행되는 작업
+        
+        두 출처를 동시에 수집하고, 파일/Supabase 저장은 백그라운드 작업자에서 처리하는 동안
+        바로 추천 생성을 시작합니다. 전체 소요 시간은 단계 합계가 아니라 가장 느린 경로에 가깝습니다.
+        """
         logger.info("=== 매일 신규 공고 수집 및 맞춤 추천 작업 시작 ===")
         
+        self.metrics = PipelineMetrics('daily_job')
+        status = 'success'
+        
+        cache = getattr(self.session, 'cache', None)
+        cache_hits_before = cache.stats['hits'] + cache.stats['revalidated'] if cache else 0
+        
         try:
-            # 1. 신규 공고 수집
-            collection_result = self.collect_daily_announcements()
-            
-            # 2. 수집된 공고를 Supabase에 저장
-            if collection_result['kstartup']:
-                self.save_announcements_to_supabase(collection_result['kstartup'], 'kstartup')
-            
-            if collection_result['bizinfo']:
-                self.save_announcements_to_supabase(collection_result['bizinfo'], 'bizinfo')
-            
-            # 3. 모든 신규 공고 통합
-            all_new_announcements = collection_result['kstartup'] + collection_result['bizinfo']
-            
-            if not all_new_announcements:
-                logger.info("오늘 새로운 공고가 없습니다.")
-                return
-            
-            logger.info(f"총 {len(all_new_announcements)}개의 신규 공고를 수집했습니다.")
-            
-            # 4. 모든 기업에 대한 맞춤 추천 생성
-            recommendations = self.generate_all_recommendations(all_new_announcements)
-            
-            if recommendations:
-                # 5. 추천 결과를 Supabase에 저장
-                self.save_recommendations_to_supabase(recommendations, collection_result['timestamp'])
+            with ThreadPoolExecutor(max_workers=4, thread_name_prefix='storage') as storage:
+                storage_futures = {}
                 
-                # 6. 추천 결과를 파일로 저장
-                self.save_recommendations_to_file(recommendations, collection_result['timestamp'])
+                # 1. 신규 공고 수집 (K-스타트업 / 기업마당 동시)
+                collection_result = self._run_stage('collect', self.fetch_daily_announcements)
+                timestamp = collection_result['timestamp']
                 
-                logger.info(f"총 {len(recommendations)}개 기업에 대한 신규 공고 맞춤 추천이 완료되었습니다.")
-            else:
-                logger.warning("추천 생성에 실패했습니다.")
+                # 2. 수집된 공고 저장 (파일 + Supabase, 백그라운드)
+                for source, data_dir in [('kstartup', self.kstartup_data_dir), ('bizinfo', self.bizinfo_data_dir)]:
+                    announcements = collection_result[source]
+                    if not announcements:
+                        continue
+                    storage_futures[f'save_{source}_files'] = storage.submit(
+                        self._run_stage, f'save_{source}_files',
+                        self.save_announcements_to_file, announcements, f"{source}_daily_new_{timestamp}", data_dir)
+                    storage_futures[f'save_{source}_supabase'] = storage.submit(
+                        self._run_stage, f'save_{source}_supabase',
+                        self.save_announcements_to_supabase, announcements, source)
+                
+                # 3. 모든 신규 공고 통합
+                all_new_announcements = collection_result['kstartup'] + collection_result['bizinfo']
+                
+                if not all_new_announcements:
+                    logger.info("오늘 새로운 공고가 없습니다.")
+                else:
+                    logger.info(f"총 {len(all_new_announcements)}개의 신규 공고를 수집했습니다.")
+                    
+                    # 4. 저장을 기다리지 않고 맞춤 추천 생성
+                    recommend = (self.generate_incremental_recommendations if RECOMMEND_MODE == 'incremental'
+                                 else self.generate_all_recommendations)
+                    recommendations = self._run_stage('recommend', recommend, all_new_announcements)
+                    
+                    if recommendations:
+                        # 5-6. 추천 결과를 Supabase와 파일에 저장 (백그라운드)
+                        storage_futures['save_recommendations_supabase'] = storage.submit(
+                            self._run_stage, 'save_recommendations_supabase',
+                            self.save_recommendations_to_supabase, recommendations, timestamp)
+                        storage_futures['save_recommendations_files'] = storage.submit(
+                            self._run_stage, 'save_recommendations_files',
+                            self.save_recommendations_to_file, recommendations, timestamp)
+                        
+                        logger.info(f"총 {len(recommendations)}개 기업에 대한 신규 공고 맞춤 추천이 완료되었습니다.")
+                    else:
+                        logger.warning("추천 생성에 실패했습니다.")
+                
+                # 백그라운드 저장 완료 대기
+                for name, future in storage_futures.items():
+                    try:
+                        future.result()
+                    except Exception as e:
+                        status = 'partial'
+                        logger.error(f"{name} 단계 오류: {e}")
                 
         except Exception as e:
+            status = 'failed'
             logger.error(f"매일 작업 중 오류 발생: {e}")
+        
+        # 대시보드 롤업 갱신
+        if self.supabase:
+            try:
+                with self.metrics.timer('supabase.dashboard_rollup'):
+                    refresh_rollup(self.supabase)
+            except Exception as e:
+                logger.warning(f"대시보드 롤업 갱신 실패: {e}")
+        
+        # 이번 실행의 응답 캐시 적중 수
+        if cache is not None:
+            self.metrics.incr('cache_hits', cache.stats['hits'] + cache.stats['revalidated'] - cache_hits_before)
+        
+        logger.info("=== 실행 요약 ===\n" + self.metrics.format_summary())
+        return self.metrics.flush(status=status)
     
     def start_scheduler(self):
         """스케줄러를 시작합니다."""
         logger.info("매일 아침 9시 신규 공고 수집 및 맞춤 추천 스케줄러 시작")
         
-        # 매일 오전 9시에 실행
-        schedule.every().day.at("09:00").do(self.daily_job)
-        
-        # 즉시 한 번 실행 (테스트용)
-        logger.info("테스트를 위해 즉시 실행합니다...")
-        self.daily_job()
+        # 매일 오전 9시에 실행, 테스트를 위해 시작 시 즉시 한 번 실행
+        scheduler = AsyncScheduler()
+        scheduler.add_job('integrated_daily', self.daily_job, '0 9 * * *',
+                          category='recommendation', run_on_start=True)
         
-        # 스케줄러 실행
-        try:
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # 1분마다 체크
-        except KeyboardInterrupt:
-            logger.info("스케줄러를 종료합니다.")
+        # 스케줄러 실행 (Ctrl+C로 종료)
+        scheduler.start()
 
 def main():
     """메인 실행 함수"""
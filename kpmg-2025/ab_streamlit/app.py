@@ -1,5 +1,5 @@
 # app.py — Alpha Advisors (Autoload, Fail-Safe)
-import os, re, glob, html
+import os, re, glob, html, sys, io
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -18,6 +18,25 @@ st.caption("업로드 없이도 ./data 폴더의 CSV/XLSX를 자동으로 읽어
 BASE_DIR = os.path.dirname(__file__)
 DATA_DIR = os.path.join(BASE_DIR, "data")
 
+# 저장소 루트의 공용 모듈 (amount_parser 등)
+sys.path.append(os.path.abspath(os.path.join(BASE_DIR, "..", "..")))
+from amount_parser import parse_amounts, budget_bands
+from date_normalizer import normalize_dates, to_iso_strings, dday_series
+from ingest_cache import IngestCache, file_signature, row_keys
+from table_loader import load_table
+from compact_table import CompactAnnouncements
+from matcher import score_matches
+from topk_store import TopKStore, fingerprint
+from deadline_index import DeadlineIndex
+from rerun_profiler import start_rerun_profile
+from pagination import shown_count, load_more
+
+# 재실행 프로파일링 (?profile=1 또는 STREAMLIT_PROFILE=1일 때만 동작)
+profiler = start_rerun_profile("ab_streamlit")
+
+# 부분 재실행 영역: 안쪽 위젯을 조작하면 해당 함수만 다시 실행 (st.fragment가 없는 버전은 전체 재실행)
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
 # (선택) 네 맥 경로들 — 여기에 파일이 있으면 자동 후보에 포함
 ABS_CANDIDATES = [
     "/Users/minkim/git_test/kpmg-2025/ab_streamlit/2년치 공고 수집 (4).xlsx",
@@ -28,20 +47,9 @@ ABS_CANDIDATES = [
 # -------------------------------------------------
 # IO helpers
 # -------------------------------------------------
-@st.cache_data
 def read_table(path):
-    """CSV 또는 XLSX를 DataFrame으로 읽기 (인코딩/확장자 자동)."""
-    p = str(path)
-    try:
-        if p.lower().endswith((".xls", ".xlsx")):
-            return pd.read_excel(p)
-        # CSV: UTF-8 → CP949 순서로 시도
-        try:
-            return pd.read_csv(p, encoding="utf-8-sig")
-        except Exception:
-            return pd.read_csv(p, encoding="cp949")
-    except Exception as e:
-        raise e
+    """CSV 또는 XLSX를 DataFrame으로 읽기 (인코딩 판별 후 한 번에 파싱). 캐시는 IngestCache가 담당."""
+    return load_table(path)
 
 def normalize_delimited(val):
     if pd.isna(val): return []
@@ -65,59 +73,6 @@ def find_col(df, candidates):
                 return cols[i]
     return None
 
-def to_date(val):
-    if pd.isna(val): return ""
-    s = str(val).strip()
-    m = re.findall(r"(20\d{2}[-./]\d{1,2}[-./]\d{1,2})", s)
-    if m:
-        d = m[-1].replace(".", "-").replace("/", "-")
-        try:
-            y, mn, dd = [int(x) for x in d.split("-")]
-            return f"{y:04d}-{mn:02d}-{dd:02d}"
-        except: pass
-    try:
-        if re.fullmatch(r"\d{8}", s):  # yyyymmdd
-            return f"{s[:4]}-{s[4:6]}-{s[6:8]}"
-        return pd.to_datetime(s).date().isoformat()
-    except:
-        return ""
-
-def extract_amount_krw(val):
-    if pd.isna(val): return np.nan
-    s = str(val).replace(",", "")
-    try:
-        m = re.findall(r"(\d+(?:\.\d+)?)\s*억", s)
-        if m: return int(float(m[0]) * 100_000_000)
-        if "천만" in s:
-            m = re.findall(r"(\d+(?:\.\d+)?)", s)
-            if m: return int(float(m[0]) * 10_000_000)
-        if "만" in s:
-            m = re.findall(r"(\d+(?:\.\d+)?)", s)
-            if m: return int(float(m[0]) * 1_000_000)
-        m = re.findall(r"(\d{5,})", s)
-        if m: return int(m[0])
-    except: pass
-    return np.nan
-
-def budget_band(amount):
-    if pd.isna(amount): return ""
-    try:
-        a = float(amount)
-        if a >= 100_000_000: return "대형"
-        if a >= 40_000_000: return "중간"
-        return "소액"
-    except: return ""
-
-def inter(a, b):
-    A = set([x.strip() for x in (a or []) if x])
-    return sum(1 for x in (b or []) if x.strip() in A)
-
-def dday(ds):
-    if not ds: return ""
-    try:
-        return max(0, (pd.to_datetime(ds).date() - date.today()).days)
-    except: return ""
-
 # -------------------------------------------------
 # Normalizers
 # -------------------------------------------------
@@ -154,14 +109,19 @@ def normalize_announcements(df):
     else:
         out["yearsMax"] = np.nan
 
-    out["dueDate"] = (df[col["dueDate"]].map(to_date) if col["dueDate"] else "")
-    out["infoSessionDate"] = (df[col["infoSessionDate"]].map(to_date) if col["infoSessionDate"] else "")
-    out["amountKRW"] = df[col["amountKRW"]].map(extract_amount_krw) if col["amountKRW"] else np.nan
+    # 날짜는 로드 시 한 번만 파싱: 표시/정렬용 문자열 + 계산용 datetime 컬럼
+    def _dates(key):
+        if col[key]: return normalize_dates(df[col[key]])
+        return pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns]")
+    out["dueTs"] = _dates("dueDate")
+    out["dueDate"] = to_iso_strings(out["dueTs"])
+    out["infoSessionDate"] = to_iso_strings(_dates("infoSessionDate"))
+    out["amountKRW"] = parse_amounts(df[col["amountKRW"]])["amount"].astype(float) if col["amountKRW"] else np.nan
     out["allowedUses"] = df[col["allowedUses"]].map(normalize_delimited) if col["allowedUses"] else [[] for _ in range(len(df))]
     out["keywords"] = df[col["keywords"]].map(normalize_delimited) if col["keywords"] else [[] for _ in range(len(df))]
-    out["budgetBand"] = df[col["budgetBand"]] if col["budgetBand"] else out["amountKRW"].map(budget_band)
+    out["budgetBand"] = df[col["budgetBand"]] if col["budgetBand"] else budget_bands(out["amountKRW"])
     out["updateType"] = df[col["updateType"]] if col["updateType"] else ""
-    out["updatedAt"] = df[col["updatedAt"]].map(to_date) if col["updatedAt"] else ""
+    out["updatedAt"] = to_iso_strings(_dates("updatedAt"))
     out["url"] = df[col["url"]] if col["url"] else ""
     return out.fillna({"agency":"", "source":"", "budgetBand":"", "updateType":"", "updatedAt":"", "url":""})
 
@@ -188,12 +148,8 @@ def normalize_companies(df):
         out["years"] = df[col["years"]].map(lambda x: pd.to_numeric(x, errors="coerce")).fillna(1).astype(int)
     else:
         if col["founded"]:
-            def _years_from_found(x):
-                try:
-                    d = pd.to_datetime(str(x)).date()
-                    return max(0, date.today().year - d.year)
-                except: return 1
-            out["years"] = df[col["founded"]].map(_years_from_found)
+            founded = normalize_dates(df[col["founded"]])
+            out["years"] = (date.today().year - founded.dt.year).clip(lower=0).fillna(1).astype(int)
         else:
             out["years"] = 1
 
@@ -217,7 +173,8 @@ def normalize_companies(df):
 # -------------------------------------------------
 # Discovery (무조건 찾는 버전)
 # -------------------------------------------------
-def discover_files_ci():
+@st.cache_data(show_spinner=False)
+def _discover_files(data_dir_mtime, abs_present):
     """data/와 ABS_CANDIDATES에서 파일 수집 → 이름 기반으로 분류 + 전체 목록 반환"""
     files = []
     if os.path.isdir(DATA_DIR):
@@ -238,17 +195,50 @@ def discover_files_ci():
     ann_files  = [f for f in files if is_ann(os.path.basename(f))]
     return sorted(set(comp_files)), sorted(set(ann_files)), files
 
+def discover_files_ci():
+    """폴더 mtime이 바뀌었을 때만 다시 탐색합니다."""
+    mtime = os.stat(DATA_DIR).st_mtime_ns if os.path.isdir(DATA_DIR) else 0
+    return _discover_files(mtime, tuple(os.path.exists(p) for p in ABS_CANDIDATES))
+
+# -------------------------------------------------
+# Ingestion cache (파일별 정규화 결과를 (경로, mtime, 크기) 키로 저장)
+# -------------------------------------------------
+# normalize_* 출력 스키마가 바뀌면 올려서 디스크 캐시를 무효화
+NORMALIZE_VERSION = 2
+INGEST = IngestCache(os.path.join(BASE_DIR, ".ingest_cache"), schema_version=NORMALIZE_VERSION)
+
+def load_normalized(path, kind):
+    normalizer = normalize_announcements if kind == "ann" else normalize_companies
+    return INGEST.load(path, kind, read_table, normalizer)
+
+def source_signatures(files):
+    sigs = []
+    for f in files:
+        try: sigs.append(file_signature(f))
+        except OSError: continue
+    return tuple(sigs)
+
+@st.cache_data(show_spinner=False)
+def _normalize_upload(kind, name, data):
+    buf = io.BytesIO(data); buf.name = name
+    df = read_table(buf)
+    return normalize_announcements(df) if kind == "ann" else normalize_companies(df)
+
 def load_companies_df(up_file=None):
     """업로드 > 이름매칭 > 컬럼추정 > 마지막엔 '아무 파일이나' 시도."""
     if up_file is not None:
-        return normalize_companies(read_table(up_file))
+        return _normalize_upload("comp", up_file.name, up_file.getvalue())
 
     comp_files, ann_files, all_files = discover_files_ci()
+    return _load_companies_cached(source_signatures(all_files), tuple(comp_files), tuple(all_files))
 
+@st.cache_data(show_spinner=False)
+def _load_companies_cached(signatures, comp_files, all_files):
+    """signatures(파일 mtime/크기)가 그대로면 재실행 시 I/O 없이 반환됩니다."""
     # 1) 이름 매칭 파일
     for f in comp_files:
         try:
-            return normalize_companies(read_table(f))
+            return load_normalized(f, "comp")
         except Exception:
             continue
 
@@ -257,7 +247,7 @@ def load_companies_df(up_file=None):
         try:
             df = read_table(f)
             if find_col(df, ["name","회사명","기업명","고객사"]):
-                return normalize_companies(df)
+                return load_normalized(f, "comp")
         except Exception:
             continue
 
@@ -265,23 +255,36 @@ def load_companies_df(up_file=None):
     if all_files:
         st.warning(f"⚠️ 고객사 파일명을 인식하지 못했습니다. 임시로 첫 파일을 고객사로 가정하여 로드합니다: {os.path.basename(all_files[0])}")
         try:
-            return normalize_companies(read_table(all_files[0]))
+            return load_normalized(all_files[0], "comp")
         except Exception:
             pass
 
     raise FileNotFoundError("Companies 데이터 소스를 찾지 못했습니다. data/ 폴더에 고객사 CSV/XLSX를 넣고 파일명에 'companies' 또는 '고객사'를 포함시키세요.")
 
+def compact_announcements(df):
+    """해시 키로 중복 제거 → 행 키(rowKey) 부여 → 범주형/CSR 압축 테이블."""
+    keys = row_keys(df)
+    keep = ~keys.duplicated().to_numpy()
+    df = df.loc[keep].copy()
+    df["rowKey"] = [f"{k:016x}" for k in keys.to_numpy()[keep]]
+    return CompactAnnouncements.from_frame(df)
+
 def load_announcements_df(up_file=None):
     if up_file is not None:
-        return normalize_announcements(read_table(up_file))
+        return compact_announcements(_normalize_upload("ann", up_file.name, up_file.getvalue()))
 
     comp_files, ann_files, all_files = discover_files_ci()
+    return _load_announcements_cached(source_signatures(all_files), tuple(ann_files), tuple(all_files))
+
+@st.cache_data(show_spinner=False)
+def _load_announcements_cached(signatures, ann_files, all_files):
+    """파일별 정규화 결과(디스크 캐시)를 합치고 해시 키로 중복 제거 → 범주형/CSR 압축 테이블."""
     frames = []
 
     # 1) 이름 매칭되는 공고 파일들
     for f in ann_files:
         try:
-            frames.append(read_table(f))
+            frames.append(load_normalized(f, "ann"))
         except Exception:
             continue
 
@@ -289,62 +292,50 @@ def load_announcements_df(up_file=None):
     if not frames:
         for f in all_files:
             try:
-                frames.append(read_table(f))
+                frames.append(load_normalized(f, "ann"))
             except Exception:
                 continue
 
     if frames:
-        df = pd.concat(frames, ignore_index=True).drop_duplicates()
-        return normalize_announcements(df)
+        df = pd.concat(frames, ignore_index=True)
+        return compact_announcements(df)
 
     raise FileNotFoundError("Announcements 데이터 소스를 찾지 못했습니다. data/에 공고 CSV/XLSX를 넣고 파일명에 'ann'/'bizinfo'/'KS_' 또는 '공고'를 포함시키세요.")
 
 # -------------------------------------------------
 # Matching
 # -------------------------------------------------
-def compute(profile, anns, w):
-    out = []
-    for _, a in anns.iterrows():
-        rs = []
-        years_ok = True
-        if not pd.isna(a.get("yearsMax")):
-            try: years_ok = int(profile["years"]) <= int(a.get("yearsMax"))
-            except: years_ok = True
-        rs.append(f"업력 {'적합' if years_ok else '초과'}({profile['years']}≤{a.get('yearsMax','-')})")
-
-        stage_ok = (a.get("stage","") == profile.get("stage","")) or (a.get("stage","") == "초기" and profile.get("stage","") == "예비")
-        rs.append(f"단계 {'적합' if stage_ok else '불일치'}({profile.get('stage','')}↔{a.get('stage','')})")
-
-        region_ok = (a.get("region","전국") == "전국") or (str(profile.get("region","")) in str(a.get("region","전국")))
-        rs.append(f"지역 {'적합' if region_ok else '제한'}({profile.get('region','')}⊆{a.get('region','')})")
-
-        kw = inter(profile.get("keywords",[]), a.get("keywords",[]))
-        rs.append(f"{'키워드 교집합' if kw>0 else '키워드 없음'} {kw if kw>0 else ''}".strip())
-
-        budget_ok = (not a.get("budgetBand")) or (a.get("budgetBand") == profile.get("preferredBudget",""))
-        rs.append(f"{'예산 선호' if budget_ok else '예산 불일치'}({profile.get('preferredBudget','')})")
-
-        use_overlap = inter(profile.get("preferredUses",[]), a.get("allowedUses",[]))
-        rs.append(f"{'사용처 매칭' if use_overlap>0 else '사용처 없음'} {use_overlap if use_overlap>0 else ''}".strip())
-
-        score = (
-            (kw and (kw / max(3, len(profile.get('keywords',[])))) or 0) * w["keywords"] +
-            (w["stage"] if stage_ok else 0) +
-            (w["region"] if region_ok else 0) +
-            (w["budget"] if budget_ok else 0) +
-            (use_overlap and (use_overlap / max(3, len(profile.get('preferredUses',[])))) or 0) * w["use"]
-        )
-        score = int(round(score))
-        hard_fail = (not years_ok) or ((not region_ok) and a.get("region","전국")!="전국") or (kw==0 and use_overlap==0)
-        lbl = "불가" if hard_fail else ("가능" if score>=80 else ("주의" if score>=50 else "불가"))
-        out.append({"ann": a, "score": score, "label": lbl, "rationale": rs})
-    return out
-
-def add_days(ds, n):
-    try:
-        d = pd.to_datetime(ds).date()
-        return (d + timedelta(days=n)).isoformat()
-    except: return ""
+def make_scorer(table, show_blocked):
+    """TopKStore용 scorer: (rowKey, 점수, 라벨, 마감일 키)를 table 순서대로 반환."""
+    def scorer(profile, weights, ann_ids=None):
+        t = table if ann_ids is None else table.take(topk_positions(table, ann_ids))
+        s = score_matches(profile, t, weights)
+        if not show_blocked:
+            s = s[s["label"] != "불가"]
+        return zip(t.frame["rowKey"].to_numpy()[s.index], s["score"], s["label"], s["dueKey"])
+    return scorer
+
+def topk_positions(table, ann_ids):
+    pos = pd.Index(table.frame["rowKey"]).get_indexer(list(ann_ids))
+    return pos[pos >= 0]
+
+def build_match(profile, table, pos, s):
+    """화면에 표시할 추천 1건 (사유 문자열은 상위 결과에 대해서만 생성)."""
+    a = table.row(pos)
+    kw, use_overlap = int(s["kw"]), int(s["use_overlap"])
+    rs = [
+        f"업력 {'적합' if s['years_ok'] else '초과'}({profile['years']}≤{a.get('yearsMax','-')})",
+        f"단계 {'적합' if s['stage_ok'] else '불일치'}({profile.get('stage','')}↔{a.get('stage','')})",
+        f"지역 {'적합' if s['region_ok'] else '제한'}({profile.get('region','')}⊆{a.get('region','')})",
+        f"{'키워드 교집합' if kw>0 else '키워드 없음'} {kw if kw>0 else ''}".strip(),
+        f"{'예산 선호' if s['budget_ok'] else '예산 불일치'}({profile.get('preferredBudget','')})",
+        f"{'사용처 매칭' if use_overlap>0 else '사용처 없음'} {use_overlap if use_overlap>0 else ''}".strip(),
+    ]
+    return {"ann": a, "score": int(s["score"]), "label": s["label"], "rationale": rs}
+
+def add_days(ts, n):
+    if pd.isna(ts): return ""
+    return (ts + timedelta(days=n)).date().isoformat()
 
 def money(n):
     if pd.isna(n) or n in [None,"","nan"]: return "-"
@@ -364,7 +355,7 @@ def row_html(m):
     kind = "ok" if m["label"]=="가능" else ("warn" if m["label"]=="주의" else "bad")
     uses = ", ".join((a.get("allowedUses") or [])[:3])
     info = f"설명회 {a.get('infoSessionDate','')}" if a.get("infoSessionDate") else ""
-    dday_str = f"D-{dday(a.get('dueDate'))}" if a.get("dueDate") else ""
+    dday_str = f"D-{a.get('dday')}" if a.get("dueDate") else ""
     rationale_list = "".join([f"<li>{html.escape(r)}</li>" for r in m["rationale"][:3]])
     url = a.get("url","")
     link_html = f'<a href="{html.escape(url)}" target="_blank">공고 링크</a>' if url else ""
@@ -390,23 +381,59 @@ def row_html(m):
     """
 
 # -------------------------------------------------
-# Sidebar – Upload(선택) + Weights + Debug
+# Weights (추천 영역 fragment 안의 슬라이더, 값은 session_state에 보관)
 # -------------------------------------------------
+# (키, 라벨, 최대값, 기본값)
+WEIGHT_SLIDERS = [("keywords","키워드",60,40), ("stage","단계",30,15), ("region","지역",30,10),
+                  ("budget","예산",30,15), ("use","사용처",30,20)]
+SCORED_CACHE_SIZE = 64
+# 고객사별 추천 수 (제품 기준 Top-10) / 화면에는 이 안에서 '더 보기'로 5건씩
+TOPK_SIZE = 10
+RECOMMENDATION_PAGE_SIZE = 5
+
+def current_weights():
+    """현재 가중치와 '불가 포함' 여부 (위젯이 아직 그려지지 않았으면 기본값)."""
+    w = {k: st.session_state.get(f"w_{k}", default) for k, _, _, default in WEIGHT_SLIDERS}
+    return w, bool(st.session_state.get("show_blocked", False))
+
+def scored_top(store, ann_token, table, C, w, show_blocked):
+    """
+    (고객사, 가중치) 단위 Top-K 후보를 세션에 보관하고 (캐시 키, 후보)를 반환합니다.
+    슬라이더를 움직였다가 이전 값으로 돌아오거나 고객사를 오가도 다시 채점하지 않음.
+    화면용 추천(사유 포함)은 visible_matches에서 보이는 만큼만 만듭니다.
+    """
+    weights_profile = {**w, "show_blocked": show_blocked}
+    key = (str(C["name"]), fingerprint(weights_profile), fingerprint(C), ann_token)
+    cache = st.session_state.setdefault("scored_top", {})
+    if key not in cache:
+        entries = store.get(str(C["name"]), C, weights_profile, make_scorer(table, show_blocked))
+        cache[key] = {"table": table.take(topk_positions(table, [e["id"] for e in entries])), "matches": []}
+        while len(cache) > SCORED_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+    return key, cache[key]
+
+def visible_matches(C, w, top, n):
+    """후보 중 앞의 n건만 사유까지 만들어 반환 (이미 만든 건은 재사용, 뒤 페이지는 '더 보기' 때 생성)."""
+    matches = top["matches"]
+    n = min(n, len(top["table"]))
+    if len(matches) < n:
+        rest = top["table"].take(np.arange(len(matches), n))
+        scored = score_matches(C, rest, w)
+        matches.extend(build_match(C, rest, pos, scored.loc[pos]) for pos in range(len(rest)))
+    return matches[:n]
+
+# -------------------------------------------------
+# Sidebar – Upload(선택) + 공고 범위 + Debug
+# -------------------------------------------------
+profiler.mark("sidebar")
 with st.sidebar:
     st.header("1) 데이터 소스 (업로드는 선택)")
     up_comp = st.file_uploader("Companies CSV/XLSX", type=["csv","xlsx","xls"], key="up_comp")
     up_anns = st.file_uploader("Announcements CSV/XLSX", type=["csv","xlsx","xls"], key="up_anns")
 
     st.markdown("---")
-    st.header("2) 가중치 (W)")
-    w = {
-        "keywords": st.slider("키워드", 0, 60, 40, 1),
-        "stage": st.slider("단계", 0, 30, 15, 1),
-        "region": st.slider("지역", 0, 30, 10, 1),
-        "budget": st.slider("예산", 0, 30, 15, 1),
-        "use": st.slider("사용처", 0, 30, 20, 1),
-    }
-    show_blocked = st.checkbox("불가 포함 보기", value=False)
+    st.header("2) 공고 범위")
+    show_closed = st.checkbox("마감 공고 포함", value=False)
 
     # Debug: 무엇을 찾았는지 확인
     comp_candidates, ann_candidates, all_files = [], [], []
@@ -419,22 +446,51 @@ with st.sidebar:
                   "ann_candidates": ann_candidates,
                   "all_files": all_files})
 
+# -------------------------------------------------
+# Top-K store (공고 집합마다 1개, .ingest_cache/topk_<토큰>.json에 저장)
+# -------------------------------------------------
+TOPK_STORES_KEPT = 4
+
+def announcement_token(table):
+    """공고 집합 토큰 (rowKey 목록 해시) — 같은 공고 집합을 보는 세션은 같은 저장소를 공유."""
+    return str(pd.util.hash_pandas_object(table.frame["rowKey"], index=False).sum())
+
+@st.cache_resource(max_entries=TOPK_STORES_KEPT)
+def get_topk_store(ann_token, _keys):
+    """공고 집합 토큰별 저장소 (세션 간 공유, 변경은 TopKStore 내부 잠금으로 직렬화)."""
+    cache_dir = os.path.join(BASE_DIR, ".ingest_cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    store = TopKStore(os.path.join(cache_dir, f"topk_{ann_token}.json"), k=TOPK_SIZE)
+    store.sync_announcements(dict(zip(_keys, _keys)))
+    # 최근 공고 집합의 저장 파일만 유지
+    files = sorted(glob.glob(os.path.join(cache_dir, "topk_*.json")), key=os.path.getmtime, reverse=True)
+    for path in files[TOPK_STORES_KEPT:]:
+        if not path.endswith(f"topk_{ann_token}.json"):
+            os.remove(path)
+    return store
+
 # -------------------------------------------------
 # Load Data (무조건 로드)
 # -------------------------------------------------
+profiler.instrument(globals(), prefixes=("load_", "score_", "build_"))
+profiler.mark("load")
 companies = load_companies_df(up_comp)
-anns = load_announcements_df(up_anns)
+anns = load_announcements_df(up_anns)  # CompactAnnouncements
+
+# 마감된 공고는 점수 계산/렌더링 전에 제외 (마감일 인덱스, 날짜 없음은 상시 모집으로 유지)
+if not show_closed:
+    anns = anns.take(DeadlineIndex(anns.frame["dueTs"]).active_positions())
+
+# D-day는 파싱 없이 datetime 컬럼에서 벡터 계산
+anns.frame["dday"] = dday_series(anns.frame["dueTs"]).clip(lower=0)
 
 # 리스트형 보정
-for col in ["keywords","allowedUses"]:
-    if col in anns.columns and len(anns)>0 and not isinstance(anns[col].iloc[0], list):
-        anns[col] = anns[col].apply(normalize_delimited)
 for col in ["keywords","preferredUses"]:
     if col in companies.columns and len(companies)>0 and not isinstance(companies[col].iloc[0], list):
         companies[col] = companies[col].apply(normalize_delimited)
 
 # -------------------------------------------------
-# UI – Company select + Top-10
+# UI – Company select + Top-K (페이지 단위 표시)
 # -------------------------------------------------
 with st.sidebar:
     st.markdown("---")
@@ -442,58 +498,98 @@ with st.sidebar:
     comp_name = st.selectbox("고객사", companies["name"].astype(str).tolist())
 
 C = companies.loc[companies["name"]==comp_name].iloc[0].to_dict()
-st.subheader(f"🎯 {C['name']} – 맞춤 추천 Top-10")
+st.subheader(f"🎯 {C['name']} – 맞춤 추천 Top-{TOPK_SIZE}")
 st.write(f"{C.get('businessType','')} • {C.get('stage','')} • 업력 {C.get('years','?')}년 • {C.get('region','')}")
 
-matches = compute(C, anns, w)
-matches_use = matches if show_blocked else [m for m in matches if m["label"]!="불가"]
-matches_sorted = sorted(matches_use, key=lambda m: (-m["score"], m["ann"].get('dueDate') or '9999-99-99'))
-top = matches_sorted[:10]
-
-if len(top)==0:
-    st.info("추천 결과가 없습니다. (데이터/가중치 확인)")
-else:
-    rows = "\n".join(row_html(m) for m in top)
-    st.markdown(f"""
-    <div style="border:1px solid #e2e8f0;border-radius:16px;overflow:hidden;">
-      <table style="width:100%;font-size:14px;">
-        <thead style="background:#f8fafc;text-align:left;">
-          <tr>
-            <th style="padding:8px;width:100px;">라벨·점수</th>
-            <th style="padding:8px;">공고</th>
-            <th style="padding:8px;width:340px;">사유(요약)</th>
-            <th style="padding:8px;width:160px;">일정</th>
-            <th style="padding:8px;width:180px;">금액/사용처</th>
-          </tr>
-        </thead>
-        <tbody>{rows}</tbody>
-      </table>
-    </div>
-    """, unsafe_allow_html=True)
+# Top-K는 (회사, 가중치) 단위로 일괄 계산해 저장 → 고객사 전환 시 조회만
+profiler.mark("topk")
+ann_token = announcement_token(anns)
+store = get_topk_store(ann_token, anns.frame["rowKey"])
+w, show_blocked = current_weights()
+store.materialize({str(r["name"]): r for r in companies.to_dict("records")},
+                  {**w, "show_blocked": show_blocked}, make_scorer(anns, show_blocked))
+
+@fragment
+def recommendations_panel():
+    """가중치 슬라이더를 움직이면 이 영역만 다시 실행 (데이터 로드/전체 고객사 계산 없음)."""
+    with st.expander("⚖️ 가중치 (W)", expanded=False):
+        cols = st.columns(len(WEIGHT_SLIDERS) + 1)
+        for col, (k, label, max_v, default) in zip(cols, WEIGHT_SLIDERS):
+            col.slider(label, 0, max_v, default, 1, key=f"w_{k}")
+        cols[-1].checkbox("불가 포함 보기", value=False, key="show_blocked")
+
+    w, show_blocked = current_weights()
+    key, top = scored_top(store, ann_token, anns, C, w, show_blocked)
+    total = len(top["table"])
+    # 고객사/가중치가 바뀌면 첫 페이지부터, HTML은 보이는 행만 생성
+    shown = shown_count("recommendations", total, RECOMMENDATION_PAGE_SIZE, reset_token=key)
+    matches = visible_matches(C, w, top, shown)
+    # 로드맵은 보이는 페이지가 아니라 Top-K 전체 기준 (roadmap_panel에서 나머지 행도 생성)
+    st.session_state["current_top"] = {"company": C, "weights": w, "top": top}
+
+    if total==0:
+        st.info("추천 결과가 없습니다. (데이터/가중치 확인)")
+    else:
+        rows = "\n".join(row_html(m) for m in matches)
+        st.markdown(f"""
+        <div style="border:1px solid #e2e8f0;border-radius:16px;overflow:hidden;">
+          <table style="width:100%;font-size:14px;">
+            <thead style="background:#f8fafc;text-align:left;">
+              <tr>
+                <th style="padding:8px;width:100px;">라벨·점수</th>
+                <th style="padding:8px;">공고</th>
+                <th style="padding:8px;width:340px;">사유(요약)</th>
+                <th style="padding:8px;width:160px;">일정</th>
+                <th style="padding:8px;width:180px;">금액/사용처</th>
+              </tr>
+            </thead>
+            <tbody>{rows}</tbody>
+          </table>
+        </div>
+        """, unsafe_allow_html=True)
+        load_more("recommendations", shown, total, RECOMMENDATION_PAGE_SIZE)
+
+profiler.mark("table")
+recommendations_panel()
 
 # -------------------------------------------------
 # Roadmap
 # -------------------------------------------------
-st.markdown("---")
-st.subheader("📅 12개월 로드맵 자동 생성")
-if st.button("로드맵 자동 생성"):
-    selected = [m["ann"] for m in top]
-    board = {}
-    def key(d): return d[:7] if d else ""
-    for _, a in pd.DataFrame(selected).iterrows():
-        if a.get("infoSessionDate"):
-            board.setdefault(key(a["infoSessionDate"]), []).append({"type":"설명회","title":a["title"],"date":a["infoSessionDate"]})
-        if a.get("dueDate"):
-            for t, dd in [("초안",-14),("검토",-7),("마감",0),("발표",21),("정산",45)]:
-                d2 = add_days(a["dueDate"], dd)
-                if d2:
-                    board.setdefault(key(d2), []).append({"type":t,"title":a["title"],"date":d2})
-    st.session_state["board"] = board
-
-board = st.session_state.get("board", {})
-if board:
-    for mth in sorted(board.keys()):
-        st.markdown(f"**{mth}**")
-        st.dataframe(pd.DataFrame(board[mth]), use_container_width=True)
-else:
-    st.caption("버튼을 눌러 로드맵을 생성하세요.")
+profiler.mark("roadmap")
+
+@fragment
+def roadmap_panel():
+    """로드맵 버튼은 이 영역만 다시 실행 (현재 Top-K는 추천 영역이 세션에 남긴 값 사용)."""
+    st.markdown("---")
+    st.subheader("📅 12개월 로드맵 자동 생성")
+    if st.button("로드맵 자동 생성"):
+        current = st.session_state.get("current_top")
+        selected = []
+        if current:
+            top = current["top"]
+            selected = [m["ann"] for m in visible_matches(current["company"], current["weights"],
+                                                          top, len(top["table"]))]
+        board = {}
+        def key(d): return d[:7] if d else ""
+        for _, a in pd.DataFrame(selected).iterrows():
+            if a.get("infoSessionDate"):
+                board.setdefault(key(a["infoSessionDate"]), []).append({"type":"설명회","title":a["title"],"date":a["infoSessionDate"]})
+            if a.get("dueDate"):
+                for t, dd in [("초안",-14),("검토",-7),("마감",0),("발표",21),("정산",45)]:
+                    d2 = add_days(a["dueTs"], dd)
+                    if d2:
+                        board.setdefault(key(d2), []).append({"type":t,"title":a["title"],"date":d2})
+        st.session_state["board"] = board
+
+    board = st.session_state.get("board", {})
+    if board:
+        for mth in sorted(board.keys()):
+            st.markdown(f"**{mth}**")
+            st.dataframe(pd.DataFrame(board[mth]), use_container_width=True)
+    else:
+        st.caption("버튼을 눌러 로드맵을 생성하세요.")
+
+roadmap_panel()
+
+# 예외로 여기까지 오지 못한 재실행은 다음 재실행 시작 때 interrupted로 기록됨
+profiler.finish()
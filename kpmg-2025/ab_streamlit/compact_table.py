@@ -0,0 +1,139 @@
+# compact_table.py — 공고 테이블 압축 표현 (범주형 컬럼 + CSR 리스트 컬럼)
+import numpy as np
+import pandas as pd
+
+# 값 종류가 적은 문자열 컬럼 → pandas categorical
+CATEGORICAL_COLUMNS = ["region", "stage", "budgetBand", "source", "agency", "updateType"]
+# 행마다 리스트인 컬럼 → offsets + codes (+ vocab)
+LIST_COLUMNS = ["keywords", "allowedUses"]
+
+
+class ListColumn:
+    """
+    리스트 컬럼의 CSR 표현.
+    i번째 행의 항목 = vocab[codes[offsets[i]:offsets[i+1]]]
+    """
+
+    def __init__(self, offsets, codes, vocab):
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.codes = np.asarray(codes, dtype=np.int32)
+        self.vocab = pd.Index(vocab)
+
+    @classmethod
+    def from_lists(cls, values, vocab=None):
+        """리스트(또는 None)들의 시퀀스로부터 생성합니다. vocab을 넘기면 공유 사전으로 사용."""
+        lengths = np.fromiter((len(v) if isinstance(v, (list, tuple)) else 0 for v in values), dtype=np.int64)
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        flat = [str(x).strip() for v in values if isinstance(v, (list, tuple)) for x in v]
+        if vocab is None:
+            codes, vocab = pd.factorize(pd.Index(flat, dtype=object))
+        else:
+            vocab = pd.Index(vocab)
+            codes = vocab.get_indexer(flat)
+            missing = codes < 0
+            if missing.any():
+                extra = pd.Index(pd.unique(np.asarray(flat, dtype=object)[missing]))
+                vocab = vocab.append(extra)
+                codes = vocab.get_indexer(flat)
+        return cls(offsets, codes, vocab)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def row(self, i):
+        return self.vocab[self.codes[self.offsets[i]:self.offsets[i + 1]]].tolist()
+
+    def to_lists(self):
+        items = self.vocab[self.codes].tolist() if len(self.codes) else []
+        return [items[self.offsets[i]:self.offsets[i + 1]] for i in range(len(self))]
+
+    def take(self, positions):
+        """positions 순서대로 행을 골라 새 ListColumn을 만듭니다."""
+        positions = np.asarray(positions, dtype=np.int64)
+        starts, ends = self.offsets[positions], self.offsets[positions + 1]
+        lengths = ends - starts
+        offsets = np.zeros(len(positions) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        if offsets[-1]:
+            idx = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+            codes = self.codes[idx]
+        else:
+            codes = np.empty(0, dtype=np.int32)
+        return ListColumn(offsets, codes, self.vocab)
+
+    def overlap_counts(self, items):
+        """행별로 items에 포함된 항목 수 (matcher의 inter()와 같은 의미)."""
+        wanted = {str(x).strip() for x in (items or []) if x}
+        if not wanted or not len(self.codes):
+            return np.zeros(len(self), dtype=np.int64)
+        hit = np.isin(self.codes, self.vocab.get_indexer(list(wanted)))
+        csum = np.concatenate([[0], np.cumsum(hit)])
+        return csum[self.offsets[1:]] - csum[self.offsets[:-1]]
+
+    @property
+    def nbytes(self):
+        return self.offsets.nbytes + self.codes.nbytes + int(self.vocab.memory_usage(deep=True))
+
+
+class CompactAnnouncements:
+    """범주형 frame + 리스트 컬럼(CSR). 행 순서는 frame과 lists가 같음."""
+
+    def __init__(self, frame, lists):
+        self.frame = frame
+        self.lists = lists
+
+    @classmethod
+    def from_frame(cls, df, categories=None, vocabs=None):
+        """
+        정규화된 공고 DataFrame을 압축합니다.
+        categories / vocabs: 여러 테이블이 같은 사전을 쓰도록 넘길 수 있는 컬럼별 공유 사전
+        """
+        frame = df.drop(columns=[c for c in LIST_COLUMNS if c in df.columns]).reset_index(drop=True)
+        for col in CATEGORICAL_COLUMNS:
+            if col in frame.columns:
+                values = frame[col].fillna("").astype(str)
+                cats = (categories or {}).get(col)
+                if cats is not None:
+                    cats = pd.Index(cats).append(pd.Index(values.unique()).difference(cats))
+                frame[col] = pd.Categorical(values, categories=cats)
+        lists = {
+            col: ListColumn.from_lists(df[col].tolist() if col in df.columns else [None] * len(df),
+                                       vocab=(vocabs or {}).get(col))
+            for col in LIST_COLUMNS
+        }
+        return cls(frame, lists)
+
+    def to_frame(self):
+        """일반 DataFrame(문자열 컬럼 + 파이썬 리스트 컬럼)으로 되돌립니다."""
+        df = self.frame.copy()
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype(object)
+        for col, lc in self.lists.items():
+            df[col] = lc.to_lists()
+        return df
+
+    def __len__(self):
+        return len(self.frame)
+
+    def row(self, i):
+        """i번째 공고를 dict로 (리스트 컬럼 포함)."""
+        rec = self.frame.iloc[i].to_dict()
+        for col, lc in self.lists.items():
+            rec[col] = lc.row(i)
+        return rec
+
+    def take(self, positions):
+        positions = np.asarray(positions, dtype=np.int64)
+        frame = self.frame.iloc[positions].reset_index(drop=True)
+        return CompactAnnouncements(frame, {c: lc.take(positions) for c, lc in self.lists.items()})
+
+    def categories(self):
+        """다른 테이블과 공유할 사전 (categories, vocabs)."""
+        cats = {c: self.frame[c].cat.categories for c in CATEGORICAL_COLUMNS
+                if c in self.frame.columns and isinstance(self.frame[c].dtype, pd.CategoricalDtype)}
+        return cats, {c: lc.vocab for c, lc in self.lists.items()}
+
+    def memory_bytes(self):
+        return int(self.frame.memory_usage(deep=True).sum()) + sum(lc.nbytes for lc in self.lists.values())
@@ -0,0 +1,78 @@
+# ingest_cache.py — 정규화 결과 디스크 캐시 (파일별, (경로, mtime, 크기) 키)
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+
+def file_signature(path):
+    """(절대경로, mtime_ns, 크기) — 파일이 바뀌면 달라지는 캐시 키."""
+    st_ = os.stat(path)
+    return (os.path.abspath(path), st_.st_mtime_ns, st_.st_size)
+
+
+def row_keys(df, columns=None):
+    """행 단위 64비트 해시. 리스트형 컬럼은 '|'로 이어 붙인 문자열로 해시합니다."""
+    cols = list(columns) if columns is not None else list(df.columns)
+    if not cols or df.empty:
+        return pd.Series(dtype="uint64", index=df.index)
+    flat = pd.DataFrame(index=df.index)
+    for c in cols:
+        s = df[c]
+        if s.dtype == object:
+            s = s.map(lambda v: "|".join(map(str, v)) if isinstance(v, (list, tuple)) else ("" if v is None else str(v)))
+        flat[c] = s
+    return pd.util.hash_pandas_object(flat, index=False)
+
+
+class IngestCache:
+    """
+    파일별 정규화 결과를 pickle로 저장합니다.
+    (경로, mtime, 크기, kind, schema_version)이 같으면 읽기/정규화를 건너뜁니다.
+    """
+
+    def __init__(self, cache_dir, schema_version=1):
+        self.cache_dir = cache_dir
+        self.schema_version = schema_version
+        self.manifest_path = os.path.join(cache_dir, "manifest.json")
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = self.manifest_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.manifest_path)
+
+    def _entry_key(self, kind, path):
+        return f"{kind}:{os.path.abspath(path)}"
+
+    def load(self, path, kind, reader, normalizer):
+        """캐시가 유효하면 저장된 결과를, 아니면 reader → normalizer 결과를 저장 후 반환합니다."""
+        abspath, mtime_ns, size = file_signature(path)
+        key = self._entry_key(kind, path)
+        entry = self.manifest.get(key)
+        if entry and entry["mtime_ns"] == mtime_ns and entry["size"] == size \
+                and entry["schema_version"] == self.schema_version:
+            cached = os.path.join(self.cache_dir, entry["file"])
+            try:
+                return pd.read_pickle(cached)
+            except Exception:
+                pass  # 캐시 파일 손상 → 다시 정규화
+
+        df = normalizer(reader(path))
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16] + ".pkl"
+        os.makedirs(self.cache_dir, exist_ok=True)
+        df.to_pickle(os.path.join(self.cache_dir, name))
+        self.manifest[key] = {"mtime_ns": mtime_ns, "size": size,
+                              "schema_version": self.schema_version, "file": name}
+        self._save_manifest()
+        return df
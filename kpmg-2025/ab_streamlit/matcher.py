@@ -0,0 +1,40 @@
+# matcher.py — 공고 적합도 채점 (CompactAnnouncements 벡터 연산, streamlit 의존 없음)
+import numpy as np
+import pandas as pd
+
+
+def score_matches(profile, table, w):
+    """CompactAnnouncements 전체를 벡터 연산으로 채점 (행 순서 = table 순서)."""
+    df = table.frame
+    p_stage = profile.get("stage","")
+    p_keywords = profile.get("keywords",[]) or []
+    p_uses = profile.get("preferredUses",[]) or []
+
+    years_max = pd.to_numeric(df["yearsMax"], errors="coerce")
+    try: years_ok = (years_max.isna() | (int(profile["years"]) <= np.trunc(years_max))).to_numpy()
+    except (TypeError, ValueError): years_ok = np.ones(len(df), dtype=bool)
+
+    stage_ok = ((df["stage"] == p_stage) | ((df["stage"] == "초기") & (p_stage == "예비"))).to_numpy()
+    is_nationwide = (df["region"] == "전국").to_numpy()
+    region_ok = is_nationwide | df["region"].str.contains(str(profile.get("region","")), regex=False).fillna(False).to_numpy(dtype=bool)
+    budget_ok = ((df["budgetBand"] == "") | (df["budgetBand"] == profile.get("preferredBudget",""))).to_numpy()
+
+    # 리스트 컬럼은 CSR codes에서 바로 교집합 개수 계산
+    kw = table.lists["keywords"].overlap_counts(p_keywords)
+    use_overlap = table.lists["allowedUses"].overlap_counts(p_uses)
+
+    score = (
+        kw / max(3, len(p_keywords)) * w["keywords"] +
+        stage_ok * w["stage"] +
+        region_ok * w["region"] +
+        budget_ok * w["budget"] +
+        use_overlap / max(3, len(p_uses)) * w["use"]
+    )
+    score = np.round(score).astype(int)
+    hard_fail = ~years_ok | (~region_ok & ~is_nationwide) | ((kw == 0) & (use_overlap == 0))
+    label = np.where(hard_fail, "불가", np.where(score >= 80, "가능", np.where(score >= 50, "주의", "불가")))
+    return pd.DataFrame({
+        "score": score, "label": label, "years_ok": years_ok, "stage_ok": stage_ok,
+        "region_ok": region_ok, "budget_ok": budget_ok, "kw": kw, "use_overlap": use_overlap,
+        "dueKey": df["dueDate"].replace("", "9999-99-99").to_numpy(),
+    })
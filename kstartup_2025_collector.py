@@ -5,7 +5,6 @@ K-스타트업 2025년 정부지원사업 공고 데이터 수집기
 실제 API를 사용하여 2025년 9월 6일 기준으로 데이터 수집
 """
 
-import requests
 import pandas as pd
 import json
 import xml.etree.ElementTree as ET
@@ -14,11 +13,12 @@ import time
 import os
 import logging
 from typing import List, Dict, Optional
-import schedule
+from auto_scheduler import AsyncScheduler
 import threading
 from pathlib import Path
 import urllib3
 import subprocess
+from http_cache import CachedSession, HttpCache, build_response, data_go_kr_ok
 
 # SSL 경고 무시
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -43,8 +43,11 @@ class KStartup2025Collector:
         self.data_dir = Path('collected_data')
         self.data_dir.mkdir(exist_ok=True)
         
-        # 세션 생성
-        self.session = requests.Session()
+        # 응답 캐시
+        self.cache = HttpCache()
+        
+        # 세션 생성 (응답 캐시 사용)
+        self.session = CachedSession(self.cache, validate=data_go_kr_ok)
         self.session.verify = False
         
         # 헤더 설정
@@ -75,15 +78,33 @@ class KStartup2025Collector:
         url = f"{self.api_url}?{param_string}"
         
         try:
-            logger.info(f"API 호출 중: {start_date} ~ {end_date}, 페이지 {page_no}")
-            
-            cmd = ['curl', '-k', '-s', url]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                logger.info("API 호출 성공")
+            # 캐시 확인 (서비스키는 캐시 키에서 제외됨)
+            cached = self.cache.lookup(self.api_url, params)
+            if cached is not None and (self.cache.offline or self.cache.is_fresh(cached)):
+                logger.info(f"캐시 사용: {start_date} ~ {end_date}, 페이지 {page_no}")
+                self.cache.count('hits')
+                body = cached['body'].decode('utf-8')
+                from_cache = True
+            elif self.cache.offline:
+                logger.warning(f"오프라인 모드: 캐시에 없는 페이지 {page_no}")
+                return None
+            else:
+                logger.info(f"API 호출 중: {start_date} ~ {end_date}, 페이지 {page_no}")
                 
-                root = ET.fromstring(result.stdout)
+                cmd = ['curl', '-k', '-s', url]
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+                
+                if result.returncode != 0:
+                    logger.error(f"curl 실행 실패: {result.stderr}")
+                    return None
+                
+                logger.info("API 호출 성공")
+                self.cache.count('misses')
+                body = result.stdout
+                from_cache = False
+            
+            if body:
+                root = ET.fromstring(body)
                 
                 # 오류 확인
                 if root.tag == 'OpenAPI_ServiceResponse':
@@ -116,9 +137,19 @@ class KStartup2025Collector:
                             items.append(item_data)
                         result_info['items'] = items
                 
+                # 정상 응답만 캐시에 저장 (CachedSession과 같은 검증 사용)
+                if not from_cache:
+                    body_bytes = body.encode('utf-8')
+                    entry = {'status_code': 200, 'headers': {}, 'body': body_bytes}
+                    if data_go_kr_ok(build_response(self.api_url, entry)):
+                        self.cache.store(self.api_url, params, 200, {}, body_bytes)
+                    else:
+                        self.cache.count('rejected')
+                        logger.warning(f"오류 응답으로 판단해 캐시하지 않음: 페이지 {page_no}")
+                
                 return result_info
             else:
-                logger.error(f"curl 실행 실패: {result.stderr}")
+                logger.error("API 응답이 비어 있습니다.")
                 return None
                 
         except Exception as e:
@@ -498,14 +529,11 @@ def main():
             print("매일 오전 9시에 새로운 공고를 자동으로 수집합니다.")
             print("종료하려면 Ctrl+C를 누르세요.")
             
-            schedule.every().day.at("09:00").do(collector.collect_daily_new_announcements)
-            
-            try:
-                while True:
-                    schedule.run_pending()
-                    time.sleep(60)
-            except KeyboardInterrupt:
-                print("\n자동 수집 모드를 종료합니다.")
+            # 스케줄 설정 (auto_scheduler의 비동기 스케줄러, 다음 실행 시각까지 대기)
+            scheduler = AsyncScheduler(state_file='kstartup_2025_collector_state.json')
+            scheduler.add_job('daily', collector.collect_daily_new_announcements, '0 9 * * *')
+            scheduler.start()
+            print("\n자동 수집 모드를 종료합니다.")
                 
         elif choice == '5':
             print("프로그램을 종료합니다.")
@@ -13,16 +13,12 @@ import time
 import os
 import logging
 from typing import List, Dict, Optional
-import schedule
+from auto_scheduler import AsyncScheduler
 import threading
 from pathlib import Path
 import gspread
 from google.oauth2.service_account import Credentials
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
+from email_digest import DigestMailer
 
 # 로깅 설정
 logging.basicConfig(
@@ -49,8 +45,9 @@ class KStartupAdvancedCollector:
         self.gc = None
         self.worksheet = None
         
-        # 이메일 설정
+        # 이메일 설정 (SMTP 세션은 발송기 안의 풀에서 재사용)
         self.email_config = email_config
+        self.mailer = DigestMailer(email_config) if email_config else None
         
         # 구글 스프레드시트 초기화
         if google_credentials_path and os.path.exists(google_credentials_path):
@@ -153,45 +150,26 @@ class KStartupAdvancedCollector:
             return False
     
     def send_email_notification(self, subject: str, body: str, attachment_path: str = None):
-        """이메일 알림 발송"""
-        if not self.email_config:
+        """이메일 알림 발송 (첨부파일은 나눠 읽어 전송)"""
+        if not self.mailer:
             logger.warning("이메일 설정이 없습니다.")
             return False
-            
-        try:
-            msg = MIMEMultipart()
-            msg['From'] = self.email_config['from_email']
-            msg['To'] = self.email_config['to_email']
-            msg['Subject'] = subject
-            
-            msg.attach(MIMEText(body, 'html', 'utf-8'))
-            
-            # 첨부파일 추가
-            if attachment_path and os.path.exists(attachment_path):
-                with open(attachment_path, "rb") as attachment:
-                    part = MIMEBase('application', 'octet-stream')
-                    part.set_payload(attachment.read())
-                    encoders.encode_base64(part)
-                    part.add_header(
-                        'Content-Disposition',
-                        f'attachment; filename= {os.path.basename(attachment_path)}'
-                    )
-                    msg.attach(part)
-            
-            # 이메일 발송
-            server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'])
-            server.starttls()
-            server.login(self.email_config['from_email'], self.email_config['password'])
-            text = msg.as_string()
-            server.sendmail(self.email_config['from_email'], self.email_config['to_email'], text)
-            server.quit()
-            
+        
+        attachments = [attachment_path] if attachment_path else []
+        if self.mailer.send(self.email_config['to_email'], subject, body, attachments):
             logger.info("이메일 알림 발송 완료")
             return True
-            
-        except Exception as e:
-            logger.error(f"이메일 발송 실패: {str(e)}")
-            return False
+        return False
+    
+    def send_match_digests(self, matches: List[Dict], recipient_field: str = 'recipient') -> Dict[str, bool]:
+        """신규 매칭 공고를 수신자별 다이제스트 메일로 묶어 발송 (수신자 필드가 없으면 to_email로)"""
+        if not self.mailer:
+            logger.warning("이메일 설정이 없습니다.")
+            return {}
+        
+        default_to = self.email_config['to_email']
+        matches = [m if m.get(recipient_field) else {**m, recipient_field: default_to} for m in matches]
+        return self.mailer.send_digests(matches, recipient_field)
     
     def fetch_announcements(self, start_date: str, end_date: str, page_no: int = 1, num_of_rows: int = 100) -> Optional[Dict]:
         """API에서 공고 데이터를 가져옵니다."""
@@ -395,15 +373,11 @@ def main():
             print("매일 오전 9시에 새로운 공고를 자동으로 수집합니다.")
             print("종료하려면 Ctrl+C를 누르세요.")
             
-            # 스케줄 설정
-            schedule.every().day.at("09:00").do(collector.auto_collect_new_announcements)
-            
-            try:
-                while True:
-                    schedule.run_pending()
-                    time.sleep(60)
-            except KeyboardInterrupt:
-                print("\n자동 수집 모드를 종료합니다.")
+            # 스케줄 설정 (auto_scheduler의 비동기 스케줄러, 다음 실행 시각까지 대기)
+            scheduler = AsyncScheduler(state_file='kstartup_advanced_collector_state.json')
+            scheduler.add_job('daily', collector.auto_collect_new_announcements, '0 9 * * *')
+            scheduler.start()
+            print("\n자동 수집 모드를 종료합니다.")
                 
         elif choice == '4':
             print("프로그램을 종료합니다.")
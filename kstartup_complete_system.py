@@ -14,7 +14,7 @@ import time
 import os
 import logging
 from typing import List, Dict, Optional
-import schedule
+from auto_scheduler import AsyncScheduler
 import threading
 from pathlib import Path
 import urllib3
@@ -622,14 +622,11 @@ def main():
             print("매일 오전 9시에 새로운 공고를 자동으로 수집합니다. (모의 데이터)")
             print("종료하려면 Ctrl+C를 누르세요.")
             
-            schedule.every().day.at("09:00").do(lambda: system.collect_new_announcements(use_mock=True))
-            
-            try:
-                while True:
-                    schedule.run_pending()
-                    time.sleep(60)
-            except KeyboardInterrupt:
-                print("\n자동 수집 모드를 종료합니다.")
+            # 스케줄 설정 (auto_scheduler의 비동기 스케줄러, 다음 실행 시각까지 대기)
+            scheduler = AsyncScheduler(state_file='kstartup_complete_system_state.json')
+            scheduler.add_job('daily', lambda: system.collect_new_announcements(use_mock=True), '0 9 * * *')
+            scheduler.start()
+            print("\n자동 수집 모드를 종료합니다.")
                 
         elif choice == '6':
             print("\n구글 스프레드시트 연동을 테스트합니다...")
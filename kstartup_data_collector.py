@@ -12,7 +12,7 @@ import time
 import os
 import logging
 from typing import List, Dict, Optional
-import schedule
+from auto_scheduler import AsyncScheduler
 import threading
 from pathlib import Path
 
@@ -287,15 +287,11 @@ def main():
             print("매일 오전 9시에 새로운 공고를 자동으로 수집합니다.")
             print("종료하려면 Ctrl+C를 누르세요.")
             
-            # 스케줄 설정
-            schedule.every().day.at("09:00").do(collector.collect_new_announcements)
-            
-            try:
-                while True:
-                    schedule.run_pending()
-                    time.sleep(60)  # 1분마다 스케줄 확인
-            except KeyboardInterrupt:
-                print("\n자동 수집 모드를 종료합니다.")
+            # 스케줄 설정 (auto_scheduler의 비동기 스케줄러, 다음 실행 시각까지 대기)
+            scheduler = AsyncScheduler(state_file='kstartup_data_collector_state.json')
+            scheduler.add_job('daily', collector.collect_new_announcements, '0 9 * * *')
+            scheduler.start()
+            print("\n자동 수집 모드를 종료합니다.")
                 
         elif choice == '4':
             print("프로그램을 종료합니다.")
@@ -4,18 +4,31 @@
 K-스타트업 웹사이트 스크래핑을 통한 정부지원사업 공고 데이터 수집기
 """
 
-import requests
+import importlib.util
 import pandas as pd
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
 from datetime import datetime, timedelta
 import time
 import os
 import logging
 from typing import List, Dict, Optional
-import schedule
+from auto_scheduler import AsyncScheduler
 import threading
 from pathlib import Path
 import urllib3
+from http_cache import CachedSession, html_page_ok
+
+LXML_AVAILABLE = importlib.util.find_spec('lxml') is not None
+
+# 파싱 백엔드 (lxml이 있으면 C 파서 사용)
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# 공고 목록 테이블만 트리로 만들도록 파싱 범위 제한
+TBL_LIST_STRAINER = SoupStrainer('table', class_='tbl_list')
+
+# 미리 컴파일된 행 선택자
+ROW_SELECTOR = soupsieve.compile('tbody > tr')
 
 # SSL 경고 무시
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -40,8 +53,8 @@ class KStartupWebScraper:
         self.data_dir = Path('collected_data')
         self.data_dir.mkdir(exist_ok=True)
         
-        # 세션 생성
-        self.session = requests.Session()
+        # 세션 생성 (응답 캐시 사용)
+        self.session = CachedSession(validate=html_page_ok)
         self.session.verify = False
         
         # 헤더 설정
@@ -80,42 +93,7 @@ class KStartupWebScraper:
             response = self.session.get(self.search_url, params=params, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 공고 목록 추출
-            announcements = []
-            
-            # 공고 테이블 찾기
-            table = soup.find('table', class_='tbl_list')
-            if not table:
-                logger.warning("공고 테이블을 찾을 수 없습니다.")
-                return announcements
-            
-            rows = table.find('tbody').find_all('tr')
-            
-            for row in rows:
-                try:
-                    cells = row.find_all('td')
-                    if len(cells) < 6:
-                        continue
-                    
-                    # 공고 정보 추출
-                    announcement = {
-                        '공고번호': cells[0].get_text(strip=True),
-                        '사업명': cells[1].find('a').get_text(strip=True) if cells[1].find('a') else cells[1].get_text(strip=True),
-                        '공고링크': self.base_url + cells[1].find('a')['href'] if cells[1].find('a') else '',
-                        '기관명': cells[2].get_text(strip=True),
-                        '접수시작일': cells[3].get_text(strip=True),
-                        '접수종료일': cells[4].get_text(strip=True),
-                        '상태': cells[5].get_text(strip=True),
-                        '수집일시': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    }
-                    
-                    announcements.append(announcement)
-                    
-                except Exception as e:
-                    logger.warning(f"행 파싱 오류: {str(e)}")
-                    continue
+            announcements = self.parse_announcement_list(response.content)
             
             logger.info(f"페이지 {page}에서 {len(announcements)}개 공고 수집 완료")
             return announcements
@@ -124,6 +102,60 @@ class KStartupWebScraper:
             logger.error(f"웹 스크래핑 오류: {str(e)}")
             return []
     
+    def parse_announcement_list(self, content) -> List[Dict]:
+        """
+        공고 목록 페이지에서 tbl_list 테이블의 행만 파싱합니다.
+        
+        SoupStrainer로 tbl_list 테이블만 트리로 만들고, 미리 컴파일된
+        선택자로 tbody 행을 가져옵니다.
+        
+        Args:
+            content: 목록 페이지 HTML (bytes 또는 str)
+            
+        Returns:
+            공고 데이터 리스트
+        """
+        soup = BeautifulSoup(content, HTML_PARSER, parse_only=TBL_LIST_STRAINER)
+        table = soup.find('table')
+        if table is None:
+            logger.warning("공고 테이블을 찾을 수 없습니다.")
+            return []
+        
+        return self._rows_to_announcements(ROW_SELECTOR.select(table))
+    
+    def _rows_to_announcements(self, rows) -> List[Dict]:
+        """목록 테이블의 tbody 행들을 공고 딕셔너리로 변환합니다."""
+        announcements = []
+        collected_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        for row in rows:
+            try:
+                cells = row.find_all('td', recursive=False)
+                if len(cells) < 6:
+                    continue
+                
+                link = cells[1].find('a')
+                
+                # 공고 정보 추출
+                announcement = {
+                    '공고번호': cells[0].get_text(strip=True),
+                    '사업명': link.get_text(strip=True) if link else cells[1].get_text(strip=True),
+                    '공고링크': self.base_url + link['href'] if link and link.has_attr('href') else '',
+                    '기관명': cells[2].get_text(strip=True),
+                    '접수시작일': cells[3].get_text(strip=True),
+                    '접수종료일': cells[4].get_text(strip=True),
+                    '상태': cells[5].get_text(strip=True),
+                    '수집일시': collected_at
+                }
+                
+                announcements.append(announcement)
+                
+            except Exception as e:
+                logger.warning(f"행 파싱 오류: {str(e)}")
+                continue
+        
+        return announcements
+    
     def get_announcement_detail(self, announcement_url: str) -> Dict:
         """
         공고 상세 정보를 가져옵니다.
@@ -289,6 +321,69 @@ class KStartupWebScraper:
             logger.error("데이터 수집에 실패했습니다.")
             return None
 
+def build_list_fixture(html_path: str = 'kstartup_page_source.html', rows: int = 10) -> bytes:
+    """
+    저장된 페이지에 tbl_list 목록 테이블(rows행)을 넣어 벤치마크용 목록 페이지를 만듭니다.
+    저장된 페이지에는 목록 테이블이 없으므로, 페이지 크기/구조는 그대로 두고 테이블만 추가합니다.
+    """
+    body_rows = ''.join(
+        f"<tr><td>{n}</td>"
+        f"<td class='title'><a href='/web/contents/bizpbanc-ongoing.do?schM=view&amp;pbancSn={170000 + n}'>"
+        f"2025년 창업지원사업 공고 {n}</a></td>"
+        f"<td>창업진흥원</td><td>2025-09-{n % 28 + 1:02d}</td><td>2025-10-{n % 28 + 1:02d}</td><td>접수중</td></tr>"
+        for n in range(1, rows + 1))
+    table = (f"<table class='tbl_list'><thead><tr><th>번호</th><th>공고명</th><th>기관</th>"
+             f"<th>시작일</th><th>종료일</th><th>상태</th></tr></thead><tbody>{body_rows}</tbody></table>")
+    content = Path(html_path).read_bytes()
+    return content.replace(b'</body>', table.encode('utf-8') + b'</body>', 1)
+
+def benchmark_parse(html_path: str = 'kstartup_page_source.html', repeat: int = 20, rows: int = 10) -> Dict[str, float]:
+    """
+    목록 테이블이 들어 있는 페이지로 페이지당 파싱 비용을 측정합니다.
+    두 방식이 같은 행을 돌려주는지도 확인합니다.
+    
+    Args:
+        html_path: 벤치마크 페이지의 바탕이 되는 저장된 HTML 파일 경로
+        repeat: 반복 횟수
+        rows: 목록 테이블 행 수
+        
+    Returns:
+        방식별 페이지당 평균 파싱 시간(ms)
+    """
+    content = build_list_fixture(html_path, rows)
+    scraper = KStartupWebScraper()
+    
+    def full_parse():
+        soup = BeautifulSoup(content, 'html.parser')
+        table = soup.find('table', class_='tbl_list')
+        return scraper._rows_to_announcements(table.find('tbody').find_all('tr', recursive=False))
+    
+    def strained_parse():
+        return scraper.parse_announcement_list(content)
+    
+    # 수집일시는 호출 시각이므로 빼고 비교
+    def rows_of(announcements):
+        return [{k: v for k, v in a.items() if k != '수집일시'} for a in announcements]
+    
+    expected = rows_of(full_parse())
+    assert len(expected) == rows, f"목록 행 수 불일치: {len(expected)} != {rows}"
+    assert rows_of(strained_parse()) == expected, "전체 파싱과 SoupStrainer 파싱 결과가 다릅니다"
+    
+    results = {}
+    for name, func in [('html.parser 전체 파싱', full_parse),
+                       (f'{HTML_PARSER} + SoupStrainer', strained_parse)]:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        results[name] = (time.perf_counter() - start) / repeat * 1000
+    
+    print(f"=== 파싱 벤치마크: {html_path} + 목록 {rows}행 ({len(content) / 1024:.0f}KB, {repeat}회) ===")
+    for name, ms in results.items():
+        print(f"{name}: 페이지당 {ms:.2f}ms")
+    print(f"두 방식 결과 일치: {rows}행")
+    
+    return results
+
 def main():
     """메인 실행 함수"""
     # 스크래퍼 초기화
@@ -297,10 +392,11 @@ def main():
     print("=== K-스타트업 웹 스크래핑 데이터 수집기 ===")
     print("1. 최근 공고 수집 (5페이지)")
     print("2. 자동 수집 모드 시작 (매일 오전 9시)")
-    print("3. 종료")
+    print("3. 파싱 벤치마크 (kstartup_page_source.html)")
+    print("4. 종료")
     
     while True:
-        choice = input("\n선택하세요 (1-3): ").strip()
+        choice = input("\n선택하세요 (1-4): ").strip()
         
         if choice == '1':
             print("\n최근 공고를 수집합니다...")
@@ -315,22 +411,21 @@ def main():
             print("매일 오전 9시에 새로운 공고를 자동으로 수집합니다.")
             print("종료하려면 Ctrl+C를 누르세요.")
             
-            # 스케줄 설정
-            schedule.every().day.at("09:00").do(scraper.collect_recent_announcements)
-            
-            try:
-                while True:
-                    schedule.run_pending()
-                    time.sleep(60)  # 1분마다 스케줄 확인
-            except KeyboardInterrupt:
-                print("\n자동 수집 모드를 종료합니다.")
+            # 스케줄 설정 (auto_scheduler의 비동기 스케줄러, 다음 실행 시각까지 대기)
+            scheduler = AsyncScheduler(state_file='kstartup_web_scraper_state.json')
+            scheduler.add_job('daily', scraper.collect_recent_announcements, '0 9 * * *')
+            scheduler.start()
+            print("\n자동 수집 모드를 종료합니다.")
                 
         elif choice == '3':
+            benchmark_parse()
+            
+        elif choice == '4':
             print("프로그램을 종료합니다.")
             break
             
         else:
-            print("잘못된 선택입니다. 1-3 중에서 선택하세요.")
+            print("잘못된 선택입니다. 1-4 중에서 선택하세요.")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공고 유사 중복 묶기 (MinHash + LSH)
+같은 사업이 K-스타트업/기업마당/통합공고에 제목만 조금 다르게 올라오는 경우를 묶어
+대표 레코드 하나로 합칩니다.
+
+- 키: 제목 + 기관을 정규화한 문자열의 문자 3-gram
+- 마감일이 같아야 묶음 (제목이 같은 차수별 반복 사업은 따로 둠)
+- MinHash 서명을 밴드로 나눠 같은 버킷에 들어온 쌍만 비교 (전체 쌍 비교 없음)
+- 추정 자카드 유사도가 threshold 이상인 묶음 대표끼리 union-find로 합침
+- 대표 레코드: 묶음의 첫 레코드에 다른 레코드의 빈 필드를 채운 것
+"""
+
+import logging
+import re
+import unicodedata
+import zlib
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from date_normalizer import normalize_dates, parse_date, to_iso_strings
+
+logger = logging.getLogger(__name__)
+
+SHINGLE_SIZE = 3
+NUM_PERM = 64
+BANDS = 16            # 밴드당 4행 → 유사도 약 0.5 이상부터 후보가 됨 (검증은 THRESHOLD)
+THRESHOLD = 0.75
+_PRIME = (1 << 31) - 1
+
+# 출처별 필드 (앞에 있는 필드 우선)
+TITLE_FIELDS = ['사업공고명', 'pblancNm', 'title', '사업명', '공고명', '공고이름']
+AGENCY_FIELDS = ['공고기관명', 'excInsttNm', 'author', '주관기관', 'agency', '소관부처']
+DEADLINE_FIELDS = ['접수종료일', 'reqstBeginEndDe', 'apply_end', '신청기간', '마감일', 'due_date']
+
+# 제목 앞의 연도/괄호 머리말 등 출처마다 다르게 붙는 부분
+_NOISE = re.compile(r"20\d{2}\s*년(도)?|\[[^\]]*\]|[^\w]")
+
+_rng = np.random.RandomState(20250906)
+_PERM_A = _rng.randint(1, _PRIME, size=NUM_PERM).astype(np.uint64)
+_PERM_B = _rng.randint(0, _PRIME, size=NUM_PERM).astype(np.uint64)
+
+
+def _first(record: Dict[str, Any], fields: Sequence[str]) -> str:
+    for field in fields:
+        value = record.get(field)
+        if isinstance(value, float):
+            if np.isnan(value):
+                continue
+            if value.is_integer():
+                value = int(value)  # CSV에서 숫자로 읽힌 20250930 등
+        if value is not None and str(value).strip():
+            return str(value)
+    return ''
+
+
+def normalize_text(text: str) -> str:
+    """NFKC + 소문자 + 공백/기호/연도 머리말 제거"""
+    return _NOISE.sub('', unicodedata.normalize('NFKC', text).lower())
+
+
+def record_key(record: Dict[str, Any]) -> str:
+    """제목|기관 키. 제목이 없으면 빈 문자열."""
+    title = normalize_text(_first(record, TITLE_FIELDS))
+    if not title:
+        return ''
+    return f"{title}|{normalize_text(_first(record, AGENCY_FIELDS))}"
+
+
+def record_deadline(record: Dict[str, Any]) -> str:
+    """마감일 ISO 문자열 (출처별 표기 차이를 없앰). 없으면 빈 문자열."""
+    deadline = parse_date(_first(record, DEADLINE_FIELDS) or None)
+    return deadline.isoformat() if deadline else ''
+
+
+def record_deadlines(records: Sequence[Dict[str, Any]]) -> List[str]:
+    """record_deadline의 일괄 버전 (날짜 파싱은 벡터 연산 한 번)"""
+    raw = pd.Series([_first(r, DEADLINE_FIELDS) or None for r in records], dtype=object)
+    return to_iso_strings(normalize_dates(raw)).tolist()
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> np.ndarray:
+    """문자 n-gram의 32비트 해시 (중복 제거)"""
+    grams = {text[i:i + size] for i in range(max(1, len(text) - size + 1))}
+    return np.fromiter((zlib.crc32(g.encode('utf-8')) for g in grams), dtype=np.uint64, count=len(grams))
+
+
+def minhash_signatures(keys: Sequence[str]) -> np.ndarray:
+    """(len(keys), NUM_PERM) MinHash 서명"""
+    signatures = np.empty((len(keys), NUM_PERM), dtype=np.uint64)
+    for i, key in enumerate(keys):
+        hashed = shingles(key) % _PRIME
+        signatures[i] = ((np.outer(_PERM_A, hashed) + _PERM_B[:, None]) % _PRIME).min(axis=1)
+    return signatures
+
+
+def _find(parent: List[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster_keys(keys: Sequence[str], threshold: float = THRESHOLD,
+                 deadlines: Optional[Sequence[str]] = None) -> np.ndarray:
+    """
+    유사한 키끼리 같은 묶음 번호를 붙입니다.
+    deadlines가 주어지면 마감일이 같은 키끼리만 묶습니다.
+
+    Returns:
+        묶음 번호 배열 (묶음의 가장 앞 위치가 번호). 빈 키는 묶지 않음
+    """
+    n = len(keys)
+    parent = list(range(n))
+    if n < 2:
+        return np.arange(n)
+
+    signatures = minhash_signatures(keys)
+    rows = NUM_PERM // BANDS
+    for band in range(BANDS):
+        buckets = defaultdict(list)
+        chunk = signatures[:, band * rows:(band + 1) * rows]
+        for i in range(n):
+            if keys[i]:
+                # 마감일을 버킷 키에 넣어 같은 마감일끼리만 후보가 되게 함
+                buckets[(chunk[i].tobytes(), deadlines[i] if deadlines is not None else '')].append(i)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            head = members[0]
+            for other in members[1:]:
+                a, b = _find(parent, head), _find(parent, other)
+                if a == b:
+                    continue
+                # 묶음 대표끼리 비교해 A≈B≈C 식으로 길게 이어지는 것을 막음
+                if np.mean(signatures[a] == signatures[b]) >= threshold:
+                    parent[max(a, b)] = min(a, b)
+
+    return np.array([_find(parent, i) for i in range(n)])
+
+
+def dedup_records(records: List[Dict[str, Any]], threshold: float = THRESHOLD,
+                  sources: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+    """
+    레코드 목록에서 유사 중복을 묶어 대표 레코드만 남깁니다 (원래 순서 유지).
+
+    대표 레코드에는 같은 묶음의 다른 레코드에만 있는 필드를 채우고,
+    sources가 주어지면 묶음에 포함된 출처 목록을 'merged_sources'에 기록합니다.
+    """
+    labels = cluster_keys([record_key(r) for r in records], threshold, record_deadlines(records))
+    merged: Dict[int, Dict[str, Any]] = {}
+    for i, label in enumerate(labels):
+        record = records[i]
+        if label not in merged:
+            merged[label] = dict(record)
+            if sources is not None:
+                merged[label]['merged_sources'] = [sources[i]]
+            continue
+        canonical = merged[label]
+        for field, value in record.items():
+            if not _first(canonical, [field]) and _first(record, [field]):
+                canonical[field] = value
+        if sources is not None and sources[i] not in canonical['merged_sources']:
+            canonical['merged_sources'].append(sources[i])
+    if len(merged) < len(records):
+        logger.info(f"유사 중복 공고 {len(records) - len(merged)}건 병합 ({len(records)} → {len(merged)})")
+    return list(merged.values())
+
+
+def dedup_frame(df: pd.DataFrame, threshold: float = THRESHOLD, source_column: str = 'source') -> pd.DataFrame:
+    """
+    DataFrame 버전. 묶음별 첫 행을 대표로 하고 빈 값은 같은 묶음의 값으로 채웁니다.
+    source_column이 있으면 묶음의 출처를 ', '로 이어 붙입니다.
+    """
+    if len(df) < 2:
+        return df
+    records = df.to_dict('records')
+    labels = cluster_keys([record_key(r) for r in records], threshold, record_deadlines(records))
+    if len(set(labels)) == len(df):
+        return df
+    frame = df.reset_index(drop=True)
+    result = frame.groupby(labels, sort=False).first()
+    if source_column in df.columns:
+        # 여러 행이 묶인 묶음만 출처를 이어 붙임
+        multi = pd.Series(labels).duplicated(keep=False).to_numpy()
+        pairs = frame.loc[multi, [source_column]].assign(label=labels[multi]).dropna().drop_duplicates()
+        joined = pairs.groupby('label', sort=False)[source_column].agg(lambda s: ', '.join(s.astype(str)))
+        result.loc[joined.index, source_column] = joined
+    logger.info(f"유사 중복 공고 {len(df) - len(result)}건 병합 ({len(df)} → {len(result)})")
+    return result.reset_index(drop=True)
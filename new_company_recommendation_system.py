@@ -17,6 +17,8 @@ import sys
 sys.path.append('/Users/minkim/git_test/kpmg-2025/data2/supabase1')
 from config import SUPABASE_URL, SUPABASE_KEY
 from supabase import create_client, Client
+from table_loader import load_table
+from deadline_index import drop_expired
 
 warnings.filterwarnings('ignore')
 
@@ -56,8 +58,10 @@ class NewCompanyRecommendationSystem:
         if self.supabase:
             try:
                 announcements_result = self.supabase.table('announcements').select('*').execute()
-                self.announcements = pd.DataFrame(announcements_result.data)
-                print(f"✅ Supabase 공고 데이터 로드: {len(self.announcements)}개")
+                announcements = pd.DataFrame(announcements_result.data)
+                # 마감된 공고는 프롬프트에 넣지 않음
+                self.announcements = drop_expired(announcements, 'due_date')
+                print(f"✅ Supabase 공고 데이터 로드: {len(self.announcements)}개 (마감 제외 {len(announcements) - len(self.announcements)}개)")
             except Exception as e:
                 print(f"❌ Supabase 공고 데이터 로드 실패: {e}")
                 self.announcements = pd.DataFrame()
@@ -73,7 +77,7 @@ class NewCompanyRecommendationSystem:
             # 2025 지원사업 데이터
             apply_2025_path = f"{self.data_path}/2025_total_apply.csv"
             if os.path.exists(apply_2025_path):
-                self.apply_2025 = pd.read_csv(apply_2025_path)
+                self.apply_2025 = load_table(apply_2025_path)
                 print(f"✅ 2025 지원사업 데이터 로드: {len(self.apply_2025)}개")
             else:
                 self.apply_2025 = pd.DataFrame()
@@ -82,7 +86,7 @@ class NewCompanyRecommendationSystem:
             # 2024 지원사업 데이터
             apply_2024_path = f"{self.data_path}/2024_total_apply.csv"
             if os.path.exists(apply_2024_path):
-                self.apply_2024 = pd.read_csv(apply_2024_path)
+                self.apply_2024 = load_table(apply_2024_path)
                 print(f"✅ 2024 지원사업 데이터 로드: {len(self.apply_2024)}개")
             else:
                 self.apply_2024 = pd.DataFrame()
@@ -303,31 +307,7 @@ class NewCompanyRecommendationSystem:
             result2 = self.supabase.table('recommendations2').insert(recommendations2_data).execute()
             print(f"✅ recommendations2에 {len(recommendations2_data)}개 추천 저장 완료")
             
-            # recommendations3_active 테이블에 저장 (활성 공고만)
-            active_recommendations = [rec for rec in recs if rec.get('공고상태', '').find('현재 지원 가능') != -1]
-            recommendations3_data = []
-            for i, rec in enumerate(active_recommendations):
-                recommendations3_data.append({
-                    '기업번호': company_id,
-                    '기업명': company_info['name'],
-                    '추천순위': i + 1,
-                    '추천점수': rec.get('추천점수', 0),
-                    '공고이름': rec.get('공고이름', ''),
-                    '추천이유': rec.get('추천이유', ''),
-                    '모집일': rec.get('모집일', ''),
-                    '마감일': rec.get('마감일', ''),
-                    '남은기간/마감여부': rec.get('남은기간', ''),
-                    '투자금액': rec.get('투자금액', ''),
-                    '투자금액사용처': rec.get('투자금액사용처', ''),
-                    '공고상태': rec.get('공고상태', ''),
-                    '공고연도': rec.get('공고연도', '2025'),
-                    '공고월': rec.get('공고월', '9'),
-                    '생성일시': recommendations_data['generated_at']
-                })
-            
-            if recommendations3_data:
-                result3 = self.supabase.table('recommendations3_active').insert(recommendations3_data).execute()
-                print(f"✅ recommendations3_active에 {len(recommendations3_data)}개 활성 추천 저장 완료")
+            # 활성 공고는 별도 테이블 없이 조회 시 마감일 인덱스로 필터링 (deadline_index)
             
             return True
             
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streamlit 목록 페이지네이션 ("더 보기")
+추천/공고 목록을 처음에는 page_size건만 그리고, 버튼을 누를 때마다 page_size건씩 늘립니다.
+호출하는 쪽은 shown_count로 받은 개수만큼 데이터를 먼저 잘라낸 뒤 HTML/위젯을 만들므로
+브라우저로 보내는 양과 렌더링 시간은 화면에 보이는 건수에 비례합니다.
+
+- 표시 개수는 st.session_state['_page_<key>']에 보관
+- reset_token(고객사, 가중치 등)이 바뀌면 첫 페이지로 돌아감
+- "더 보기"는 on_click 콜백으로 개수를 늘려 같은 재실행에서 바로 반영
+"""
+
+from typing import Any, Optional
+
+import streamlit as st
+
+DEFAULT_PAGE_SIZE = 10
+
+
+def _state_key(key: str) -> str:
+    return f"_page_{key}"
+
+
+def shown_count(key: str, total: int, page_size: int = DEFAULT_PAGE_SIZE,
+                reset_token: Optional[Any] = None) -> int:
+    """
+    지금 화면에 그릴 건수 (0 ≤ n ≤ total).
+
+    Args:
+        key: 목록 식별자 (페이지마다 고유)
+        total: 전체 건수
+        reset_token: 값이 바뀌면 첫 페이지부터 다시 표시
+    """
+    state = st.session_state.get(_state_key(key))
+    if state is None or state.get('token') != reset_token:
+        state = {'token': reset_token, 'shown': page_size}
+        st.session_state[_state_key(key)] = state
+    return min(total, state['shown'])
+
+
+def _grow(key: str, page_size: int):
+    st.session_state[_state_key(key)]['shown'] += page_size
+
+
+def load_more(key: str, shown: int, total: int, page_size: int = DEFAULT_PAGE_SIZE) -> None:
+    """표시 건수 안내와 "더 보기" 버튼 (남은 항목이 없으면 안내만)."""
+    if total <= 0:
+        return
+    st.caption(f"{shown} / {total}건 표시")
+    if shown < total:
+        st.button(f"더 보기 (+{min(page_size, total - shown)})", key=f"more_{key}",
+                  on_click=_grow, args=(key, page_size))
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+자동화 파이프라인 계측 도구
+단계/외부 호출 타이머, 카운터, JSON-lines 메트릭 기록을 제공합니다.
+"""
+
+import functools
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+METRICS_FILE = Path('pipeline_metrics.jsonl')
+
+
+class PipelineMetrics:
+    """한 번의 파이프라인 실행에 대한 타이머/카운터 수집기 (스레드 안전)"""
+
+    def __init__(self, run_name: str = 'daily_job', sink: Path = METRICS_FILE):
+        self.run_name = run_name
+        self.sink = Path(sink)
+        self.started_at = datetime.now()
+        self.run_id = self.started_at.strftime('%Y%m%d_%H%M%S')
+        self.timers: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+
+    def record_time(self, name: str, seconds: float):
+        """이름별 호출 수 / 누적 / 최대 시간을 기록합니다."""
+        with self._lock:
+            stat = self.timers.setdefault(name, {'calls': 0, 'total_sec': 0.0, 'max_sec': 0.0})
+            stat['calls'] += 1
+            stat['total_sec'] += seconds
+            stat['max_sec'] = max(stat['max_sec'], seconds)
+
+    @contextmanager
+    def timer(self, name: str):
+        """with 블록의 소요 시간을 기록합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_time(name, time.perf_counter() - start)
+
+    def timed(self, name: str = None):
+        """함수 소요 시간을 기록하는 데코레이터"""
+        def decorator(func):
+            label = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(label):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def incr(self, name: str, value: int = 1):
+        """카운터를 증가시킵니다."""
+        if not value:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + int(value)
+
+    @property
+    def wall_sec(self) -> float:
+        return time.perf_counter() - self._start
+
+    def summary_rows(self) -> List[Dict[str, Any]]:
+        """타이머별 요약 행을 누적 시간 순으로 반환합니다."""
+        wall = self.wall_sec or 1.0
+        rows = []
+        with self._lock:
+            for name, stat in self.timers.items():
+                rows.append({
+                    'name': name,
+                    'calls': stat['calls'],
+                    'total_sec': round(stat['total_sec'], 3),
+                    'avg_ms': round(stat['total_sec'] / stat['calls'] * 1000, 1),
+                    'max_ms': round(stat['max_sec'] * 1000, 1),
+                    'share_pct': round(stat['total_sec'] / wall * 100, 1),
+                })
+        return sorted(rows, key=lambda r: r['total_sec'], reverse=True)
+
+    def format_summary(self) -> str:
+        """로그용 요약 표 문자열을 만듭니다."""
+        lines = [f"{'구간':<40}{'호출':>6}{'누적(초)':>10}{'평균(ms)':>10}{'최대(ms)':>10}{'비중':>7}"]
+        for row in self.summary_rows():
+            lines.append(f"{row['name']:<40}{row['calls']:>6}{row['total_sec']:>10.2f}"
+                         f"{row['avg_ms']:>10.1f}{row['max_ms']:>10.1f}{row['share_pct']:>6.1f}%")
+        with self._lock:
+            counters = dict(self.counters)
+        if counters:
+            lines.append('카운터: ' + ', '.join(f"{k}={v}" for k, v in sorted(counters.items())))
+        lines.append(f"실제 소요: {self.wall_sec:.2f}초")
+        return '\n'.join(lines)
+
+    def to_record(self, **extra) -> Dict[str, Any]:
+        with self._lock:
+            timers = {k: dict(v) for k, v in self.timers.items()}
+            counters = dict(self.counters)
+        return {
+            'run_id': self.run_id,
+            'run_name': self.run_name,
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'wall_sec': round(self.wall_sec, 3),
+            'timers': timers,
+            'counters': counters,
+            **extra,
+        }
+
+    def flush(self, **extra) -> Dict[str, Any]:
+        """실행 기록을 JSON-lines 파일에 한 줄로 추가합니다."""
+        record = self.to_record(**extra)
+        try:
+            with open(self.sink, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except Exception as e:
+            logger.warning(f"메트릭 기록 실패: {e}")
+        return record
+
+
+def load_run_history(path: Path = METRICS_FILE, limit: int = 30) -> List[Dict[str, Any]]:
+    """최근 실행 기록을 최신순으로 반환합니다."""
+    path = Path(path)
+    if not path.exists():
+        return []
+
+    records = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return list(reversed(records[-limit:]))
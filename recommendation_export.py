@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+맞춤 추천 결과 내보내기
+회사별 추천 결과를 평평한 표 하나로 한 번만 만들고(컬럼별 타입 지정),
+같은 표에서 CSV / Parquet / XLSX를 씁니다.
+
+- build_recommendations_table: 컬럼 단위로 한 번에 모아 DataFrame 생성
+  (숫자 → Int64/Float64, 날짜 → datetime64, 반복 값 → category)
+  날짜로 읽을 수 없는 모집일/마감일('상시 모집' 등)은 '<컬럼>(원문)' 컬럼에 원래 글자를 남김
+- write_xlsx: openpyxl write_only 모드로 행을 흘려 씀 (메모리 사용이 행 수와 무관)
+  '전체 추천' 시트 + (선택) 회사별 시트 'No.<번호> company'
+- Parquet은 pyarrow가 있을 때만
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+import pandas as pd
+from openpyxl import Workbook
+
+from date_normalizer import normalize_dates
+
+try:
+    import pyarrow  # noqa: F401  (DataFrame.to_parquet 엔진)
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# (출력 컬럼, 추천 dict 필드) — 추천 행에서 가져오는 컬럼
+REC_FIELDS = [
+    ('추천점수', '추천점수'), ('공고이름', '공고이름'), ('추천이유', '추천이유'),
+    ('모집일', '모집일'), ('마감일', '마감일'), ('남은기간/마감여부', '남은기간'),
+    ('투자금액', '투자금액'), ('투자금액사용처', '투자금액사용처'), ('공고상태', '공고상태'),
+    ('공고연도', '공고연도'), ('공고월', '공고월'),
+]
+NUMERIC_COLUMNS = ['기업번호', '추천점수', '공고연도', '공고월']
+DATE_COLUMNS = ['모집일', '마감일']
+# 날짜 컬럼 → 날짜로 읽지 못한 원문을 담는 컬럼 (마감일 바로 뒤에 배치)
+RAW_DATE_COLUMNS = {col: f'{col}(원문)' for col in DATE_COLUMNS}
+_BASE_COLUMNS = ['기업번호', '기업명', '추천순위'] + [col for col, _ in REC_FIELDS]
+_AFTER_DATES = _BASE_COLUMNS.index(DATE_COLUMNS[-1]) + 1
+EXPORT_COLUMNS = (_BASE_COLUMNS[:_AFTER_DATES] + list(RAW_DATE_COLUMNS.values())
+                  + _BASE_COLUMNS[_AFTER_DATES:] + ['생성일시'])
+CATEGORY_COLUMNS = ['기업명', '남은기간/마감여부', '공고상태']
+SHEET_ALL = '전체 추천'
+
+
+def _numeric(series: pd.Series) -> pd.Series:
+    """정수로 표현되면 Int64, 아니면 Float64 (읽을 수 없는 값은 <NA>)"""
+    values = pd.to_numeric(series, errors='coerce')
+    valid = values.dropna()
+    if (valid % 1 == 0).all():
+        return values.astype('Int64')
+    return values.astype('Float64')
+
+
+def build_recommendations_table(recommendations: Dict[str, Any]) -> pd.DataFrame:
+    """
+    {회사 키: {'company_info', 'recommendations', 'generated_at'}} → 회사 순서대로 이어 붙인 평평한 표
+    """
+    columns: Dict[str, List[Any]] = {col: [] for col in EXPORT_COLUMNS if col not in RAW_DATE_COLUMNS.values()}
+    for data in recommendations.values():
+        info = data['company_info']
+        recs = data['recommendations']
+        n = len(recs)
+        columns['기업번호'].extend([info.get('no')] * n)
+        columns['기업명'].extend([info.get('business_description')] * n)
+        columns['추천순위'].extend(range(1, n + 1))
+        for col, field in REC_FIELDS:
+            columns[col].extend(rec.get(field) for rec in recs)
+        columns['생성일시'].extend([data.get('generated_at')] * n)
+
+    table = pd.DataFrame(columns)
+    for col in NUMERIC_COLUMNS:
+        table[col] = _numeric(table[col])
+    table['추천순위'] = table['추천순위'].astype('int32')
+    for col in DATE_COLUMNS:
+        raw = table[col].astype('string').str.strip()
+        table[col] = normalize_dates(table[col])
+        table[RAW_DATE_COLUMNS[col]] = raw.where(table[col].isna() & (raw != ''))
+    table = table[EXPORT_COLUMNS]
+    table['생성일시'] = pd.to_datetime(table['생성일시'], errors='coerce')
+    for col in EXPORT_COLUMNS:
+        if col in CATEGORY_COLUMNS:
+            table[col] = table[col].astype('string').astype('category')
+        elif table[col].dtype == object:
+            table[col] = table[col].astype('string')
+    return table
+
+
+def _cell_columns(table: pd.DataFrame) -> List[List[Any]]:
+    """컬럼별로 엑셀 셀 값 목록 생성 (결측 → None, 모집일/마감일 → date)"""
+    cells = []
+    for col in table.columns:
+        series = table[col]
+        if col in DATE_COLUMNS:
+            values = [ts.date() if not pd.isna(ts) else None for ts in series]
+        else:
+            values = series.astype(object).where(series.notna(), None).tolist()
+        cells.append(values)
+    return cells
+
+
+def _write_rows(ws, header: List[str], cells: List[List[Any]], positions: Iterable[int]):
+    ws.append(header)
+    for i in positions:
+        ws.append([column[i] for column in cells])
+
+
+def write_xlsx(table: pd.DataFrame, path: Path, per_company_sheets: bool = False) -> Path:
+    """write_only 워크북으로 저장 (셀 값은 컬럼 단위로 한 번만 변환하고 시트마다 행 위치로 골라 씀)"""
+    wb = Workbook(write_only=True)
+    header = list(table.columns)
+    cells = _cell_columns(table)
+    _write_rows(wb.create_sheet(SHEET_ALL), header, cells, range(len(table)))
+
+    if per_company_sheets and len(table):
+        groups = table.groupby(['기업번호', '기업명'], sort=False, dropna=False, observed=True).indices
+        for (no, _), positions in groups.items():
+            title = f"No.{no if not pd.isna(no) else '-'} company"[:31]
+            _write_rows(wb.create_sheet(title), header, cells, positions)
+
+    wb.save(path)
+    return path
+
+
+def export_recommendations(recommendations: Dict[str, Any], out_dir: Path, stem: str,
+                           formats: Iterable[str] = ('xlsx', 'csv'),
+                           per_company_sheets: bool = False) -> Dict[str, Path]:
+    """
+    추천 결과를 formats(xlsx / csv / parquet) 파일로 저장합니다.
+
+    Returns:
+        {형식: 저장 경로} (건너뛴 형식은 제외)
+    """
+    formats = {f.strip().lower() for f in formats if f.strip()}
+    table = build_recommendations_table(recommendations)
+    out_dir = Path(out_dir)
+    paths: Dict[str, Path] = {}
+
+    if 'xlsx' in formats:
+        paths['xlsx'] = write_xlsx(table, out_dir / f"{stem}.xlsx", per_company_sheets)
+    if 'csv' in formats:
+        paths['csv'] = out_dir / f"{stem}.csv"
+        table.to_csv(paths['csv'], index=False, encoding='utf-8-sig')
+    if 'parquet' in formats:
+        if PYARROW_AVAILABLE:
+            paths['parquet'] = out_dir / f"{stem}.parquet"
+            table.to_parquet(paths['parquet'], index=False)
+        else:
+            logger.warning("Parquet 저장 건너뜀: pyarrow가 설치되어 있지 않습니다 (pip install pyarrow)")
+
+    for fmt, path in paths.items():
+        logger.info(f"{fmt.upper()} 파일 저장 완료: {path} ({len(table)}행)")
+    return paths
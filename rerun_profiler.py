@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streamlit 재실행 프로파일링 (opt-in)
+위젯을 조작할 때마다 스크립트 전체가 다시 실행되므로, 한 번의 재실행에서
+어느 구간(데이터 로드 / 채점 / HTML 생성 / 표 렌더링)이 시간을 쓰는지 기록합니다.
+
+켜는 방법
+- 환경변수 STREAMLIT_PROFILE=1 (또는 cprofile)
+- 주소에 ?profile=1 (또는 ?profile=cprofile) — 배포된 앱에서 한 세션만 켤 때
+
+꺼져 있으면 모든 훅이 아무 일도 하지 않습니다 (래핑/측정 없음).
+켜져 있으면 재실행마다 사이드바 펼침 메뉴에 구간별 표를 보여주고
+rerun_profile.jsonl에 한 줄씩 추가합니다 (pipeline_metrics와 같은 형식).
+
+st.rerun() / st.stop()이 있는 페이지는 `with profiler:`로 본문을 감싸 중간에 끝나도 기록되게 합니다.
+감쌀 수 없는 스크립트형 페이지에서 finish 전에 끝난 재실행은 다음 재실행 시작 때 interrupted로 기록합니다.
+"""
+
+import cProfile
+import logging
+import os
+import pstats
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import streamlit as st
+
+from pipeline_metrics import PipelineMetrics
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = 'STREAMLIT_PROFILE'
+PROFILE_PARAM = 'profile'
+PROFILE_FILE = Path(os.getenv('STREAMLIT_PROFILE_FILE', 'rerun_profile.jsonl'))
+
+# 사이드바에 보여줄 최근 재실행 수 / cProfile 상위 함수 수
+HISTORY_SIZE = 20
+CPROFILE_TOP = 20
+
+# 세션에서 아직 finish되지 않은 프로파일러
+_PENDING_KEY = '_rerun_profiler_pending'
+
+
+def _stretch_kwargs() -> Dict[str, Any]:
+    """표를 컨테이너 너비로 (Streamlit 1.46+는 width='stretch', 이전 버전은 use_container_width)."""
+    try:
+        major, minor = (int(part) for part in st.__version__.split('.')[:2])
+    except (AttributeError, ValueError):
+        return {'width': 'stretch'}
+    return {'width': 'stretch'} if (major, minor) >= (1, 46) else {'use_container_width': True}
+
+
+def profiling_mode() -> str:
+    """'' (꺼짐) / 'timer' / 'cprofile'. 쿼리 파라미터가 환경변수보다 우선."""
+    value = os.getenv(PROFILE_ENV, '')
+    try:
+        if hasattr(st, 'query_params'):
+            value = st.query_params.get(PROFILE_PARAM, value)
+        else:
+            value = st.experimental_get_query_params().get(PROFILE_PARAM, [value])[0]
+    except Exception:
+        pass
+    value = str(value).strip().lower()
+    if value in ('', '0', 'off', 'false', 'no'):
+        return ''
+    return 'cprofile' if value == 'cprofile' else 'timer'
+
+
+class _Timed:
+    """호출 시간을 기록하는 래퍼. st.cache_data 함수의 .clear() 등 다른 속성은 원래 함수로 넘김."""
+
+    def __init__(self, func: Callable, name: str, metrics: PipelineMetrics):
+        self.__wrapped__ = func
+        self._name = name
+        self._metrics = metrics
+
+    def __call__(self, *args, **kwargs):
+        with self._metrics.timer(self._name):
+            return self.__wrapped__(*args, **kwargs)
+
+    def __getattr__(self, attr):
+        return getattr(self.__wrapped__, attr)
+
+
+class RerunProfiler:
+    """한 번의 스크립트 재실행에 대한 구간 타이머 (꺼져 있으면 no-op)"""
+
+    def __init__(self, page: str, mode: str = '', sink: Path = PROFILE_FILE):
+        self.page = page
+        self.mode = mode
+        self.metrics = PipelineMetrics(f'rerun:{page}', sink) if mode else None
+        self._section: Optional[str] = None
+        self._section_start = 0.0
+        self._patched: Dict[str, Any] = {}
+        self._namespace: Optional[Dict[str, Any]] = None
+        self._profile: Optional[cProfile.Profile] = None
+        self._finished = False
+        if mode == 'cprofile':
+            try:
+                self._profile = cProfile.Profile()
+                self._profile.enable()
+            except ValueError as e:
+                # 다른 프로파일러가 이미 동작 중 (디버거 등)
+                logger.warning(f"cProfile 시작 실패, 타이머만 사용: {e}")
+                self._profile = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.metrics is not None
+
+    def __enter__(self) -> 'RerunProfiler':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        # st.rerun() / st.stop()도 예외로 빠져나오므로 기록은 남기고, 화면 표시는 정상 종료 때만
+        self.finish(show=exc_type is None, interrupted=exc_type is not None)
+        return False
+
+    # ------------------------------------------------------------------ 훅
+    def timed(self, name: str = None) -> Callable[[Callable], Callable]:
+        """함수 호출 시간을 name(기본: 함수 이름) 타이머에 기록하는 데코레이터."""
+        def decorator(func):
+            if not self.enabled:
+                return func
+            return _Timed(func, name or getattr(func, '__name__', 'call'), self.metrics)
+        return decorator
+
+    def instrument(self, namespace: Dict[str, Any], prefixes: Iterable[str] = ('render_', 'load_')) -> int:
+        """
+        모듈 전역의 render_* / load_* 함수를 타이머 래퍼로 바꿉니다 (finish에서 원래대로 되돌림).
+        전역 이름으로 호출하는 곳은 모두 측정됩니다. 바꾼 함수 수를 반환.
+        """
+        if not self.enabled:
+            return 0
+        prefixes = tuple(prefixes)
+        self._namespace = namespace
+        for name, value in list(namespace.items()):
+            if name.startswith(prefixes) and callable(value) and not isinstance(value, (type, _Timed)):
+                self._patched[name] = value
+                namespace[name] = _Timed(value, name, self.metrics)
+        return len(self._patched)
+
+    def mark(self, section: str):
+        """
+        스크립트형 페이지용 구간 표시. 직전 mark부터 지금까지를 직전 구간으로 기록하고 새 구간을 시작합니다.
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._section is not None:
+            self.metrics.record_time(f'section.{self._section}', now - self._section_start)
+        self._section, self._section_start = section, now
+
+    # ------------------------------------------------------------------ 종료
+    def _cprofile_rows(self) -> List[Dict[str, Any]]:
+        if self._profile is None:
+            return []
+        self._profile.disable()
+        stats = pstats.Stats(self._profile).stats
+        rows = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:CPROFILE_TOP]
+        return [{
+            'function': f"{Path(filename).name}:{line}({func})",
+            'calls': nc,
+            'tottime_ms': round(tt * 1000, 1),
+            'cumtime_ms': round(ct * 1000, 1),
+        } for (filename, line, func), (cc, nc, tt, ct, callers) in rows]
+
+    def finish(self, show: bool = True, interrupted: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        마지막 구간을 닫고 기록을 파일에 추가한 뒤, show면 사이드바에 요약을 표시합니다.
+        한 번만 기록합니다 (두 번째 호출부터는 None).
+        """
+        if not self.enabled or self._finished:
+            return None
+        self._finished = True
+        self.mark(None)
+        if self._namespace is not None:
+            self._namespace.update(self._patched)
+            self._patched = {}
+
+        cprofile_rows = self._cprofile_rows()
+        record = self.metrics.flush(page=self.page, mode=self.mode, cprofile=cprofile_rows,
+                                    interrupted=interrupted)
+
+        history = st.session_state.setdefault('_rerun_profile_history', [])
+        history.append(record['wall_sec'])
+        del history[:-HISTORY_SIZE]
+
+        if show:
+            with st.sidebar.expander(f"⏱ 재실행 프로파일 ({record['wall_sec']:.2f}초)", expanded=False):
+                st.dataframe(self.metrics.summary_rows(), hide_index=True, **_stretch_kwargs())
+                st.caption("최근 재실행(초): " + ', '.join(f"{s:.2f}" for s in history))
+                if cprofile_rows:
+                    st.markdown("**cProfile (누적 시간 상위)**")
+                    st.dataframe(cprofile_rows, hide_index=True, **_stretch_kwargs())
+                st.caption(f"기록 파일: {self.metrics.sink}")
+        return record
+
+
+def start_rerun_profile(page: str) -> RerunProfiler:
+    """
+    재실행 시작 시 호출합니다. 프로파일링이 꺼져 있으면 no-op 프로파일러를 반환.
+    직전 재실행이 finish 없이 끝났으면(st.stop / 예외) 그 기록을 interrupted로 먼저 남깁니다.
+    """
+    try:
+        pending = st.session_state.pop(_PENDING_KEY, None)
+    except Exception:
+        pending = None
+    if pending is not None:
+        pending.finish(show=False, interrupted=True)
+
+    profiler = RerunProfiler(page, profiling_mode())
+    if profiler.enabled:
+        try:
+            st.session_state[_PENDING_KEY] = profiler
+        except Exception:
+            pass
+    return profiler
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로드맵 엔진 (alpha.py 12개월 로드맵)
+승인된 공고 목록을 설명회/마감 이벤트 표로 한 번에 펼치고, 월 단위로 한 번만 묶어
+가로 타임라인과 분기/월 카드를 같은 묶음에서 그립니다.
+
+- build_events: 공고 목록 → 이벤트 표 (melt 한 번, 날짜는 벡터 변환)
+- RoadmapView: 월 묶음(groupby 한 번) + 행별 HTML 조각을 미리 계산
+  - timeline_html: (구분 필터, D-day 표시, 오늘) 단위로 캐시
+  - quarters / card_html: 월 묶음을 그대로 분기로 나눠 사용
+- 월 키는 'YYYY-MM' 문자열이므로 문자열 정렬이 곧 날짜 정렬
+"""
+
+import html
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from date_normalizer import dday_series, normalize_dates, to_iso_strings
+
+# (공고 필드, 이벤트 구분, id 접미사) — 같은 날짜면 이 순서로 표시
+EVENT_TYPES = [('infoSessionDate', '설명회', 'info'), ('dueDate', '마감', 'due')]
+EVENT_COLUMNS = ['date', 'type', 'title', 'agency', 'amountKRW', 'month', 'id', 'url']
+_ANN_FIELDS = ['id', 'title', 'agency', 'amountKRW', 'url']
+
+_CHIPS = {'설명회': "<span class='chip warn'>설명회</span>", '마감': "<span class='chip bad'>마감</span>"}
+
+# 미리 만들어 둔 HTML 틀 (str.format)
+_H_WRAP = "<div class='h-scroll'>{blocks}</div>"
+_H_MONTH = ("<div class='h-month'><div class='h-title'>{month} <span class='h-badge'>· {count}건</span></div>"
+            "{items}</div>")
+_H_ITEM = ("<a class='h-item' href='{href}' target='_blank' rel='noopener'>"
+           "<span class='h-day'>{day}</span><span class='h-ttl'>{title}</span>"
+           "<span class='h-type'>{chip}</span>{dday}</a>")
+_H_DDAY = "<span class='h-due'>&nbsp;D-{days}</span>"
+_CARD = "<div class='month-card'><div class='month-title'>{month}</div>{items}</div>"
+_CARD_ITEM = "<div class='item'>{chip}<span class='title'>{title}</span>&nbsp;<span class='date'>{date}</span></div>"
+
+
+def build_events(anns: Sequence[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    승인 공고 목록을 이벤트 표로 변환합니다 (공고당 설명회/마감 최대 2행, 날짜순).
+
+    Returns:
+        EVENT_COLUMNS 컬럼의 DataFrame. date는 datetime64, type은 category,
+        month는 'YYYY-MM' (날짜를 읽지 못하면 NaN)
+    """
+    fields = [field for field, _, _ in EVENT_TYPES]
+    base = pd.DataFrame(list(anns), columns=_ANN_FIELDS + fields)
+    if base.empty:
+        return pd.DataFrame({
+            'date': pd.Series(dtype='datetime64[ns]'),
+            'type': pd.Categorical([], categories=[kind for _, kind, _ in EVENT_TYPES]),
+            'amountKRW': pd.Series(dtype='float64'),
+            **{col: pd.Series(dtype=object) for col in ('title', 'agency', 'month', 'id', 'url')},
+        })[EVENT_COLUMNS]
+    base['_pos'] = np.arange(len(base))
+
+    events = base.melt(id_vars=_ANN_FIELDS + ['_pos'], value_vars=fields, var_name='_field', value_name='_raw')
+    raw = events['_raw']
+    events = events[raw.notna() & (raw.astype(str).str.strip() != '')]
+
+    type_of = {field: kind for field, kind, _ in EVENT_TYPES}
+    order_of = {field: i for i, (field, _, _) in enumerate(EVENT_TYPES)}
+    events = events.assign(
+        date=normalize_dates(events['_raw']),
+        type=pd.Categorical(events['_field'].map(type_of), categories=[kind for _, kind, _ in EVENT_TYPES]),
+        _order=events['_field'].map(order_of),
+        amountKRW=pd.to_numeric(events['amountKRW'], errors='coerce'),
+    )
+    events = events.sort_values(['date', '_pos', '_order'], kind='stable', na_position='last')
+    events['month'] = events['date'].dt.strftime('%Y-%m')
+    for col in ('title', 'agency', 'url'):
+        events[col] = events[col].fillna('').astype(str)
+    return events[EVENT_COLUMNS].reset_index(drop=True)
+
+
+def quarter_of(month: str) -> str:
+    """'2025-09' → 'Q3 2025'"""
+    return f"Q{(int(month[5:7]) - 1) // 3 + 1} {month[:4]}"
+
+
+class RoadmapView:
+    """승인 공고 1세트의 로드맵 (이벤트 표 + 월 묶음 + 렌더링 캐시)"""
+
+    def __init__(self, events: pd.DataFrame):
+        self.events = events
+        # 월별 행 위치 (events가 날짜순이므로 각 묶음 안도 날짜순)
+        self.groups: Dict[str, np.ndarray] = events.groupby('month', sort=True).indices
+        self.months: List[str] = sorted(self.groups)
+
+        # 행별 HTML 조각은 한 번만 계산
+        self._title = events['title'].map(html.escape).to_numpy()
+        self._href = events['url'].replace('', '#').map(html.escape).to_numpy()
+        self._chip = events['type'].astype(object).map(_CHIPS).to_numpy()
+        self._day = events['date'].dt.strftime('%d').fillna('--').to_numpy()
+        self._iso = to_iso_strings(events['date']).to_numpy()
+        self._types = events['type'].astype(object).to_numpy()
+        self._timeline: Dict[Tuple, str] = {}
+        self._cards: Dict[str, str] = {}
+
+    @property
+    def empty(self) -> bool:
+        return self.events.empty
+
+    def timeline_html(self, types: Iterable[str] = (), show_dday: bool = True,
+                      today: Optional[date] = None) -> str:
+        """
+        월별 가로 타임라인 HTML. types가 비어 있으면 전체 구분을 표시합니다.
+        같은 (types, show_dday, today)면 저장된 HTML을 반환.
+        """
+        today = today or date.today()
+        key = (tuple(types), show_dday, today)
+        if key in self._timeline:
+            return self._timeline[key]
+
+        keep = np.isin(self._types, list(types)) if types else np.ones(len(self._types), dtype=bool)
+        dday = np.full(len(self._types), '', dtype=object)
+        if show_dday:
+            # D-표시는 미래 기준만 강조
+            days = dday_series(self.events['date'], today)
+            future = (days >= 0).fillna(False).to_numpy()
+            dday[future] = [_H_DDAY.format(days=d) for d in days[future]]
+
+        blocks = []
+        for month in self.months:
+            positions = self.groups[month][keep[self.groups[month]]]
+            if not len(positions):
+                continue
+            items = ''.join(_H_ITEM.format(href=self._href[i], day=self._day[i], title=self._title[i],
+                                           chip=self._chip[i], dday=dday[i]) for i in positions)
+            blocks.append(_H_MONTH.format(month=month, count=len(positions), items=items))
+        self._timeline[key] = _H_WRAP.format(blocks=''.join(blocks))
+        return self._timeline[key]
+
+    def quarters(self) -> Dict[str, List[str]]:
+        """분기 라벨 → 월 키 목록 (월 묶음을 그대로 나눔, 시간순)"""
+        quarters: Dict[str, List[str]] = {}
+        for month in self.months:
+            quarters.setdefault(quarter_of(month), []).append(month)
+        return quarters
+
+    def card_html(self, month: str) -> str:
+        """분기 보기의 월 카드 HTML (전체 구분, 날짜순)"""
+        if month not in self._cards:
+            items = ''.join(_CARD_ITEM.format(chip=self._chip[i], title=self._title[i], date=self._iso[i])
+                            for i in self.groups[month])
+            self._cards[month] = _CARD.format(month=month, items=items)
+        return self._cards[month]
+
+    def month_items(self) -> Dict[str, List[Dict[str, str]]]:
+        """월 키 → [{'id','title','type','date'}] (고객사 roadmap 저장 형식)"""
+        suffix = {kind: tag for _, kind, tag in EVENT_TYPES}
+        ids = self.events['id'].astype(str).to_numpy()
+        titles = self.events['title'].to_numpy()
+        return {month: [{'id': f"{ids[i]}-{suffix[self._types[i]]}", 'title': titles[i],
+                         'type': self._types[i], 'date': self._iso[i]} for i in self.groups[month]]
+                for month in self.months}
@@ -16,10 +16,11 @@ def main():
     print("2. 통합 자동화 시스템 실행 (콘솔)")
     print("3. 데이터 수집만 실행")
     print("4. 추천 생성만 실행")
-    print("5. 종료")
+    print("5. 통합 스케줄러 실행 (모든 수집/추천 작업을 한 프로세스에서)")
+    print("6. 종료")
     
     while True:
-        choice = input("\n선택하세요 (1-5): ").strip()
+        choice = input("\n선택하세요 (1-6): ").strip()
         
         if choice == '1':
             print("\nStreamlit 앱을 실행합니다...")
@@ -90,11 +91,17 @@ def main():
             break
             
         elif choice == '5':
+            print("\n통합 스케줄러를 실행합니다...")
+            from auto_scheduler import build_default_scheduler
+            build_default_scheduler().start()
+            break
+            
+        elif choice == '6':
             print("프로그램을 종료합니다.")
             break
             
         else:
-            print("잘못된 선택입니다. 1-5 중에서 선택하세요.")
+            print("잘못된 선택입니다. 1-6 중에서 선택하세요.")
 
 if __name__ == "__main__":
     main()
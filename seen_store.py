@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+회사별 공고 확인(seen) 집합
+이미 확인한 공고를 64비트 해시의 정렬 배열로 보관하고, 새 공고는 이분 탐색으로 골라냅니다.
+목록 전체를 비교하거나 다시 저장하지 않으므로 확인 기록이 수천 건이어도 비용은 현재 공고 수에 비례합니다.
+
+- announcement_keys: 공고이름(NFKC/공백 정규화) → int64 해시 (Postgres bigint에 그대로 저장)
+- SeenSet.seen_mask / new_keys: 현재 공고 중 확인한 것 / 아직 확인하지 않은 키
+- SeenSet.add: 새 키만 병합하고 실제로 추가된 키(delta)를 반환 → 저장소에는 delta만 추가
+"""
+
+import hashlib
+import threading
+import unicodedata
+from typing import Any, Iterable
+
+import numpy as np
+
+
+def announcement_key(name: Any) -> int:
+    """공고 식별 해시 (표기 차이: 전각/반각, 연속 공백은 같은 공고로 봄)"""
+    text = ' '.join(unicodedata.normalize('NFKC', str(name)).split())
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big', signed=True)
+
+
+def announcement_keys(names: Iterable[Any]) -> np.ndarray:
+    """announcement_key의 배열 버전 (int64)"""
+    names = list(names)
+    return np.fromiter((announcement_key(n) for n in names), dtype=np.int64, count=len(names))
+
+
+class SeenSet:
+    """확인한 공고 키의 정렬 배열 (프로세스 안에서 여러 세션이 공유해도 되도록 병합은 잠금)"""
+
+    def __init__(self, keys: Iterable[int] = ()):
+        self._keys = np.unique(np.fromiter(keys, dtype=np.int64))
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def seen_mask(self, keys: np.ndarray) -> np.ndarray:
+        """keys 각각이 이미 확인한 키인지 (O(n log m))"""
+        keys = np.asarray(keys, dtype=np.int64)
+        seen = self._keys
+        if not len(seen) or not len(keys):
+            return np.zeros(len(keys), dtype=bool)
+        pos = np.minimum(np.searchsorted(seen, keys), len(seen) - 1)
+        return seen[pos] == keys
+
+    def new_keys(self, keys: np.ndarray) -> np.ndarray:
+        """아직 확인하지 않은 키 (중복 제거, 정렬)"""
+        keys = np.unique(np.asarray(keys, dtype=np.int64))
+        return keys[~self.seen_mask(keys)]
+
+    def add(self, keys: np.ndarray) -> np.ndarray:
+        """키를 병합하고 새로 추가된 키만 반환합니다."""
+        with self._lock:
+            delta = self.new_keys(keys)
+            if len(delta):
+                self._keys = np.union1d(self._keys, delta)
+        return delta
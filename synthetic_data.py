@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+합성 데이터 생성기 (부하/벤치마크용)
+시드 고정으로 K-스타트업(XML), 기업마당(JSON), alpha_companies 형태의 레코드를
+10^3 ~ 10^6 규모로 생성하고, 메모리에 모으지 않고 CSV / Parquet / XML / JSON으로 바로 씁니다.
+
+- 지역/단계/금액/접수기간/한글 제목은 실제 공고와 비슷한 분포로 뽑음
+- dup_rate 비율만큼 앞서 만든 사업을 제목만 조금 바꿔 다시 내보냄 (출처 간 중복 포함)
+
+사용 예:
+    python synthetic_data.py announcements --source mixed --count 100000 --format csv --out anns.csv
+    python synthetic_data.py companies --count 10000 --format parquet --out companies.parquet
+"""
+
+import csv
+import json
+import random
+import sys
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# ------------------------------------------------------------------ 분포
+REGIONS = [('전국', 35), ('서울', 15), ('경기', 12), ('부산', 5), ('인천', 4), ('대구', 4), ('대전', 4),
+           ('광주', 3), ('울산', 2), ('세종', 1), ('강원', 2), ('충북', 2), ('충남', 2), ('전북', 2),
+           ('전남', 2), ('경북', 2), ('경남', 2), ('제주', 1)]
+REGION_CITIES = {
+    '서울': '서울특별시', '경기': '경기도', '부산': '부산광역시', '인천': '인천광역시', '대구': '대구광역시',
+    '대전': '대전광역시', '광주': '광주광역시', '울산': '울산광역시', '세종': '세종특별자치시',
+    '강원': '강원특별자치도', '충북': '충청북도', '충남': '충청남도', '전북': '전북특별자치도',
+    '전남': '전라남도', '경북': '경상북도', '경남': '경상남도', '제주': '제주특별자치도',
+}
+DISTRICTS = ['중구', '동구', '서구', '남구', '북구', '연수구', '강남구', '성남시', '수원시', '유성구', '해운대구']
+
+# (단계, 가중치, 사업경력 표기, 신청대상)
+STAGES = [('예비', 25, '예비창업자', '예비창업자'),
+          ('초기', 45, '1년미만,2년미만,3년미만', '창업 3년 이내 기업'),
+          ('성장', 30, '3년미만,5년미만,7년미만', '창업 7년 이내 기업')]
+
+AGENCIES = [('중소벤처기업부', 30), ('과학기술정보통신부', 12), ('산업통상자원부', 10), ('창업진흥원', 12),
+            ('정보통신산업진흥원', 6), ('한국콘텐츠진흥원', 5), ('보건복지부', 4), ('농림축산식품부', 4),
+            ('서울경제진흥원', 5), ('경기도경제과학진흥원', 5), ('부산테크노파크', 3), ('중소기업유통센터', 4)]
+
+FIELDS = ['AI', '빅데이터', '바이오헬스', '친환경', '스마트제조', '콘텐츠', '핀테크', '모빌리티', '푸드테크',
+          '에듀테크', '반도체', '로봇', '탄소중립', '관광', '소셜벤처', '디지털전환']
+PROGRAMS = [('초기창업패키지', '사업화'), ('예비창업패키지', '사업화'), ('창업도약패키지', '사업화'),
+            ('기술개발 지원사업', 'R&D'), ('R&D 실증 지원사업', 'R&D'), ('수출바우처', '글로벌'),
+            ('글로벌 진출 지원사업', '글로벌'), ('판로개척 지원사업', '판로·마케팅'), ('마케팅 지원사업', '판로·마케팅'),
+            ('액셀러레이팅 프로그램', '멘토링·컨설팅'), ('컨설팅 바우처', '멘토링·컨설팅'), ('시설·공간 지원사업', '시설·공간'),
+            ('융자 지원사업', '융자'), ('인력양성 프로그램', '인력')]
+SUFFIXES = ['참여기업 모집', '모집 공고', '지원 공고', '수요기업 모집', '신청 안내']
+USES = ['인건비', '시제품', '마케팅', '컨설팅', 'R&D', '전시회', '수출', '장비']
+
+# 지원금액 (원): 로그정규 분포, 중앙값 약 5천만원
+AMOUNT_MEDIAN = 50_000_000
+AMOUNT_SIGMA = 1.1
+
+INDUSTRIES = [('IT', 35), ('제조', 20), ('바이오', 8), ('콘텐츠', 8), ('유통', 8), ('교육', 5),
+              ('환경', 5), ('식품', 5), ('관광', 3), ('금융', 3)]
+MAIN_BUSINESS = ['정보통신업', '제조업', '도매 및 소매업', '전문, 과학 및 기술 서비스업', '교육 서비스업',
+                 '출판, 영상, 방송통신 및 정보서비스업', '사업시설 관리 및 사업지원 서비스업']
+ITEM_TEMPLATES = ['{field} 기반 {target} 플랫폼', '{target}용 {field} 솔루션', '{field} {target} 자동화 서비스',
+                  '{target} 특화 {field} SaaS', '{field} 활용 {target} 관리 프로그램']
+ITEM_TARGETS = ['소상공인', '학원', '병원', '물류', '농가', '제조공장', '쇼핑몰', '스포츠센터', '호텔', '건설현장']
+CERTIFICATIONS = ['벤처기업', '메인비즈', '이노비즈', '성과공유기업', '연구개발전담부서', '기업부설연구소',
+                  '직무발명보상 우수기업', '내일채움공제', '여성기업']
+INVESTOR_TYPES = ['-', '엔젤', 'VC', 'AC', '정책금융']
+
+COMPANY_COLUMNS = ['No.', '기업형태', '대표자 생년월일', '소재지', '설립연월일', '주업종 (사업자등록증 상)',
+                   '주요 산업', '사업아이템 한 줄 소개', '#매출', '#고용', '#수출', '#투자', '투자자유형',
+                   '#기술특허(등록)', '#기업인증', '특화분야']
+
+# 중복 후보로 기억해 둘 최근 사업 수 (메모리 상한)
+DUP_RESERVOIR = 1000
+
+
+def _weighted(rng: random.Random, items: List[Tuple]) -> Tuple:
+    return rng.choices(items, weights=[it[1] for it in items])[0]
+
+
+def format_amount(amount: int) -> str:
+    """'최대 5억원', '최대 3천만원' 같은 공고 표기"""
+    if amount >= 100_000_000:
+        eok, rest = divmod(amount, 100_000_000)
+        cheon = rest // 10_000_000
+        return f"최대 {eok}억 {cheon}천만원" if cheon else f"최대 {eok}억원"
+    if amount >= 10_000_000:
+        return f"최대 {amount // 10_000_000}천만원"
+    return f"최대 {amount // 10_000:,}만원"
+
+
+# ------------------------------------------------------------------ 공고
+def generate_programs(count: int, seed: int = 42, dup_rate: float = 0.05,
+                      start: Optional[date] = None, span_days: int = 365) -> Iterator[Dict[str, Any]]:
+    """
+    출처와 무관한 사업 레코드를 count개 생성합니다.
+
+    dup_rate 확률로 최근 사업을 제목만 바꿔 다시 내보내며 'duplicate_of'에 원래 번호를 남깁니다.
+    """
+    rng = random.Random(seed)
+    start = start or date(date.today().year, 1, 1)
+    reservoir: List[Dict[str, Any]] = []
+
+    for i in range(count):
+        if reservoir and rng.random() < dup_rate:
+            original = rng.choice(reservoir)
+            program = dict(original)
+            program['title'] = _perturb_title(rng, original['title'])
+            program['duplicate_of'] = original['seq']
+            program['seq'] = i
+            yield program
+            continue
+
+        region = _weighted(rng, REGIONS)[0]
+        stage, _, experience, target = _weighted(rng, STAGES)
+        field = rng.choice(FIELDS)
+        program_name, category = rng.choice(PROGRAMS)
+        begin = start + timedelta(days=rng.randrange(span_days))
+        end = begin + timedelta(days=rng.choice([14, 21, 30, 30, 45, 60]))
+        amount = int(min(2_000_000_000, max(5_000_000, rng.lognormvariate(0, AMOUNT_SIGMA) * AMOUNT_MEDIAN)))
+        amount = round(amount, -6)
+        region_prefix = f"[{region}] " if region != '전국' and rng.random() < 0.5 else ''
+        program = {
+            'seq': i,
+            'title': f"{region_prefix}{begin.year}년 {field} {program_name} {rng.choice(SUFFIXES)}",
+            'agency': _weighted(rng, AGENCIES)[0],
+            'region': region,
+            'stage': stage,
+            'experience': experience,
+            'target': target,
+            'field': field,
+            'category': category,
+            'amount': amount,
+            'uses': rng.sample(USES, rng.randint(1, 3)),
+            'begin': begin,
+            'end': end,
+            'duplicate_of': None,
+        }
+        if len(reservoir) < DUP_RESERVOIR:
+            reservoir.append(program)
+        else:
+            reservoir[rng.randrange(DUP_RESERVOIR)] = program
+        yield program
+
+
+def _perturb_title(rng: random.Random, title: str) -> str:
+    """출처마다 제목이 조금씩 다른 경우를 흉내냅니다."""
+    choice = rng.randrange(4)
+    if choice == 0:
+        return title.replace('년 ', '년도 ', 1)
+    if choice == 1:
+        return f"(재공고) {title}"
+    if choice == 2:
+        return title.replace(' 모집', ' 모집 공고', 1) if ' 모집' in title else f"{title} 공고"
+    return title.replace(' ', '', 1)
+
+
+def to_kstartup(program: Dict[str, Any]) -> Dict[str, str]:
+    """K-스타트업 XML(col name=...) 항목 형태"""
+    return {
+        'pbanc_sn': str(100000 + program['seq']),
+        '사업공고명': program['title'],
+        '통합사업명': program['title'].split('년 ', 1)[-1],
+        '공고기관명': program['agency'],
+        '공고내용': f"{program['field']} 분야 {program['target']} 대상 {program['category']} 지원",
+        '신청대상': program['target'],
+        '신청대상내용': f"{program['experience']} {program['field']} 분야 기업",
+        '지원지역': program['region'],
+        '지원사업분류': program['category'],
+        '사업경력': program['experience'],
+        '사업대상연령': '만 20세 이상 ~ 만 39세 이하' if program['stage'] == '예비' else '제한없음',
+        '감독기관': program['agency'],
+        '접수시작일': program['begin'].strftime('%Y%m%d'),
+        '접수종료일': program['end'].strftime('%Y%m%d'),
+        '모집진행여부': 'Y',
+        '통합공고여부': 'N',
+        '지원금액': format_amount(program['amount']),
+        '지원금액상세': f"{format_amount(program['amount'])} ({', '.join(program['uses'])})",
+        '상세페이지URL': f"https://www.k-startup.go.kr/web/contents/bizpbanc-ongoing.do?pbancSn={100000 + program['seq']}",
+    }
+
+
+def to_bizinfo(program: Dict[str, Any]) -> Dict[str, str]:
+    """기업마당 JSON(jsonArray.item) 항목 형태"""
+    pblanc_id = f"PBLN_{program['seq']:012d}"
+    return {
+        'pblancId': pblanc_id,
+        'pblancNm': program['title'],
+        'jrsdInsttNm': program['agency'],
+        'excInsttNm': program['agency'],
+        'description': f"{program['field']} 분야 {program['target']} 대상 {program['category']} 지원",
+        'reqstBeginEndDe': f"{program['begin'].isoformat()} ~ {program['end'].isoformat()}",
+        'trgetNm': program['target'],
+        'pldirSportRealmLclasCodeNm': program['category'],
+        'hashTags': ','.join([program['region'], program['field'], program['category']]),
+        '지원금액': format_amount(program['amount']),
+        'creatPnttm': f"{program['begin'].isoformat()} 09:00:00",
+        'pblancUrl': f"https://www.bizinfo.go.kr/web/lay1/bbs/S1T122C128/AS/74/view.do?pblancId={pblanc_id}",
+    }
+
+
+def generate_announcements(count: int, source: str = 'mixed', seed: int = 42,
+                           dup_rate: float = 0.05, **kwargs) -> Iterator[Dict[str, str]]:
+    """
+    출처 형태의 공고 레코드를 생성합니다.
+
+    Args:
+        source: 'kstartup' | 'bizinfo' | 'mixed' (mixed는 출처를 섞고 'source' 컬럼을 붙임.
+                중복 사업은 다른 출처로 나올 수 있음)
+    """
+    rng = random.Random(seed + 1)
+    for program in generate_programs(count, seed=seed, dup_rate=dup_rate, **kwargs):
+        if source == 'kstartup':
+            yield to_kstartup(program)
+        elif source == 'bizinfo':
+            yield to_bizinfo(program)
+        else:
+            shape = 'kstartup' if rng.random() < 0.5 else 'bizinfo'
+            record = to_kstartup(program) if shape == 'kstartup' else to_bizinfo(program)
+            record['source'] = shape
+            yield record
+
+
+def announcement_columns(source: str) -> List[str]:
+    """출처별 컬럼 순서 (mixed는 두 출처 컬럼의 합집합 + source)"""
+    sample = next(generate_programs(1, dup_rate=0))
+    if source == 'kstartup':
+        return list(to_kstartup(sample))
+    if source == 'bizinfo':
+        return list(to_bizinfo(sample))
+    return list(to_kstartup(sample)) + list(to_bizinfo(sample)) + ['source']
+
+
+# ------------------------------------------------------------------ 고객사
+def generate_companies(count: int, seed: int = 42) -> Iterator[Dict[str, Any]]:
+    """alpha_companies.csv 형태의 고객사 레코드를 생성합니다."""
+    rng = random.Random(seed)
+    for i in range(1, count + 1):
+        region = _weighted(rng, [r for r in REGIONS if r[0] != '전국'])[0]
+        founded = date.today() - timedelta(days=int(min(15 * 365, rng.expovariate(1 / (4 * 365)))))
+        born = date(rng.randint(1960, 2000), rng.randint(1, 12), rng.randint(1, 28))
+        industry = _weighted(rng, INDUSTRIES)[0]
+        field = rng.choice(FIELDS)
+        revenue = int(rng.lognormvariate(0, 1.2) * 10)
+        employees = max(1, int(rng.lognormvariate(0, 0.9) * 8))
+        yield {
+            'No.': i,
+            '기업형태': '법인' if rng.random() < 0.8 else '개인',
+            '대표자 생년월일': born.strftime('%Y.%m.%d.'),
+            '소재지': f"{REGION_CITIES[region]} {rng.choice(DISTRICTS)}",
+            '설립연월일': founded.strftime('%Y.%m.%d.'),
+            '주업종 (사업자등록증 상)': rng.choice(MAIN_BUSINESS),
+            '주요 산업': industry,
+            '사업아이템 한 줄 소개': rng.choice(ITEM_TEMPLATES).format(field=field, target=rng.choice(ITEM_TARGETS)),
+            '#매출': f"{revenue}억 원" if revenue else '-',
+            '#고용': f"{employees}명",
+            '#수출': f"{rng.randint(1, 50)}억 원" if rng.random() < 0.15 else '-',
+            '#투자': f"{rng.randint(1, 100)}억 원" if rng.random() < 0.25 else '-',
+            '투자자유형': rng.choice(INVESTOR_TYPES),
+            '#기술특허(등록)': int(rng.expovariate(1 / 2)),
+            '#기업인증': ', '.join(rng.sample(CERTIFICATIONS, rng.randint(0, 4))),
+            '특화분야': field if rng.random() < 0.7 else '',
+        }
+
+
+# ------------------------------------------------------------------ 출력 (스트리밍)
+def _peek(records: Iterable[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+    iterator = iter(records)
+    first = next(iterator, None)
+    return first, iterator
+
+
+def write_csv(records: Iterable[Dict[str, Any]], path: str, columns: Optional[List[str]] = None) -> int:
+    """레코드를 한 줄씩 CSV로 씁니다 (utf-8-sig). 쓴 행 수를 반환."""
+    first, rest = _peek(records)
+    if first is None:
+        return 0
+    columns = columns or list(first)
+    written = 0
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerow(first)
+        written = 1
+        for record in rest:
+            writer.writerow(record)
+            written += 1
+    return written
+
+
+def write_parquet(records: Iterable[Dict[str, Any]], path: str, columns: Optional[List[str]] = None,
+                  batch_size: int = 50_000) -> int:
+    """batch_size 행씩 Parquet row group으로 씁니다 (pyarrow 필요). 모든 컬럼은 문자열."""
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError("Parquet 출력에는 pyarrow가 필요합니다: pip install pyarrow")
+    first, rest = _peek(records)
+    if first is None:
+        return 0
+    columns = columns or list(first)
+    schema = pa.schema([(c, pa.string()) for c in columns])
+    written = 0
+    batch = [first]
+    with pq.ParquetWriter(path, schema) as writer:
+        for record in rest:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                written += _write_batch(writer, schema, columns, batch)
+                batch = []
+        if batch:
+            written += _write_batch(writer, schema, columns, batch)
+    return written
+
+
+def _write_batch(writer, schema, columns: List[str], batch: List[Dict[str, Any]]) -> int:
+    arrays = {c: [None if r.get(c) is None else str(r.get(c)) for r in batch] for c in columns}
+    writer.write_table(pa.Table.from_pydict(arrays, schema=schema))
+    return len(batch)
+
+
+def write_kstartup_xml(records: Iterable[Dict[str, Any]], path: str, columns: Optional[List[str]] = None) -> int:
+    """K-스타트업 OpenAPI 응답 형태(<item><col name=...>)로 씁니다."""
+    written = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<results><data>\n')
+        for record in records:
+            cols = ''.join(f"<col name={quoteattr(k)}>{escape(str(v))}</col>" for k, v in record.items())
+            f.write(f"<item>{cols}</item>\n")
+            written += 1
+        f.write(f"</data><totalCount>{written}</totalCount></results>\n")
+    return written
+
+
+def write_bizinfo_json(records: Iterable[Dict[str, Any]], path: str, columns: Optional[List[str]] = None) -> int:
+    """기업마당 API 응답 형태({"jsonArray": {"item": [...]}})로 한 항목씩 씁니다."""
+    written = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"jsonArray": {"item": [\n')
+        for record in records:
+            if written:
+                f.write(',\n')
+            f.write(json.dumps(record, ensure_ascii=False))
+            written += 1
+        f.write('\n]}}\n')
+    return written
+
+
+WRITERS = {'csv': write_csv, 'parquet': write_parquet, 'xml': write_kstartup_xml, 'json': write_bizinfo_json}
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='합성 공고/고객사 데이터 생성기')
+    parser.add_argument('kind', choices=['announcements', 'companies'])
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--source', choices=['kstartup', 'bizinfo', 'mixed'], default='mixed')
+    parser.add_argument('--format', choices=sorted(WRITERS), default='csv')
+    parser.add_argument('--out', required=True)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--dup-rate', type=float, default=0.05)
+    args = parser.parse_args()
+
+    if args.format == 'parquet' and not PYARROW_AVAILABLE:
+        print("Parquet 출력에는 pyarrow가 필요합니다: pip install pyarrow")
+        sys.exit(1)
+
+    if args.kind == 'companies':
+        records = generate_companies(args.count, seed=args.seed)
+        columns = COMPANY_COLUMNS
+    else:
+        records = generate_announcements(args.count, source=args.source, seed=args.seed, dup_rate=args.dup_rate)
+        columns = announcement_columns(args.source)
+
+    started = datetime.now()
+    written = WRITERS[args.format](records, args.out, columns)
+    elapsed = (datetime.now() - started).total_seconds()
+    print(f"{args.kind} {written:,}건 → {args.out} ({elapsed:.1f}초)")
+    if written == 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CSV/XLSX 로더
+파일 앞부분만 읽어 인코딩(UTF-8 BOM / UTF-8 / CP949)을 판별하고,
+알려진 스키마(alpha_companies.csv, 20xx_total_apply.csv, 기업마당 내보내기)는
+명시적 dtype / usecols 로 한 번에 읽습니다.
+
+- sniff_encoding: 앞부분 샘플로 인코딩 판별 (전체 파일을 두 번 파싱하지 않음)
+  샘플 뒤에서 UTF-8 디코딩이 실패하면 load_table이 CP949로 한 번 더 읽음
+- detect_schema: 헤더로 알려진 스키마 판별
+- load_table: 위 결과를 적용해 DataFrame 반환 (TABLE_LOADER_PYARROW=1 이면 pyarrow 엔진 사용)
+"""
+
+import codecs
+import csv
+import io
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SNIFF_BYTES = 64 * 1024
+
+# pyarrow CSV 엔진 사용 여부 (설치되어 있을 때만)
+USE_PYARROW = os.getenv('TABLE_LOADER_PYARROW', '0') == '1'
+
+# 알려진 스키마: 헤더에 required 컬럼이 모두 있으면 해당 스키마로 판단
+# usecols가 None이면 전체 컬럼을 읽음
+KNOWN_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    'alpha_companies': {
+        'required': ['No.', '기업형태', '사업아이템 한 줄 소개'],
+        'dtype': {'No.': 'Int64'},
+        'text_dtype': True,
+        'usecols': None,
+    },
+    'total_apply': {
+        'required': ['사업명', '주관기관', '지원금액', '신청기간'],
+        'dtype': {},
+        'text_dtype': True,
+        'usecols': None,
+    },
+    # 기업마당 내보내기: 본문(description/detail_text) 등 대용량 텍스트는 추천 화면에서 쓰지 않음
+    'bizinfo_export': {
+        'required': ['id', 'title', 'pubDate', 'apply_start', 'apply_end'],
+        'dtype': {},
+        'text_dtype': True,
+        'usecols': ['id', 'title', 'link', 'author', 'excInsttNm', 'lcategory', 'pubDate',
+                    'apply_start', 'apply_end', 'd_days', 'status', 'trgetNm', 'hashTags',
+                    'rceptEngnHmpgUrl'],
+    },
+}
+
+
+def _read_sample(source, size: int = SNIFF_BYTES) -> bytes:
+    """경로 또는 파일 객체에서 앞부분 바이트만 읽습니다 (파일 객체는 위치를 되돌림)."""
+    if hasattr(source, 'read'):
+        pos = source.tell()
+        sample = source.read(size)
+        source.seek(pos)
+        return sample if isinstance(sample, bytes) else sample.encode('utf-8')
+    with open(source, 'rb') as f:
+        return f.read(size)
+
+
+def sniff_encoding(source, sample: Optional[bytes] = None) -> str:
+    """앞부분 샘플로 인코딩을 판별합니다: utf-8-sig / utf-8 / cp949"""
+    sample = sample if sample is not None else _read_sample(source)
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    try:
+        # 샘플 끝에서 잘린 멀티바이트 문자는 허용 (final=False)
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'cp949'
+
+
+def read_header(sample: bytes, encoding: str) -> List[str]:
+    """샘플의 첫 줄을 CSV 헤더로 파싱합니다."""
+    text = codecs.getincrementaldecoder(encoding)(errors='replace').decode(sample, final=False)
+    first_line = text.splitlines()[0] if text else ''
+    return next(csv.reader(io.StringIO(first_line)), [])
+
+
+def detect_schema(header: List[str]) -> Optional[str]:
+    """헤더로 알려진 스키마 이름을 반환합니다."""
+    columns = set(header)
+    for name, schema in KNOWN_SCHEMAS.items():
+        if all(col in columns for col in schema['required']):
+            return name
+    return None
+
+
+def schema_read_options(header: List[str], schema_name: Optional[str]) -> Dict[str, Any]:
+    """스키마에 맞는 dtype / usecols 옵션을 만듭니다 (헤더에 있는 컬럼만)."""
+    if not schema_name:
+        return {}
+    schema = KNOWN_SCHEMAS[schema_name]
+    usecols = [c for c in header if c in schema['usecols']] if schema['usecols'] else list(header)
+    # 문자열 컬럼은 object로 고정해 타입 추론 비용과 '001' → 1 같은 변환을 막음
+    dtype = {c: str for c in usecols} if schema['text_dtype'] else {}
+    dtype.update({c: t for c, t in schema['dtype'].items() if c in usecols})
+    options = {'dtype': dtype}
+    if schema['usecols']:
+        options['usecols'] = usecols
+    return options
+
+
+def _is_excel(source) -> bool:
+    name = str(getattr(source, 'name', source))
+    return name.lower().endswith(('.xls', '.xlsx'))
+
+
+def load_table(source, use_pyarrow: Optional[bool] = None) -> pd.DataFrame:
+    """
+    CSV 또는 XLSX를 한 번에 읽습니다.
+
+    Args:
+        source: 파일 경로 또는 (name 속성이 있는) 파일 객체
+        use_pyarrow: pyarrow CSV 엔진 사용 여부 (None이면 TABLE_LOADER_PYARROW 환경변수)
+    """
+    if _is_excel(source):
+        return pd.read_excel(source)
+
+    sample = _read_sample(source)
+    encoding = sniff_encoding(source, sample)
+    header = read_header(sample, encoding)
+    schema_name = detect_schema(header)
+    options = schema_read_options(header, schema_name)
+
+    use_pyarrow = USE_PYARROW if use_pyarrow is None else use_pyarrow
+    if use_pyarrow and PYARROW_AVAILABLE:
+        try:
+            return pd.read_csv(source, encoding=encoding, engine='pyarrow', **options)
+        except Exception as e:
+            # 여러 줄 텍스트 셀 등 pyarrow가 지원하지 않는 형식 → C 엔진으로 재시도
+            logger.debug(f"pyarrow 엔진 실패, C 엔진 사용: {e}")
+            if hasattr(source, 'seek'):
+                source.seek(0)
+
+    try:
+        return pd.read_csv(source, encoding=encoding, low_memory=False, **options)
+    except UnicodeDecodeError as e:
+        # 앞부분은 UTF-8(ASCII)로 보였지만 샘플 뒤에서 CP949 문자가 나온 경우
+        if encoding == 'cp949':
+            raise
+        logger.info(f"{encoding} 디코딩 실패 ({e.reason}), cp949로 다시 읽습니다")
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        return pd.read_csv(source, encoding='cp949', low_memory=False, **options)
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+회사별 추천 Top-K 저장소
+(회사, 가중치 프로필)마다 상위 K개 공고를 한 번에 계산해 저장해 두고,
+고객사 전환 시에는 재계산 없이 조회만 합니다.
+
+무효화 규칙
+- 회사 프로필이 바뀌면 해당 회사 항목만 다시 계산
+- 공고가 삭제되면 그 공고를 Top-K에 가진 항목만 다시 계산
+- 공고가 추가/변경되면 모든 항목이 다시 계산 대상 (ann_version 증가)
+
+증분 모드 (merge_delta)
+- 신규 공고만 채점해 기존 Top-K와 힙 병합 (ann_version 유지)
+- 마감된 공고는 모든 항목에서 제거
+- Top-K에 새 공고가 들어온 회사만 반환 → LLM 재정렬/알림 대상
+
+저장소 하나를 여러 스레드(Streamlit 세션 등)가 공유할 수 있으므로 조회/변경은 내부 잠금으로 직렬화합니다.
+"""
+
+import functools
+import hashlib
+import heapq
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TOPK_FILE = Path('topk_cache.json')
+
+# scorer(profile, weights, ann_ids) → (공고 id, 점수, 라벨, 정렬 보조키) 반복자
+# ann_ids가 None이면 전체 공고를 채점
+Scorer = Callable[[Dict[str, Any], Dict[str, Any], Optional[List[str]]], Iterable[Tuple[str, float, str, Any]]]
+
+
+def fingerprint(obj: Any) -> str:
+    """JSON 직렬화 기준 해시 (프로필/가중치/공고 행 비교용)."""
+    payload = json.dumps(obj, ensure_ascii=False, sort_keys=True,
+                         default=lambda v: v.item() if hasattr(v, 'item') else str(v))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _plain(value: Any) -> Any:
+    """numpy 스칼라를 JSON으로 저장 가능한 파이썬 값으로 바꿉니다."""
+    return value.item() if hasattr(value, 'item') else value
+
+
+def select_top(candidates: Iterable[Tuple[str, float, str, Any]], k: int) -> List[Dict[str, Any]]:
+    """점수 내림차순, 보조키 오름차순으로 상위 k개를 고릅니다."""
+    ranked = heapq.nsmallest(k, enumerate(candidates), key=lambda t: (-t[1][1], t[1][3], t[0]))
+    return [{'id': _plain(ann_id), 'score': _plain(score), 'label': _plain(label), 'sort_key': _plain(sort_key)}
+            for _, (ann_id, score, label, sort_key) in ranked]
+
+
+def _rank_key(item: Dict[str, Any]) -> Tuple[float, Any]:
+    return (-item['score'], item['sort_key'])
+
+
+def _locked(method):
+    """저장소 잠금을 잡고 실행 (공개 메서드끼리 서로 호출하므로 재진입 잠금 사용)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class TopKStore:
+    """(회사, 가중치 프로필)별 Top-K 물리화 테이블"""
+
+    def __init__(self, path: Optional[Path] = TOPK_FILE, k: int = 10, max_entries: int = 5000):
+        self.path = Path(path) if path else None
+        self.k = k
+        self.max_entries = max_entries
+        self.ann_version = 0
+        self.ann_fingerprints: Dict[str, str] = {}
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.RLock()
+        self._load()
+
+    # ------------------------------------------------------------------ 저장
+    def _load(self):
+        if not self.path or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except Exception as e:
+            logger.warning(f"Top-K 캐시 읽기 실패: {e}")
+            return
+        if data.get('k') != self.k:
+            return
+        self.ann_version = data.get('ann_version', 0)
+        self.ann_fingerprints = data.get('ann_fingerprints', {})
+        self.entries = data.get('entries', {})
+
+    @_locked
+    def save(self):
+        """변경 사항이 있으면 파일에 저장합니다 (path가 없으면 메모리에만 유지)."""
+        if not self.path or not self._dirty:
+            return
+        data = {'k': self.k, 'ann_version': self.ann_version,
+                'ann_fingerprints': self.ann_fingerprints, 'entries': self.entries}
+        tmp_path = self.path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, default=str), encoding='utf-8')
+        tmp_path.replace(self.path)
+        self._dirty = False
+
+    # ------------------------------------------------------------------ 키
+    @staticmethod
+    def entry_key(company_key: str, weights: Dict[str, Any]) -> str:
+        return f"{company_key}::{fingerprint(weights)}"
+
+    def _is_fresh(self, entry: Optional[Dict[str, Any]], profile: Dict[str, Any]) -> bool:
+        return (entry is not None
+                and entry['profile_hash'] == fingerprint(profile)
+                and entry['ann_version'] == self.ann_version)
+
+    # ------------------------------------------------------------------ 무효화
+    @_locked
+    def sync_announcements(self, ann_fingerprints: Dict[str, str]) -> Dict[str, List[str]]:
+        """
+        현재 공고 집합의 (id → 행 해시)를 반영하고 바뀐 부분만 무효화합니다.
+
+        Returns:
+            {'added': [...], 'changed': [...], 'removed': [...]}
+        """
+        old = self.ann_fingerprints
+        added = [i for i in ann_fingerprints if i not in old]
+        changed = [i for i, h in ann_fingerprints.items() if i in old and old[i] != h]
+        removed = [i for i in old if i not in ann_fingerprints]
+
+        if added or changed:
+            # 새/변경 공고는 어느 회사의 Top-K에도 들어갈 수 있음
+            self.ann_version += 1
+        elif removed:
+            gone = set(removed)
+            for key in [k for k, e in self.entries.items() if any(t['id'] in gone for t in e['top'])]:
+                del self.entries[key]
+
+        if added or changed or removed:
+            self.ann_fingerprints = dict(ann_fingerprints)
+            self._dirty = True
+            logger.info(f"Top-K 공고 동기화: 추가 {len(added)}, 변경 {len(changed)}, 삭제 {len(removed)}")
+        return {'added': added, 'changed': changed, 'removed': removed}
+
+    @_locked
+    def evict(self, ann_ids: Iterable[str]) -> int:
+        """
+        마감 등으로 사라진 공고를 모든 항목의 Top-K에서 제거합니다 (재계산 없음).
+        빈 자리는 다음 신규 공고 병합이나 전체 재계산 때 채워집니다. 영향받은 항목 수를 반환.
+        """
+        gone = {i for i in ann_ids if i in self.ann_fingerprints}
+        if not gone:
+            return 0
+        for i in gone:
+            del self.ann_fingerprints[i]
+        touched = 0
+        for entry in self.entries.values():
+            kept = [t for t in entry['top'] if t['id'] not in gone]
+            if len(kept) != len(entry['top']):
+                entry['top'] = kept
+                touched += 1
+        self._dirty = True
+        logger.info(f"Top-K 만료 공고 제거: {len(gone)}건, 영향 항목 {touched}개")
+        return touched
+
+    @_locked
+    def invalidate_company(self, company_key: str):
+        """회사 프로필 삭제/이름 변경 시 해당 회사 항목을 모두 제거합니다."""
+        for key in [k for k in self.entries if k.startswith(f"{company_key}::")]:
+            del self.entries[key]
+            self._dirty = True
+
+    # ------------------------------------------------------------------ 계산/조회
+    def _compute(self, company_key: str, profile: Dict[str, Any], weights: Dict[str, Any],
+                 scorer: Scorer) -> List[Dict[str, Any]]:
+        top = select_top(scorer(profile, weights, None), self.k)
+        self.entries[self.entry_key(company_key, weights)] = {
+            'company': company_key,
+            'profile_hash': fingerprint(profile),
+            'ann_version': self.ann_version,
+            'computed_at': time.time(),
+            'top': top,
+        }
+        if len(self.entries) > self.max_entries:
+            # 오래 전에 계산된 (가중치 조합) 항목부터 제거
+            oldest = sorted(self.entries, key=lambda k: self.entries[k]['computed_at'])
+            for key in oldest[:len(self.entries) - self.max_entries]:
+                del self.entries[key]
+        self._dirty = True
+        return top
+
+    @_locked
+    def materialize(self, companies: Dict[str, Dict[str, Any]], weights: Dict[str, Any],
+                    scorer: Scorer) -> int:
+        """모든 회사의 Top-K 중 오래된 항목만 일괄 계산합니다. 다시 계산한 회사 수를 반환."""
+        recomputed = 0
+        for company_key, profile in companies.items():
+            entry = self.entries.get(self.entry_key(company_key, weights))
+            if not self._is_fresh(entry, profile):
+                self._compute(company_key, profile, weights, scorer)
+                recomputed += 1
+        if recomputed:
+            logger.info(f"Top-K 일괄 계산: {recomputed}/{len(companies)}개 회사")
+        self.save()
+        return recomputed
+
+    @_locked
+    def merge_delta(self, companies: Dict[str, Dict[str, Any]], weights: Dict[str, Any], scorer: Scorer,
+                    delta: Dict[str, str], expired: Iterable[str] = ()) -> Dict[str, List[str]]:
+        """
+        신규/변경 공고(delta)만 채점해 각 회사의 Top-K에 병합합니다.
+
+        Args:
+            companies: {회사 키: 프로필}
+            delta: 이번에 들어온 공고의 (id → 행 해시). 해시가 같은 공고는 건너뜀
+            expired: 마감되어 제거할 공고 id
+
+        Returns:
+            {회사 키: Top-K에 새로 들어온 공고 id 목록} — 변화가 있는 회사만
+        """
+        self.evict(expired)
+        new_ids = [i for i, h in delta.items() if self.ann_fingerprints.get(i) != h]
+        if new_ids:
+            self.ann_fingerprints.update({i: delta[i] for i in new_ids})
+            self._dirty = True
+        changed = set(new_ids)
+
+        gained: Dict[str, List[str]] = {}
+        for company_key, profile in companies.items():
+            entry = self.entries.get(self.entry_key(company_key, weights))
+            if not self._is_fresh(entry, profile):
+                # 신규 회사/프로필 변경 → 전체 공고로 계산
+                top = self._compute(company_key, profile, weights, scorer)
+                if top:
+                    gained[company_key] = [t['id'] for t in top]
+                continue
+            if not new_ids:
+                continue
+            # 변경된 공고는 기존 순위에서 빼고 새 점수로 다시 병합
+            old = [t for t in entry['top'] if t['id'] not in changed]
+            fresh = select_top(scorer(profile, weights, new_ids), self.k)
+            merged = list(heapq.merge(old, fresh, key=_rank_key))[:self.k]
+            before = {t['id'] for t in entry['top']}
+            added = [t['id'] for t in merged if t['id'] not in before]
+            if merged != entry['top']:
+                entry['top'] = merged
+                entry['computed_at'] = time.time()
+                self._dirty = True
+            if added:
+                gained[company_key] = added
+
+        logger.info(f"Top-K 증분 병합: 신규 공고 {len(new_ids)}건, Top-K 변동 {len(gained)}/{len(companies)}개 회사")
+        self.save()
+        return gained
+
+    @_locked
+    def get(self, company_key: str, profile: Dict[str, Any], weights: Dict[str, Any],
+            scorer: Optional[Scorer] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        저장된 Top-K를 반환합니다. 항목이 없거나 오래되었으면 scorer로 해당 회사만 계산하고,
+        scorer가 없으면 None을 반환합니다.
+        """
+        entry = self.entries.get(self.entry_key(company_key, weights))
+        if self._is_fresh(entry, profile):
+            return entry['top']
+        if scorer is None:
+            return None
+        top = self._compute(company_key, profile, weights, scorer)
+        self.save()
+        return top